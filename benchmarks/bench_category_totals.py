@@ -0,0 +1,46 @@
+import random
+import time
+
+from src.utils.categorization import CategoryCalculator
+
+CATEGORIES = 10_000
+TASKS = 1_000_000
+
+
+def main() -> None:
+    rng = random.Random(0)
+    tasks_per_category = TASKS // CATEGORIES
+    response = {
+        "categories": [
+            {
+                "name": f"カテゴリ{category_index}",
+                "tasks": [
+                    {"name": f"タスク{category_index}-{task_index}", "duration": rng.uniform(60.0, 7200.0)}
+                    for task_index in range(tasks_per_category)
+                ],
+            }
+            for category_index in range(CATEGORIES)
+        ]
+    }
+    task_durations = {
+        task["name"]: task["duration"] for category in response["categories"] for task in category["tasks"]
+    }
+    task_categories = {
+        task["name"]: category["name"] for category in response["categories"] for task in category["tasks"]
+    }
+    calculator = CategoryCalculator()
+
+    started = time.perf_counter()
+    result = calculator.calculate_category_totals(response)
+    elapsed = time.perf_counter() - started
+    print(f"calculate_category_totals: {elapsed * 1000:.0f} ms ({TASKS / elapsed:,.0f} tasks/s)")
+    assert result["categories"][0]["tasks"] is response["categories"][0]["tasks"]
+
+    started = time.perf_counter()
+    calculator.build_category_totals(task_durations, task_categories)
+    elapsed = time.perf_counter() - started
+    print(f"build_category_totals:     {elapsed * 1000:.0f} ms ({TASKS / elapsed:,.0f} tasks/s)")
+
+
+if __name__ == "__main__":
+    main()
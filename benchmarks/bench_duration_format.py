@@ -0,0 +1,36 @@
+import random
+import time
+
+from src.utils.duration_format import format_hms
+
+CALLS = 500_000
+
+
+def _format_with_float_divmod(duration: float) -> str:
+    hours = int(duration // 3600)
+    minutes = int((duration % 3600) // 60)
+    seconds = int(duration % 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def main() -> None:
+    rng = random.Random(0)
+    # A tick re-renders mostly the same few hundred rows, so durations repeat heavily.
+    durations = [rng.randrange(0, 300) * 60 + rng.random() for _ in range(CALLS)]
+
+    started = time.perf_counter()
+    for duration in durations:
+        _format_with_float_divmod(duration)
+    baseline = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for duration in durations:
+        format_hms(duration)
+    elapsed = time.perf_counter() - started
+
+    print(f"float divmod: {baseline / CALLS * 1e9:.0f} ns per call")
+    print(f"format_hms:   {elapsed / CALLS * 1e9:.0f} ns per call")
+
+
+if __name__ == "__main__":
+    main()
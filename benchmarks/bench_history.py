@@ -0,0 +1,54 @@
+import time
+from datetime import date, datetime, timedelta
+
+from src.history import SessionHistory
+from src.session_store import _INSERT_SESSION, SessionStore
+
+DAYS = 3 * 365
+SESSIONS_PER_DAY = 40
+
+
+def main() -> None:
+    store = SessionStore()
+    first_day = datetime(2022, 1, 1, 8)
+    rows = []
+    for day_index in range(DAYS):
+        day_start = (first_day + timedelta(days=day_index)).timestamp()
+        for index in range(SESSIONS_PER_DAY):
+            start = day_start + index * 900
+            rows.append((f"タスク{index % 25}", start, start + 600, 0.0, ""))
+    store.connection.executemany(_INSERT_SESSION, rows)
+    store.connection.commit()
+
+    history = SessionHistory(store, page_size=50)
+    year_old_day = date(2023, 6, 15)
+
+    started = time.perf_counter()
+    day = history.day(year_old_day)
+    len(day)
+    day.total_time
+    for index in range(15):
+        day.session(index)
+    elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    cached = history.day(year_old_day)
+    cached.session(14)
+    cached_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    month = history.month(2023, 6)
+    len(month)
+    month.total_time
+    month.session(0)
+    month_elapsed = time.perf_counter() - started
+
+    print(f"{len(rows):,} stored sessions")
+    print(f"open a year-old day:   {elapsed * 1000:.2f} ms")
+    print(f"reopen it from cache:  {cached_elapsed * 1000:.3f} ms")
+    print(f"open a month:          {month_elapsed * 1000:.2f} ms")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
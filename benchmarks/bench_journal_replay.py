@@ -0,0 +1,66 @@
+import tempfile
+import time
+from pathlib import Path
+
+from src.journal import SessionJournal
+from src.session_manager import SessionManager
+from src.session_store import _INSERT_SESSION, SessionStore
+
+SESSIONS = 100_000
+
+
+def write_journal(path: Path) -> int:
+    base = time.time() - SESSIONS * 300
+    records = 0
+    with open(path, "w", encoding="utf-8") as journal_file:
+        for i in range(SESSIONS):
+            start = base + i * 300
+            journal_file.write(f"S\t{i}\t{start:.6f}\tタスク{i % 200}\n")
+            journal_file.write(f"P\t{i}\t{start + 60:.6f}\n")
+            journal_file.write(f"R\t{i}\t{start + 90:.6f}\n")
+            journal_file.write(f"E\t{i}\t{start + 240:.6f}\n")
+            records += 4
+    return records
+
+
+def fill_store(store: SessionStore, journal_path: Path) -> None:
+    # The store already holds every closed session, as it does after a year of normal use.
+    rows = [
+        (session.task_name, session.start_wall_ns / 1e9, (session.end_wall_ns or 0) / 1e9, session.pause_ns / 1e9, "")
+        for session in SessionJournal(journal_path).replay()
+    ]
+    store.connection.executemany(_INSERT_SESSION, rows)
+    store.connection.commit()
+
+
+def time_restore(journal_path: Path, store_path: Path = None) -> float:
+    started = time.perf_counter()
+    manager = SessionManager(
+        journal=SessionJournal(journal_path), store=SessionStore(store_path) if store_path else None
+    )
+    elapsed = time.perf_counter() - started
+    manager.close()
+    return elapsed
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        journal_path = Path(temp_dir) / "sessions.journal"
+        store_path = Path(temp_dir) / "sessions.db"
+        records = write_journal(journal_path)
+
+        started = time.perf_counter()
+        sessions = SessionJournal(journal_path).replay()
+        replay_elapsed = time.perf_counter() - started
+        print(f"replayed {records} records ({len(sessions)} sessions) in {replay_elapsed * 1000:.1f} ms")
+
+        print(f"manager restore, journal only:       {time_restore(journal_path) * 1000:.1f} ms")
+        store = SessionStore(store_path)
+        fill_store(store, journal_path)
+        store.close()
+        print(f"manager restore, first start:        {time_restore(journal_path, store_path) * 1000:.1f} ms")
+        print(f"manager restore, compacted journal:  {time_restore(journal_path, store_path) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import random
+import time
+
+from src.utils.local_classifier import LocalClassifier, NearestNeighbourClassifier
+
+NAMES = 20_000
+_PREFIXES = ["ユーザー", "注文", "決済", "検索", "通知", "管理画面", "ログイン", "レポート", "顧客", "在庫"]
+_SUFFIXES = [
+    "実装",
+    "設計",
+    "テスト",
+    "定例会議",
+    "仕様書作成",
+    "バグ修正",
+    "レビュー",
+    "打ち合わせ",
+    "調査",
+    "デプロイ",
+]
+
+
+def main() -> None:
+    rng = random.Random(0)
+    names = [f"{rng.choice(_PREFIXES)}{rng.choice(_SUFFIXES)} #{index}" for index in range(NAMES)]
+
+    model = NearestNeighbourClassifier()
+    model.learn(
+        {
+            "週次定例会議": "ミーティング",
+            "顧客打ち合わせ": "ミーティング",
+            "仕様書作成": "ドキュメント作成",
+            "障害調査": "調査",
+            "本番デプロイ": "運用",
+            "コードレビュー": "レビュー",
+        }
+    )
+    classifier = LocalClassifier(model=model)
+
+    started = time.perf_counter()
+    for name in names:
+        classifier.rules.classify(name)
+    rules_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    confident, uncertain = classifier.classify_many(names)
+    elapsed = time.perf_counter() - started
+
+    print(f"rules only:      {NAMES / rules_elapsed:,.0f} names/s")
+    print(f"rules + TF-IDF:  {NAMES / elapsed:,.0f} names/s")
+    print(f"{len(confident)} confident, {len(uncertain)} left for Gemini")
+
+
+if __name__ == "__main__":
+    main()
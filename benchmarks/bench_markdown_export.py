@@ -0,0 +1,47 @@
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Iterator
+
+from src.session import Session
+from src.utils.markdown import MarkdownExporter
+
+SESSIONS = 100_000
+_HOUR_NS = 3600 * 1_000_000_000
+
+
+def generate_sessions() -> Iterator[Session]:
+    start_ns = 1_700_000_000 * 1_000_000_000
+    for index in range(SESSIONS):
+        yield Session.from_record(
+            f"タスク{index % 50}", start_ns + index * _HOUR_NS, start_ns + index * _HOUR_NS + 1800 * 10**9
+        )
+
+
+def main() -> None:
+    exporter = MarkdownExporter()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    text = exporter.export_sessions(list(generate_sessions()))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"export_sessions: {elapsed * 1000:.0f} ms, peak {peak / 1024 / 1024:.1f} MiB, {len(text)} chars")
+    del text
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "sessions.md")
+        tracemalloc.start()
+        started = time.perf_counter()
+        with open(path, "w", encoding="utf-8") as stream:
+            exporter.write_sessions(generate_sessions(), stream)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"write_sessions:  {elapsed * 1000:.0f} ms, peak {peak / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
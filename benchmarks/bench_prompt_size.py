@@ -0,0 +1,42 @@
+import json
+import random
+
+from src.api.prompt import build_categorization_prompt, estimate_tokens
+
+SESSIONS = 400
+UNIQUE_TASKS = 60
+
+
+def build_previous_prompt(tasks_data: list) -> str:
+    return f"""
+以下のタスクリストを作業カテゴリに分類し、カテゴリごとの合計時間を計算してください。
+
+タスクリスト:
+{json.dumps(tasks_data, ensure_ascii=False, indent=2)}
+
+可能なカテゴリ例: 開発, 設計・デザイン, テスト・検証, ミーティング, ドキュメント作成, その他
+
+各カテゴリのtotal_durationは、そのカテゴリに属するタスクのduration合計値を設定してください。
+"""
+
+
+def main() -> None:
+    rng = random.Random(0)
+    task_names = [
+        f"案件{index % 7}の{rng.choice(['実装', '設計', 'レビュー', '定例会議', '調査'])}{index}"
+        for index in range(UNIQUE_TASKS)
+    ]
+    sessions = [(rng.choice(task_names), rng.uniform(60, 7200)) for _ in range(SESSIONS)]
+
+    previous = build_previous_prompt([{"name": name, "duration": duration} for name, duration in sessions])
+    compact = build_categorization_prompt(list(dict.fromkeys(name for name, _ in sessions)))
+
+    for label, prompt in [
+        ("previous (per session, indented JSON)", previous),
+        ("compact (unique names, ids)", compact),
+    ]:
+        print(f"{label:40s} {len(prompt.encode('utf-8')):>8,d} bytes  ~{estimate_tokens(prompt):>7,d} tokens")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import time
+from datetime import datetime, timedelta
+
+from src.session_manager import SessionManager
+from src.session_store import _INSERT_SESSION, SessionStore
+from src.session_table import SessionTable
+from src.utils.markdown import MarkdownExporter
+
+DAYS = 3 * 365
+SESSIONS_PER_DAY = 40
+
+
+def main() -> None:
+    store = SessionStore()
+    first_day = datetime(2022, 1, 1, 8)
+    rows = []
+    for day_index in range(DAYS):
+        day_start = (first_day + timedelta(days=day_index)).timestamp()
+        for index in range(SESSIONS_PER_DAY):
+            start = day_start + index * 900
+            rows.append((f"タスク{index % 25}", start, start + 600, 0.0, ""))
+    store.connection.executemany(_INSERT_SESSION, rows)
+    store.connection.commit()
+    manager = SessionManager(store=store)
+    exporter = MarkdownExporter()
+    categories = {f"タスク{index}": f"カテゴリ{index % 5}" for index in range(25)}
+
+    started = time.perf_counter()
+    rollups = manager.rollups
+    rebuild_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    exporter.export_rollup(rollups, rollups.month(2023, 6), categories)
+    rollup_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    month_sessions = store.get_sessions(datetime(2023, 6, 1), datetime(2023, 7, 1))
+    table = SessionTable()
+    table.extend(month_sessions)
+    exporter.export_table(table)
+    scan_elapsed = time.perf_counter() - started
+
+    print(f"{len(rows):,} stored sessions")
+    print(f"bulk rebuild:                {rebuild_elapsed * 1000:.1f} ms")
+    print(f"month report from rollups:   {rollup_elapsed * 1000:.2f} ms")
+    print(f"month report from sessions:  {scan_elapsed * 1000:.2f} ms")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import time
+import tracemalloc
+from typing import List
+
+from src.session import Session
+
+SESSIONS = 50_000
+CALLS = 200_000
+
+
+def main() -> None:
+    tracemalloc.start()
+    sessions: List[Session] = []
+    for _ in range(SESSIONS):
+        session = Session("タスク")
+        session.start()
+        session.stop()
+        sessions.append(session)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    running = Session("タスク")
+    running.start()
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        running.get_duration()
+    elapsed = time.perf_counter() - started
+
+    print(f"{allocated / SESSIONS:.0f} bytes per completed session")
+    print(f"{elapsed / CALLS * 1e9:.0f} ns per get_duration() on a running session")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import json
+import subprocess
+import sys
+
+RUNS = 5
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import tkinter as tk
+import main
+from src.gui.main_window import MainWindow
+imported = time.perf_counter()
+window_ms = None
+try:
+    root = tk.Tk()
+    MainWindow(root)
+    root.update()
+    window_ms = (time.perf_counter() - started) * 1000
+    root.destroy()
+except tk.TclError:
+    pass
+heavy = [name for name in ("google.generativeai", "pydantic", "dotenv") if name in sys.modules]
+print(json.dumps({"import_ms": (imported - started) * 1000, "window_ms": window_ms, "heavy": heavy}))
+"""
+
+
+def main() -> None:
+    results = [
+        json.loads(subprocess.run([sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True).stdout)
+        for _ in range(RUNS)
+    ]
+    import_ms = sorted(result["import_ms"] for result in results)[RUNS // 2]
+    print(f"import main + MainWindow: {import_ms:.0f} ms (median of {RUNS})")
+
+    window_times = sorted(result["window_ms"] for result in results if result["window_ms"] is not None)
+    if window_times:
+        print(f"time to first window:     {window_times[len(window_times) // 2]:.0f} ms")
+    else:
+        print("time to first window:     skipped (no display)")
+    print(f"Gemini stack loaded at startup: {results[0]['heavy'] or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import heapq
+import random
+import time
+
+from src.task_registry import TaskRegistry
+
+NAMES = 50_000
+QUERIES = 2_000
+_PREFIXES = ["ユーザー", "注文", "決済", "検索", "通知", "管理画面", "ログイン", "レポート", "顧客", "在庫"]
+_SUFFIXES = [
+    "実装",
+    "設計",
+    "テスト",
+    "定例会議",
+    "仕様書作成",
+    "バグ修正",
+    "レビュー",
+    "打ち合わせ",
+    "調査",
+    "デプロイ",
+]
+
+
+def main() -> None:
+    rng = random.Random(0)
+    names = [f"{rng.choice(_PREFIXES)}{rng.choice(_SUFFIXES)} #{index}" for index in range(NAMES)]
+    # Broad queries match roughly a tenth of all names; selective ones look like a user who kept typing.
+    broad_queries = [rng.choice(_PREFIXES)[:2] for _ in range(QUERIES // 2)] + [
+        rng.choice(_SUFFIXES)[:3] for _ in range(QUERIES // 2)
+    ]
+    selective_queries = [rng.choice(names)[:-1] for _ in range(QUERIES)]
+    fuzzy_queries = [
+        rng.choice(_PREFIXES)[0] + rng.choice(_SUFFIXES)[-1] + "#" + str(rng.randrange(100)) for _ in range(QUERIES)
+    ]
+
+    registry = TaskRegistry()
+    started = time.perf_counter()
+    for name in names:
+        registry.intern(name)
+    intern_elapsed = time.perf_counter() - started
+    print(f"intern:  {intern_elapsed / NAMES * 1e6:.1f} us per name")
+
+    now = time.time()
+    for name in names:
+        registry.record_use(registry.intern(name), rng.randrange(1, 20), now - rng.uniform(0, 90 * 24 * 60 * 60))
+
+    for label, queries in (("broad", broad_queries), ("selective", selective_queries)):
+        started = time.perf_counter()
+        for query in queries:
+            registry.complete(query)
+        complete_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for query in queries:
+            heapq.nsmallest(10, (name for name in names if query in name))
+        scan_elapsed = time.perf_counter() - started
+
+        print(
+            f"{label:9} indexed {complete_elapsed / len(queries) * 1000:.3f} ms, "
+            f"scan {scan_elapsed / len(queries) * 1000:.3f} ms per query"
+        )
+
+    for label, queries in (("broad", broad_queries), ("selective", selective_queries), ("fuzzy", fuzzy_queries)):
+        started = time.perf_counter()
+        for query in queries:
+            registry.search(query)
+        search_elapsed = time.perf_counter() - started
+        print(f"search {label:9} {search_elapsed / len(queries) * 1000:.3f} ms per query")
+
+    started = time.perf_counter()
+    for _ in range(100):
+        registry.search("")
+    print(f"search recent    {(time.perf_counter() - started) / 100 * 1000:.3f} ms per query")
+
+
+if __name__ == "__main__":
+    main()
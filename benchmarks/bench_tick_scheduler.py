@@ -0,0 +1,93 @@
+import heapq
+from typing import Callable, List, Optional, Set, Tuple
+
+from src.gui.tick_scheduler import TickScheduler
+
+TRACKED_SECONDS = 3600.0
+CALLBACK_LATENCY = 0.004
+MINIMIZED = (1200.0, 1800.0)
+
+
+class SimulatedRoot:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+        self._queue: List[Tuple[float, int, Callable[[], None]]] = []
+        self._cancelled: Set[int] = set()
+        self._counter: int = 0
+
+    def after(self, delay_ms: int, callback: Callable[[], None]) -> str:
+        self._counter += 1
+        heapq.heappush(self._queue, (self.now + delay_ms / 1000, self._counter, callback))
+        return str(self._counter)
+
+    def after_cancel(self, timer_id: str) -> None:
+        self._cancelled.add(int(timer_id))
+
+    def run_until(self, deadline: float) -> None:
+        while self._queue and self._queue[0][0] <= deadline:
+            due, counter, callback = heapq.heappop(self._queue)
+            if counter in self._cancelled:
+                continue
+            self.now = due
+            callback()
+        self.now = max(self.now, deadline)
+
+
+def run_fixed_interval() -> Tuple[int, int]:
+    root = SimulatedRoot()
+    shown: Set[int] = set()
+    redraws = 0
+
+    def update_display() -> None:
+        nonlocal redraws
+        redraws += 1
+        shown.add(int(root.now))
+        root.now += CALLBACK_LATENCY
+        root.after(1000, update_display)
+
+    root.after(1000, update_display)
+    root.run_until(TRACKED_SECONDS)
+    return redraws, len(expected_seconds(minimized=False) - shown)
+
+
+def expected_seconds(minimized: bool) -> Set[int]:
+    seconds = set(range(1, int(TRACKED_SECONDS)))
+    if minimized:
+        seconds -= set(range(int(MINIMIZED[0]), int(MINIMIZED[1])))
+    return seconds
+
+
+def run_tick_scheduler() -> Tuple[int, int]:
+    root = SimulatedRoot()
+    shown: Set[int] = set()
+    scheduler: Optional[TickScheduler] = None
+
+    def update_display() -> None:
+        shown.add(int(root.now))
+        root.now += CALLBACK_LATENCY
+        assert scheduler is not None
+        scheduler.schedule()
+
+    scheduler = TickScheduler(root, update_display, phase=lambda: root.now)  # type: ignore[arg-type]
+    scheduler.schedule()
+    root.run_until(MINIMIZED[0])
+    scheduler.suspend()
+    root.run_until(MINIMIZED[1])
+    scheduler.resume()
+    root.run_until(TRACKED_SECONDS)
+
+    return scheduler.tick_count, len(expected_seconds(minimized=True) - shown)
+
+
+def main() -> None:
+    fixed_redraws, fixed_missed = run_fixed_interval()
+    tick_redraws, tick_missed = run_tick_scheduler()
+    print(f"fixed 1000 ms interval: {fixed_redraws} redraws/hour, {fixed_missed} displayed seconds skipped")
+    print(
+        f"tick scheduler:         {tick_redraws} redraws/hour, {tick_missed} displayed seconds skipped "
+        f"(window minimized for {int(MINIMIZED[1] - MINIMIZED[0])} s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,38 @@
 import tkinter as tk
+from src.api.category_cache import CategoryCache
+from src.api.gemini import GeminiAPIClient, LazyCategorizer
+from src.api.resilience import ResilientCaller, TokenBucket
 from src.gui.main_window import MainWindow
+from src.journal import SessionJournal
+from src.session_manager import SessionManager
+from src.session_store import SessionStore
+from src.utils.data_dir import get_data_dir
+from src.utils.local_classifier import LocalClassifier, NearestNeighbourClassifier
 
 
 def main():
     root = tk.Tk()
-    app = MainWindow(root)
+    data_dir = get_data_dir()
+    session_manager = SessionManager(
+        journal=SessionJournal(data_dir / "sessions.journal"),
+        store=SessionStore(data_dir / "sessions.db"),
+    )
+
+    def create_gemini_client() -> GeminiAPIClient:
+        category_cache = CategoryCache(data_dir / "categories.json")
+        local_classifier = LocalClassifier(model=NearestNeighbourClassifier())
+        local_classifier.learn(category_cache.categories())
+        return GeminiAPIClient(
+            cache=category_cache,
+            local_classifier=local_classifier,
+            resilience=ResilientCaller(rate_limiter=TokenBucket(rate=1.0, capacity=4)),
+        )
+
+    app = MainWindow(
+        root,
+        session_manager=session_manager,
+        categorize=LazyCategorizer(create_gemini_client),
+    )
     app.start()
 
 
@@ -0,0 +1,115 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from src.utils.task_names import normalize_task_name
+
+_CACHE_VERSION = 1
+
+
+class CategoryCache:
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl: float = 30 * 24 * 3600,
+        max_entries: int = 5000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self.clock: Callable[[], float] = clock
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._dirty: bool = False
+
+        if self.path is not None:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, task_name: str) -> Optional[str]:
+        key = normalize_task_name(task_name)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        category, stored_at = entry
+        if self.clock() - stored_at > self.ttl:
+            del self._entries[key]
+            self._dirty = True
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return category
+
+    def get_many(self, task_names: Iterable[str]) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        for task_name in task_names:
+            category = self.get(task_name)
+            if category is not None:
+                found[task_name] = category
+        return found
+
+    def put(self, task_name: str, category: str) -> None:
+        key = normalize_task_name(task_name)
+        self._entries[key] = (category, self.clock())
+        self._entries.move_to_end(key)
+        self._dirty = True
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def update(self, task_categories: Mapping[str, str]) -> None:
+        for task_name, category in task_categories.items():
+            self.put(task_name, category)
+
+    def categories(self) -> Dict[str, str]:
+        now = self.clock()
+        return {key: category for key, (category, stored_at) in self._entries.items() if now - stored_at <= self.ttl}
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._dirty = True
+
+    def load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return
+
+        now = self.clock()
+        self._entries.clear()
+        for key, category, stored_at in data.get("entries", []):
+            if now - stored_at <= self.ttl:
+                self._entries[key] = (category, stored_at)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = False
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+
+        entries: List[Tuple[str, str, float]] = [
+            (key, category, stored_at) for key, (category, stored_at) in self._entries.items()
+        ]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"version": _CACHE_VERSION, "entries": entries}, file, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+        self._dirty = False
@@ -1,35 +1,112 @@
 import os
 import json
-from typing import List, Dict, Any
-from dotenv import load_dotenv
-import google.generativeai as genai
-from pydantic import BaseModel
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional
+from src.api.category_cache import CategoryCache
+from src.api.json_stream import JsonArrayStreamParser
+from src.api.prompt import build_categorization_prompt, chunk_task_names, parse_category_assignments
+from src.api.reconciliation import Reconciliation
+from src.api.resilience import CircuitOpenError, DeadlineExceededError, ResilientCaller
 from src.session import Session
+from src.utils.categorization import CategoryCalculator
+from src.utils.local_classifier import DEFAULT_CATEGORY, LocalClassifier, RuleClassifier
 
-load_dotenv()
+_SCHEMA_NAMES = {
+    "TaskItem",
+    "CategoryItem",
+    "CategorizationResponse",
+    "CategoryAssignment",
+    "CategoryAssignmentResponse",
+}
 
 
-class TaskItem(BaseModel):
-    name: str
-    duration: float
+def __getattr__(name: str) -> Any:
+    # google.generativeai takes most of a second to import, so it is only loaded once a request is made.
+    if name == "genai":
+        return _import_genai()
+    if name in _SCHEMA_NAMES:
+        from src.api import schemas
 
+        return getattr(schemas, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-class CategoryItem(BaseModel):
-    name: str
-    tasks: List[TaskItem]
-    total_duration: float
 
+def _import_genai() -> Any:
+    module = globals().get("genai")
+    if module is None:
+        import google.generativeai as module
 
-class CategorizationResponse(BaseModel):
-    categories: List[CategoryItem]
+        globals()["genai"] = module
+    return module
+
+
+def categorize_sessions_with_rules(sessions: List[Session], rules: RuleClassifier) -> Dict[str, Any]:
+    if not sessions:
+        return {"categories": []}
+
+    grouped_tasks: Dict[str, List[Dict[str, Any]]] = {name: [] for name in [*rules.categories, DEFAULT_CATEGORY]}
+    for session in sessions:
+        category, _ = rules.classify(session.task_name)
+        grouped_tasks[category or DEFAULT_CATEGORY].append(
+            {"name": session.task_name, "duration": session.get_duration()}
+        )
+
+    return {
+        "categories": [
+            {"name": name, "tasks": tasks, "total_duration": sum(task["duration"] for task in tasks)}
+            for name, tasks in grouped_tasks.items()
+            if tasks
+        ]
+    }
+
+
+def _load_dotenv() -> None:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+TaskCategorizedCallback = Callable[[str, str, float], None]
+
+
+class GeminiAPIError(Exception):
+    pass
 
 
 class GeminiAPIClient:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: Optional[CategoryCache] = None,
+        max_chunk_tokens: int = 2000,
+        max_concurrency: int = 4,
+        local_classifier: Optional[LocalClassifier] = None,
+        resilience: Optional[ResilientCaller] = None,
+        max_requeries: int = 1,
+    ) -> None:
+        self.cache: Optional[CategoryCache] = cache
+        self.local_classifier: Optional[LocalClassifier] = local_classifier
+        self.rule_classifier: RuleClassifier = local_classifier.rules if local_classifier else RuleClassifier()
+        self.resilience: Optional[ResilientCaller] = resilience
+        self.fallback_used: bool = False
+        self.unmatched_tasks: List[str] = []
+        self.max_requeries: int = max_requeries
+        self.max_chunk_tokens: int = max_chunk_tokens
+        self.max_concurrency: int = max_concurrency
+        self.category_calculator: CategoryCalculator = CategoryCalculator()
+        _load_dotenv()
         self.api_key: str = self._load_api_key()
-        self.model_name: str = self._load_model_name()
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(self.model_name)
+        self._model: Any = None
+        self._model_lock: threading.Lock = threading.Lock()
+
+    @property
+    def model(self) -> Any:
+        with self._model_lock:
+            if self._model is None:
+                sdk = _import_genai()
+                sdk.configure(api_key=self.api_key)
+                self._model = sdk.GenerativeModel(self._load_model_name())
+            return self._model
 
     def _load_api_key(self) -> str:
         api_key = os.getenv("GEMINI_API_KEY")
@@ -42,107 +119,152 @@ class GeminiAPIClient:
         return model_name
 
     def categorize_tasks_stub(self, sessions: List[Session]) -> Dict[str, Any]:
+        return categorize_sessions_with_rules(sessions, self.rule_classifier)
+
+    def categorize_tasks(
+        self, sessions: List[Session], on_task_categorized: Optional[TaskCategorizedCallback] = None
+    ) -> Dict[str, Any]:
         if not sessions:
             return {"categories": []}
 
-        categories: List[Dict[str, Any]] = []
+        task_durations: Dict[str, float] = {}
+        for session in sessions:
+            task_durations[session.task_name] = task_durations.get(session.task_name, 0.0) + session.get_duration()
 
-        development_tasks: List[Dict[str, Any]] = []
-        design_tasks: List[Dict[str, Any]] = []
-        testing_tasks: List[Dict[str, Any]] = []
-        other_tasks: List[Dict[str, Any]] = []
+        on_assignment = self._assignment_callback(on_task_categorized, task_durations)
 
-        for session in sessions:
-            task_data = {"name": session.task_name, "duration": session.get_duration()}
-
-            task_name_lower = session.task_name.lower()
-            if any(
-                keyword in task_name_lower
-                for keyword in [
-                    "実装",
-                    "コード",
-                    "プログラミング",
-                    "開発",
-                    "バグ修正",
-                    "フロントエンド",
-                    "バックエンド",
-                ]
-            ):
-                development_tasks.append(task_data)
-            elif any(keyword in task_name_lower for keyword in ["設計", "デザイン", "UI", "UX", "画面", "レイアウト"]):
-                design_tasks.append(task_data)
-            elif any(keyword in task_name_lower for keyword in ["テスト", "検証", "確認", "デバッグ"]):
-                testing_tasks.append(task_data)
+        task_categories = self.cache.get_many(task_durations) if self.cache else {}
+        unseen_names = [name for name in task_durations if name not in task_categories]
+        if unseen_names and self.local_classifier:
+            local_categories, unseen_names = self.local_classifier.classify_many(unseen_names)
+            task_categories.update(local_categories)
+        if on_assignment:
+            for task_name, category in task_categories.items():
+                on_assignment(task_name, category)
+
+        self.fallback_used = False
+        self.unmatched_tasks = []
+        if unseen_names:
+            try:
+                fresh_categories = self._request_categories_chunked(unseen_names, on_assignment)
+            except GeminiAPIError:
+                if self.resilience is None:
+                    raise
+                self.fallback_used = True
+                task_categories.update(self._fallback_categories(unseen_names))
+                return self.category_calculator.build_category_totals(task_durations, task_categories)
+
+            task_categories.update(fresh_categories)
+            # Names the model still skipped after re-querying get the local rules instead of Gemini's answer.
+            self.unmatched_tasks = [name for name in unseen_names if name not in fresh_categories]
+            task_categories.update(self._fallback_categories(self.unmatched_tasks))
+            if self.local_classifier:
+                self.local_classifier.learn(fresh_categories)
+            if self.cache:
+                self.cache.update(fresh_categories)
+                self.cache.save()
+
+        return self.category_calculator.build_category_totals(task_durations, task_categories)
+
+    def _assignment_callback(
+        self, on_task_categorized: Optional[TaskCategorizedCallback], task_durations: Dict[str, float]
+    ) -> Optional[Callable[[str, str], None]]:
+        if on_task_categorized is None:
+            return None
+        callback = on_task_categorized
+        return lambda task_name, category: callback(task_name, category, task_durations[task_name])
+
+    def _request_categories_chunked(
+        self, task_names: List[str], on_assignment: Optional[Callable[[str, str], None]] = None
+    ) -> Dict[str, str]:
+        task_categories: Dict[str, str] = {}
+        pending = task_names
+        for _ in range(1 + self.max_requeries):
+            chunks = chunk_task_names(pending, self.max_chunk_tokens)
+            if len(chunks) == 1:
+                chunk_results = [self._request_categories(chunks[0], on_assignment)]
             else:
-                other_tasks.append(task_data)
-
-        if development_tasks:
-            categories.append(
-                {
-                    "name": "開発",
-                    "tasks": development_tasks,
-                    "total_duration": sum(task["duration"] for task in development_tasks),
-                }
-            )
-
-        if design_tasks:
-            categories.append(
-                {
-                    "name": "設計・デザイン",
-                    "tasks": design_tasks,
-                    "total_duration": sum(task["duration"] for task in design_tasks),
-                }
-            )
-
-        if testing_tasks:
-            categories.append(
-                {
-                    "name": "テスト・検証",
-                    "tasks": testing_tasks,
-                    "total_duration": sum(task["duration"] for task in testing_tasks),
-                }
-            )
-
-        if other_tasks:
-            categories.append(
-                {
-                    "name": "その他",
-                    "tasks": other_tasks,
-                    "total_duration": sum(task["duration"] for task in other_tasks),
-                }
-            )
-
-        return {"categories": categories}
-
-    def categorize_tasks(self, sessions: List[Session]) -> Dict[str, Any]:
-        if not sessions:
-            return {"categories": []}
+                with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as executor:
+                    chunk_results = list(
+                        executor.map(lambda chunk: self._request_categories(chunk, on_assignment), chunks)
+                    )
 
-        tasks_data = []
-        for session in sessions:
-            tasks_data.append({"name": session.task_name, "duration": session.get_duration()})
+            for chunk_result in chunk_results:
+                task_categories.update(chunk_result)
+            # Only the names the model dropped or answered with unknown ids are sent again.
+            pending = [task_name for task_name in pending if task_name not in task_categories]
+            if not pending:
+                break
+        return task_categories
+
+    def _fallback_categories(self, task_names: List[str]) -> Dict[str, str]:
+        task_categories: Dict[str, str] = {}
+        for task_name in task_names:
+            category, _ = self.rule_classifier.classify(task_name)
+            if category:
+                task_categories[task_name] = category
+        return task_categories
 
-        prompt = f"""
-以下のタスクリストを作業カテゴリに分類し、カテゴリごとの合計時間を計算してください。
+    def _request_categories(
+        self, task_names: List[str], on_assignment: Optional[Callable[[str, str], None]] = None
+    ) -> Dict[str, str]:
+        from src.api.schemas import CategoryAssignmentResponse
 
-タスクリスト:
-{json.dumps(tasks_data, ensure_ascii=False, indent=2)}
+        prompt = build_categorization_prompt(task_names)
+        generation_config = _import_genai().GenerationConfig(
+            response_mime_type="application/json", response_schema=CategoryAssignmentResponse
+        )
 
-可能なカテゴリ例: 開発, 設計・デザイン, テスト・検証, ミーティング, ドキュメント作成, その他
+        def request(timeout: Optional[float] = None) -> Dict[str, str]:
+            options: Dict[str, Any] = {"request_options": {"timeout": timeout}} if timeout is not None else {}
+            if on_assignment is None:
+                response = self.model.generate_content(prompt, generation_config=generation_config, **options)
+                return parse_category_assignments(json.loads(response.text), task_names)
 
-各カテゴリのtotal_durationは、そのカテゴリに属するタスクのduration合計値を設定してください。
-"""
+            parser = JsonArrayStreamParser("assignments")
+            reconciliation = Reconciliation(task_names)
+            for chunk in self.model.generate_content(
+                prompt, generation_config=generation_config, stream=True, **options
+            ):
+                for assignment in parser.feed(chunk.text):
+                    task_name = reconciliation.add_assignment(assignment)
+                    if task_name is not None:
+                        on_assignment(task_name, reconciliation.task_categories[task_name])
+            if not parser.finished:
+                raise ValueError("Streamed response ended before the assignments array was closed")
+            return reconciliation.task_categories
 
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.GenerationConfig(
-                    response_mime_type="application/json", response_schema=CategorizationResponse
-                ),
-            )
-            result = json.loads(response.text)
-            return result
+            return self.resilience.call(request) if self.resilience else request()
         except json.JSONDecodeError as e:
-            raise Exception(f"Invalid JSON response from Gemini API: {e}")
+            raise GeminiAPIError(f"Invalid JSON response from Gemini API: {e}")
+        except (KeyError, TypeError, ValueError) as e:
+            raise GeminiAPIError(f"Invalid response structure from Gemini API: {e}")
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            raise GeminiAPIError(f"Gemini API unavailable: {e}")
         except Exception as e:
-            raise Exception(f"Gemini API error: {e}")
+            raise GeminiAPIError(f"Gemini API error: {e}")
+
+
+class LazyCategorizer:
+    def __init__(self, client_factory: Callable[[], GeminiAPIClient], rules: Optional[RuleClassifier] = None) -> None:
+        self.client_factory: Callable[[], GeminiAPIClient] = client_factory
+        self.rules: RuleClassifier = rules or RuleClassifier()
+        self.client: Optional[GeminiAPIClient] = None
+        self.is_configured: Optional[bool] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def __call__(
+        self, sessions: List[Session], on_task_categorized: Optional[TaskCategorizedCallback] = None
+    ) -> Dict[str, Any]:
+        with self._lock:
+            if self.is_configured is None:
+                try:
+                    self.client = self.client_factory()
+                    self.is_configured = True
+                except ValueError:
+                    self.is_configured = False
+
+        if self.client is None:
+            return categorize_sessions_with_rules(sessions, self.rules)
+        return self.client.categorize_tasks(sessions, on_task_categorized)
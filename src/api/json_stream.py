@@ -0,0 +1,63 @@
+import json
+import re
+from typing import Any, List, Optional, Pattern
+
+
+class JsonArrayStreamParser:
+    def __init__(self, key: str) -> None:
+        self._key_pattern: Pattern[str] = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+        self._buffer: str = ""
+        self._position: int = 0
+        self._element_start: Optional[int] = None
+        self._depth: int = 0
+        self._in_string: bool = False
+        self._escaped: bool = False
+        self._array_found: bool = False
+        self.finished: bool = False
+
+    def feed(self, text: str) -> List[Any]:
+        self._buffer += text
+        elements: List[Any] = []
+
+        if not self._array_found:
+            match = self._key_pattern.search(self._buffer)
+            if match is None:
+                return elements
+            self._array_found = True
+            self._buffer = self._buffer[match.end() :]
+
+        buffer = self._buffer
+        position = self._position
+        length = len(buffer)
+        while position < length and not self.finished:
+            character = buffer[position]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif character == "\\":
+                    self._escaped = True
+                elif character == '"':
+                    self._in_string = False
+            elif character == '"':
+                self._in_string = True
+            elif character == "{" or character == "[":
+                if self._depth == 0:
+                    self._element_start = position
+                self._depth += 1
+            elif character == "}" or character == "]":
+                if self._depth == 0:
+                    self.finished = True
+                else:
+                    self._depth -= 1
+                    if self._depth == 0 and self._element_start is not None:
+                        elements.append(json.loads(buffer[self._element_start : position + 1]))
+                        self._element_start = None
+            position += 1
+
+        # Only the element still being received has to be kept around.
+        keep_from = self._element_start if self._element_start is not None else position
+        self._buffer = buffer[keep_from:]
+        self._position = position - keep_from
+        if self._element_start is not None:
+            self._element_start = 0
+        return elements
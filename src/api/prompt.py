@@ -0,0 +1,51 @@
+from typing import Any, Dict, List, Sequence
+
+from src.api.reconciliation import reconcile_assignments
+
+CATEGORY_EXAMPLES = ["開発", "設計・デザイン", "テスト・検証", "ミーティング", "ドキュメント作成", "その他"]
+
+_PROMPT_HEADER = "次の作業タスクをカテゴリに分類してください。各行は「ID<TAB>タスク名」です。\n\n"
+_PROMPT_FOOTER = (
+    "\n\nカテゴリ例: {categories}\n"
+    'すべてのIDについて {{"id": ID, "category": カテゴリ名}} を assignments 配列で返してください。\n'
+)
+
+
+def _escape_task_name(task_name: str) -> str:
+    return task_name.replace("\t", " ").replace("\r", " ").replace("\n", " ")
+
+
+def format_task_line(task_id: int, task_name: str) -> str:
+    return f"{task_id}\t{_escape_task_name(task_name)}"
+
+
+def estimate_tokens(text: str) -> int:
+    # Without a tokenizer at hand: ~4 ASCII characters per token, and one token per CJK character.
+    ascii_count = sum(1 for character in text if character < "\x80")
+    return (ascii_count + 3) // 4 + len(text) - ascii_count
+
+
+def build_categorization_prompt(task_names: Sequence[str]) -> str:
+    task_lines = "\n".join(format_task_line(task_id, task_name) for task_id, task_name in enumerate(task_names, 1))
+    return _PROMPT_HEADER + task_lines + _PROMPT_FOOTER.format(categories=", ".join(CATEGORY_EXAMPLES))
+
+
+def parse_category_assignments(result: Dict[str, Any], task_names: Sequence[str]) -> Dict[str, str]:
+    return reconcile_assignments(result["assignments"], task_names).task_categories
+
+
+def chunk_task_names(task_names: Sequence[str], max_chunk_tokens: int) -> List[List[str]]:
+    chunks: List[List[str]] = []
+    chunk: List[str] = []
+    chunk_tokens = 0
+    for task_name in task_names:
+        task_tokens = estimate_tokens(format_task_line(len(chunk) + 1, task_name)) + 1
+        if chunk and chunk_tokens + task_tokens > max_chunk_tokens:
+            chunks.append(chunk)
+            chunk = []
+            chunk_tokens = 0
+        chunk.append(task_name)
+        chunk_tokens += task_tokens
+    if chunk:
+        chunks.append(chunk)
+    return chunks
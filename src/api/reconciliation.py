@@ -0,0 +1,56 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+
+class Reconciliation:
+    def __init__(self, task_names: Sequence[str]) -> None:
+        self.task_names: Sequence[str] = task_names
+        self.task_categories: Dict[str, str] = {}
+        self.duplicated: Dict[str, List[str]] = {}
+        self.hallucinated: List[Any] = []
+
+    def add(self, task_name: Optional[str], category: Any, returned: Any = None) -> bool:
+        if task_name is None:
+            self.hallucinated.append(returned)
+            return False
+        if not isinstance(category, str) or not category:
+            return False
+
+        existing = self.task_categories.get(task_name)
+        if existing is not None:
+            # The first answer wins; later ones are only recorded so conflicting duplicates can be inspected.
+            self.duplicated.setdefault(task_name, [existing]).append(category)
+            return False
+        self.task_categories[task_name] = category
+        return True
+
+    def task_name_for_id(self, task_id: Any) -> Optional[str]:
+        try:
+            index = int(task_id)
+        except (TypeError, ValueError):
+            return None
+        if 1 <= index <= len(self.task_names):
+            return self.task_names[index - 1]
+        return None
+
+    def add_assignment(self, assignment: Mapping[str, Any]) -> Optional[str]:
+        task_id = assignment["id"]
+        task_name = self.task_name_for_id(task_id)
+        return task_name if self.add(task_name, assignment["category"], task_id) else None
+
+    @property
+    def missing(self) -> List[str]:
+        return [task_name for task_name in self.task_names if task_name not in self.task_categories]
+
+    @property
+    def is_complete(self) -> bool:
+        return len(self.task_categories) == len(self.task_names)
+
+
+def reconcile_assignments(
+    assignments: Iterable[Mapping[str, Any]], task_names: Sequence[str], reconciliation: Optional[Reconciliation] = None
+) -> Reconciliation:
+    if reconciliation is None:
+        reconciliation = Reconciliation(task_names)
+    for assignment in assignments:
+        reconciliation.add_assignment(assignment)
+    return reconciliation
@@ -0,0 +1,222 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class DeadlineExceededError(Exception):
+    pass
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+        random_source: Callable[[], float] = random.random,
+    ) -> None:
+        self.max_attempts: int = max_attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.retry_on: Tuple[Type[BaseException], ...] = retry_on
+        self.random_source: Callable[[], float] = random_source
+
+    def delay(self, attempt: int) -> float:
+        # Full jitter: concurrent chunk requests that fail together do not retry in lockstep.
+        return self.random_source() * min(self.max_delay, self.base_delay * (2**attempt))
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        return attempt + 1 < self.max_attempts and isinstance(error, self.retry_on)
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.clock: Callable[[], float] = clock
+        self.sleep: Callable[[float], None] = sleep
+        self._tokens: float = capacity
+        self._updated_at: float = clock()
+        self._lock: threading.Lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self, timeout: float) -> bool:
+        deadline = self.clock() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if self.clock() + wait > deadline:
+                return False
+            self.sleep(wait)
+
+
+class CircuitBreaker:
+    def __init__(
+        self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.clock: Callable[[], float] = clock
+        self._state: str = CLOSED
+        self._failures: int = 0
+        self._opened_at: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        return self.state != OPEN
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = self.clock()
+
+
+class CallMetrics:
+    def __init__(self, window: int = 100) -> None:
+        self.calls: int = 0
+        self.successes: int = 0
+        self.failures: int = 0
+        self.retries: int = 0
+        self.rejected: int = 0
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, **counts: int) -> None:
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+    def record_latency(self, latency: float) -> None:
+        with self._lock:
+            self.latencies.append(latency)
+
+    @property
+    def failure_rate(self) -> float:
+        attempts = self.successes + self.failures
+        return self.failures / attempts if attempts else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percentile / 100))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = list(self.latencies)
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "retries": self.retries,
+            "rejected": self.rejected,
+            "failure_rate": self.failure_rate,
+            "latency_avg": sum(latencies) / len(latencies) if latencies else 0.0,
+            "latency_p95": self.latency_percentile(95),
+        }
+
+
+class ResilientCaller:
+    def __init__(
+        self,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        deadline: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.rate_limiter: Optional[TokenBucket] = rate_limiter
+        self.circuit_breaker: CircuitBreaker = circuit_breaker or CircuitBreaker(clock=clock)
+        self.deadline: float = deadline
+        self.clock: Callable[[], float] = clock
+        self.sleep: Callable[[float], None] = sleep
+        self.metrics: CallMetrics = CallMetrics()
+
+    def call(self, function: Callable[[float], T]) -> T:
+        self.metrics.record(calls=1)
+        deadline_at = self.clock() + self.deadline
+        attempt = 0
+        while True:
+            if not self.circuit_breaker.allow():
+                self.metrics.record(rejected=1)
+                raise CircuitOpenError("Circuit breaker is open")
+
+            remaining = deadline_at - self.clock()
+            if self.rate_limiter and not self.rate_limiter.acquire(max(0.0, remaining)):
+                raise DeadlineExceededError("Deadline exceeded while waiting for the rate limiter")
+            remaining = deadline_at - self.clock()
+            if remaining <= 0:
+                raise DeadlineExceededError("Deadline exceeded")
+
+            started_at = self.clock()
+            try:
+                result = function(remaining)
+            except Exception as error:
+                self.metrics.record_latency(self.clock() - started_at)
+                self.metrics.record(failures=1)
+                self.circuit_breaker.record_failure()
+                if not self.retry_policy.should_retry(error, attempt):
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                if self.clock() + delay >= deadline_at:
+                    raise
+                self.metrics.record(retries=1)
+                self.sleep(delay)
+                attempt += 1
+                continue
+
+            self.metrics.record_latency(self.clock() - started_at)
+            self.metrics.record(successes=1)
+            self.circuit_breaker.record_success()
+            return result
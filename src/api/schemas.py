@@ -0,0 +1,27 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class TaskItem(BaseModel):
+    name: str
+    duration: float
+
+
+class CategoryItem(BaseModel):
+    name: str
+    tasks: List[TaskItem]
+    total_duration: float
+
+
+class CategorizationResponse(BaseModel):
+    categories: List[CategoryItem]
+
+
+class CategoryAssignment(BaseModel):
+    id: int
+    category: str
+
+
+class CategoryAssignmentResponse(BaseModel):
+    assignments: List[CategoryAssignment]
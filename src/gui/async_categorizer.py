@@ -0,0 +1,128 @@
+import queue
+import tkinter as tk
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.session import Session
+
+CategorizeFunction = Callable[..., Dict[str, Any]]
+PartialCallback = Callable[[str, str, float], None]
+
+
+class AsyncCategorizer:
+    def __init__(
+        self,
+        root: tk.Tk,
+        categorize: CategorizeFunction,
+        executor: Optional[Executor] = None,
+        poll_interval_ms: int = 50,
+    ) -> None:
+        self.root: tk.Tk = root
+        self.categorize: CategorizeFunction = categorize
+        self.poll_interval_ms: int = poll_interval_ms
+        self._executor: Executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="categorizer")
+        self._owns_executor: bool = executor is None
+        self._future: Optional["Future[Dict[str, Any]]"] = None
+        self._poll_id: Optional[str] = None
+        self._on_done: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._on_error: Optional[Callable[[Exception], None]] = None
+        self._on_partial: Optional[PartialCallback] = None
+        self._partials: Optional["queue.SimpleQueue[Tuple[str, str, float]]"] = None
+
+    @property
+    def is_busy(self) -> bool:
+        return self._future is not None
+
+    def submit(
+        self,
+        sessions: List[Session],
+        on_done: Callable[[Dict[str, Any]], None],
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_partial: Optional[PartialCallback] = None,
+    ) -> None:
+        self.cancel()
+        # Sessions are owned by the Tk thread, so the worker only ever sees frozen copies.
+        snapshot = [self._snapshot(session) for session in sessions]
+        self._on_done = on_done
+        self._on_error = on_error
+        if on_partial is None:
+            self._future = self._executor.submit(self.categorize, snapshot)
+        else:
+            # Each submission gets its own queue so a cancelled request cannot leak rows into the next one.
+            partials: "queue.SimpleQueue[Tuple[str, str, float]]" = queue.SimpleQueue()
+            self._on_partial = on_partial
+            self._partials = partials
+            self._future = self._executor.submit(
+                self.categorize,
+                snapshot,
+                on_task_categorized=lambda task_name, category, duration: partials.put((task_name, category, duration)),
+            )
+        self._poll_id = self.root.after(self.poll_interval_ms, self._poll)
+
+    def cancel(self) -> None:
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self._future is not None:
+            # A request already in flight cannot be aborted; its result is simply dropped.
+            self._future.cancel()
+            self._future = None
+        self._on_done = None
+        self._on_error = None
+        self._on_partial = None
+        self._partials = None
+
+    def shutdown(self) -> None:
+        self.cancel()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _snapshot(self, session: Session) -> Session:
+        if not session.is_running or session.start_wall_ns is None:
+            return session
+        duration_ns = round(session.get_duration() * 1_000_000_000)
+        frozen = Session.from_record(
+            session.task_name,
+            session.start_wall_ns,
+            session.start_wall_ns + session.pause_ns + duration_ns,
+            session.pause_ns,
+        )
+        frozen.session_id = session.session_id
+        return frozen
+
+    def _poll(self) -> None:
+        self._poll_id = None
+        future = self._future
+        if future is None:
+            return
+        # Drain before checking for completion so every partial row lands ahead of the final result.
+        self._drain_partials()
+        if future is not self._future:
+            return
+        if not future.done():
+            self._poll_id = self.root.after(self.poll_interval_ms, self._poll)
+            return
+
+        on_done = self._on_done
+        on_error = self._on_error
+        self._future = None
+        self._on_done = None
+        self._on_error = None
+        self._on_partial = None
+        self._partials = None
+
+        error = future.exception()
+        if error is None:
+            if on_done:
+                on_done(future.result())
+        elif on_error and isinstance(error, Exception):
+            on_error(error)
+
+    def _drain_partials(self) -> None:
+        partials = self._partials
+        while partials is not None and partials is self._partials and self._on_partial is not None:
+            try:
+                task_name, category, duration = partials.get_nowait()
+            except queue.Empty:
+                return
+            self._on_partial(task_name, category, duration)
@@ -0,0 +1,128 @@
+import tkinter as tk
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Callable, Dict, Optional
+
+from src.gui.virtual_list import VirtualListView
+from src.history import HistoryRange, SessionHistory
+from src.utils.duration_format import format_hms
+
+DAY = "day"
+WEEK = "week"
+MONTH = "month"
+
+_PERIOD_LABELS: Dict[str, str] = {DAY: "日", WEEK: "週", MONTH: "月"}
+
+
+class HistoryView:
+    def __init__(
+        self,
+        root: tk.Tk,
+        history: SessionHistory,
+        back_callback: Optional[Callable[[], None]] = None,
+        today: Optional[date] = None,
+    ) -> None:
+        self.root: tk.Tk = root
+        self.history: SessionHistory = history
+        self.back_callback: Optional[Callable[[], None]] = back_callback
+        self.period: str = DAY
+        self.anchor: date = today or date.today()
+        self.current_range: Optional[HistoryRange] = None
+
+        self.navigation_frame: tk.Frame
+        self.range_label: tk.Label
+        self.period_buttons: Dict[str, tk.Button] = {}
+        self.session_list_view: VirtualListView
+        self.total_label: tk.Label
+        self.back_button: tk.Button
+
+        self._create_widgets()
+
+    def _create_widgets(self) -> None:
+        self.navigation_frame = tk.Frame(self.root)
+        tk.Button(self.navigation_frame, text="◀", command=self.show_previous).pack(side=tk.LEFT)
+        self.range_label = tk.Label(self.navigation_frame, text="", width=30)
+        self.range_label.pack(side=tk.LEFT, padx=10)
+        tk.Button(self.navigation_frame, text="▶", command=self.show_next).pack(side=tk.LEFT)
+        for period, label in _PERIOD_LABELS.items():
+            button = tk.Button(self.navigation_frame, text=label, command=partial(self.set_period, period))
+            button.pack(side=tk.LEFT, padx=2)
+            self.period_buttons[period] = button
+
+        self.session_list_view = VirtualListView(self.root, self._format_session_row, width=80, height=15)
+        self.total_label = tk.Label(self.root, text="", font=("Arial", 12, "bold"))
+        self.back_button = tk.Button(self.root, text="戻る", command=self._on_back_clicked, width=15)
+
+    def show(self) -> None:
+        # Today, this week and this month may have gained sessions since they were last cached.
+        self.history.invalidate(datetime.now())
+        self.navigation_frame.pack(pady=10)
+        self.session_list_view.frame.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
+        self.total_label.pack(pady=10)
+        self.back_button.pack(pady=10)
+        self.load()
+
+    def hide(self) -> None:
+        self.navigation_frame.pack_forget()
+        self.session_list_view.frame.pack_forget()
+        self.total_label.pack_forget()
+        self.back_button.pack_forget()
+
+    def set_period(self, period: str) -> None:
+        if period not in _PERIOD_LABELS:
+            raise ValueError(f"Unknown history period: {period}")
+        self.period = period
+        self.load()
+
+    def show_previous(self) -> None:
+        self.anchor = self._shift_anchor(-1)
+        self.load()
+
+    def show_next(self) -> None:
+        self.anchor = self._shift_anchor(1)
+        self.load()
+
+    def load(self) -> None:
+        if self.period == DAY:
+            self.current_range = self.history.day(self.anchor)
+        elif self.period == WEEK:
+            self.current_range = self.history.week(self.anchor)
+        else:
+            self.current_range = self.history.month(self.anchor.year, self.anchor.month)
+
+        self.range_label.config(text=self._format_range_label(self.current_range))
+        for period, button in self.period_buttons.items():
+            button.config(relief=tk.SUNKEN if period == self.period else tk.RAISED)
+
+        # Only the rows that scroll into view are fetched; the count and total come from indexed aggregates.
+        self.session_list_view.reset()
+        self.session_list_view.follow_tail = False
+        self.session_list_view.set_row_count(len(self.current_range))
+        self.total_label.config(text=f"合計時間: {format_hms(self.current_range.total_time)}")
+
+    def _shift_anchor(self, direction: int) -> date:
+        if self.period == DAY:
+            return self.anchor + timedelta(days=direction)
+        if self.period == WEEK:
+            return self.anchor + timedelta(weeks=direction)
+        month_index = self.anchor.year * 12 + self.anchor.month - 1 + direction
+        return date(month_index // 12, month_index % 12 + 1, 1)
+
+    def _format_range_label(self, history_range: HistoryRange) -> str:
+        if self.period == DAY:
+            return f"{history_range.start:%Y-%m-%d}"
+        if self.period == WEEK:
+            return f"{history_range.start:%Y-%m-%d} 〜 {history_range.end - timedelta(days=1):%Y-%m-%d}"
+        return f"{history_range.start:%Y年%m月}"
+
+    def _format_session_row(self, index: int) -> str:
+        if self.current_range is None:
+            return ""
+        session = self.current_range.session(index)
+        start_time = session.start_time
+        started = f"{start_time:%m/%d %H:%M}" if start_time else ""
+        return f"{started}  {session.task_name}: {session.format_duration()}"
+
+    def _on_back_clicked(self) -> None:
+        if self.back_callback:
+            self.back_callback()
@@ -1,38 +1,88 @@
+import time
 import tkinter as tk
-from typing import Optional
+from typing import Any, Optional
+from src.gui.async_categorizer import AsyncCategorizer, CategorizeFunction
+from src.gui.history_view import HistoryView
+from src.gui.quick_switch import QuickSwitchPalette
+from src.gui.summary_category_view import SummaryCategoryView
+from src.gui.tick_scheduler import TickScheduler
+from src.gui.virtual_list import VirtualListView
+from src.history import SessionHistory
 from src.session_manager import SessionManager
 from src.utils.clipboard import ClipboardManager
+from src.utils.duration_format import format_hms
 from src.utils.markdown import MarkdownExporter
+from src.utils.task_names import normalize_task_name
 
 
 class MainWindow:
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(
+        self,
+        root: tk.Tk,
+        session_manager: Optional[SessionManager] = None,
+        categorize: Optional[CategorizeFunction] = None,
+    ) -> None:
         self.root: tk.Tk = root
-        self.session_manager: SessionManager = SessionManager()
-        self.clipboard_manager: ClipboardManager = ClipboardManager()
+        self.session_manager: SessionManager = session_manager or SessionManager()
+        self.categorizer: Optional[AsyncCategorizer] = AsyncCategorizer(root, categorize) if categorize else None
+        self.category_view: Optional[SummaryCategoryView] = None
+        self.history_view: Optional[HistoryView] = None
+        self.clipboard_manager: ClipboardManager = ClipboardManager(root, detect_fallback=True)
         self.markdown_exporter: MarkdownExporter = MarkdownExporter()
-        self._timer_id: Optional[str] = None
+        self._tick_scheduler: TickScheduler = TickScheduler(root, self._update_display, phase=self._display_phase)
+        self.quick_switch: QuickSwitchPalette = QuickSwitchPalette(
+            root, self.session_manager.search_tasks, self._switch_to_task
+        )
         self._is_summary_view: bool = False
         self.task_entry: tk.Entry
         self.start_button: tk.Button
         self.pause_button: tk.Button
         self.stop_button: tk.Button
+        self.history_button: Optional[tk.Button] = None
+        self.task_list_view: VirtualListView
         self.task_list: tk.Listbox
+        self._live_row: Optional[int] = None
         self.summary_label: tk.Label
         self.copy_button: tk.Button
         self.back_button: tk.Button
         self._setup_window()
         self._create_widgets()
         self._create_summary_widgets()
+        self._restore_session_state()
 
     def _setup_window(self) -> None:
         self.root.title("Task Tracker")
         self.root.geometry("800x600")
         self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.bind("<Unmap>", self._on_root_unmap)
+        self.root.bind("<Map>", self._on_root_map)
+        self.root.bind("<Control-k>", self._on_quick_switch_key)
+        self.root.bind("<Control-K>", self._on_quick_switch_key)
+
+    @property
+    def _timer_id(self) -> Optional[str]:
+        return self._tick_scheduler.timer_id
+
+    def _restore_session_state(self) -> None:
+        if not self.session_manager.sessions:
+            return
+
+        current_session = self.session_manager.current_session
+        if current_session and current_session.is_paused:
+            self.pause_button.config(text="▶ 再開")
+
+        self._update_button_states()
+        self._update_task_list()
+        if current_session and current_session.is_running:
+            self._start_real_time_updates()
 
     def _create_widgets(self) -> None:
         self.task_entry = tk.Entry(self.root, width=40)
         self.task_entry.pack(pady=10)
+        self.task_entry.bind("<KeyRelease>", self._on_task_entry_key)
+        # Bound on the entry itself so Tk's emacs-style Ctrl+K (delete to end of line) never runs first.
+        self.task_entry.bind("<Control-k>", self._on_quick_switch_key)
 
         self.start_button = tk.Button(self.root, text="▶ 開始", command=self._on_start_clicked)
         self.start_button.pack(pady=5)
@@ -43,20 +93,51 @@ class MainWindow:
         self.stop_button = tk.Button(self.root, text="⏹ 停止", command=self._on_stop_clicked)
         self.stop_button.pack(pady=5)
 
-        self.task_list = tk.Listbox(self.root, width=80, height=15)
-        self.task_list.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
+        if self.session_manager.store:
+            self.history_button = tk.Button(self.root, text="履歴", command=self._show_history_view)
+            self.history_button.pack(pady=5)
+
+        self.task_list_view = VirtualListView(self.root, self._format_session_row, width=80, height=15)
+        self.task_list = self.task_list_view.listbox
+        self.task_list_view.frame.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
 
     def _on_start_clicked(self) -> None:
         task_name = self.task_entry.get().strip()
         if not task_name:
             return
 
+        self._switch_to_task(task_name)
+
+    def _switch_to_task(self, task_name: str) -> None:
         self.session_manager.start_session(task_name)
         self.task_entry.delete(0, tk.END)
         self._update_button_states()
         self._update_task_list()
         self._start_real_time_updates()
 
+    def _on_quick_switch_key(self, event: Any) -> str:
+        if not self._is_summary_view:
+            self.quick_switch.open()
+        return "break"
+
+    def _on_task_entry_key(self, event: Any) -> None:
+        if not event.char or not event.char.isprintable():
+            return
+
+        typed = self.task_entry.get()[: self.task_entry.index(tk.INSERT)]
+        completions = self.session_manager.complete_task_name(typed, limit=1)
+        if not completions or len(completions[0]) <= len(typed):
+            return
+        completion = completions[0]
+        if normalize_task_name(completion[: len(typed)]) != normalize_task_name(typed):
+            return
+
+        # Inline completion: the suggested remainder is selected, so typing on simply overwrites it.
+        self.task_entry.delete(0, tk.END)
+        self.task_entry.insert(0, completion)
+        self.task_entry.select_range(len(typed), tk.END)
+        self.task_entry.icursor(len(typed))
+
     def _on_pause_clicked(self) -> None:
         if not self.session_manager.current_session:
             return
@@ -65,6 +146,7 @@ class MainWindow:
         if current_session.is_paused:
             current_session.resume()
             self.pause_button.config(text="⏸ 一時停止")
+            self._start_real_time_updates()
         else:
             current_session.pause()
             self.pause_button.config(text="▶ 再開")
@@ -78,39 +160,62 @@ class MainWindow:
             self.pause_button.config(state="disabled")
 
     def _update_task_list(self) -> None:
-        self.task_list.delete(0, tk.END)
-        
-        for session in self.session_manager.get_all_sessions():
-            status_icon = ""
-            if session.is_running:
-                if session.is_paused:
-                    status_icon = "⏸"
-                else:
-                    status_icon = "▶"
-            
-            item_text = f"{status_icon} {session.task_name}: {session.format_duration()}"
-            self.task_list.insert(tk.END, item_text)
+        sessions = self.session_manager.sessions
+        previous_live_row = self._live_row
+        self._live_row = len(sessions) - 1 if sessions and sessions[-1].is_running else None
+
+        if len(sessions) < self.task_list_view.row_count:
+            self.task_list_view.reset()
+
+        if len(sessions) != self.task_list_view.row_count:
+            self.task_list_view.set_row_count(len(sessions))
+            return
+
+        if previous_live_row is not None and previous_live_row != self._live_row:
+            self.task_list_view.invalidate(previous_live_row)
+        if self._live_row is not None:
+            self.task_list_view.invalidate(self._live_row)
+
+    def _format_session_row(self, index: int) -> str:
+        session = self.session_manager.sessions[index]
+        status_icon = ""
+        if session.is_running:
+            if session.is_paused:
+                status_icon = "⏸"
+            else:
+                status_icon = "▶"
+
+        return f"{status_icon} {session.task_name}: {session.format_duration()}"
 
     def _start_real_time_updates(self) -> None:
-        if self._timer_id:
-            self.root.after_cancel(self._timer_id)
-        
-        self._timer_id = self.root.after(1000, self._update_display)
+        self._tick_scheduler.schedule()
+
+    def _display_phase(self) -> float:
+        current_session = self.session_manager.current_session
+        if current_session and current_session.is_running:
+            return current_session.get_duration()
+        return time.time()
 
     def _update_display(self) -> None:
         self._update_task_list()
-        
-        has_running_sessions = any(session.is_running for session in self.session_manager.get_all_sessions())
-        if has_running_sessions:
-            self._timer_id = self.root.after(1000, self._update_display)
+
+        current_session = self.session_manager.current_session
+        if current_session and current_session.is_running and not current_session.is_paused:
+            self._tick_scheduler.schedule()
         else:
-            self._timer_id = None
+            self._tick_scheduler.cancel()
+
+    def _on_root_unmap(self, event: Any) -> None:
+        if event.widget is self.root:
+            self._tick_scheduler.suspend()
+
+    def _on_root_map(self, event: Any) -> None:
+        if event.widget is self.root and not self._is_summary_view:
+            self._tick_scheduler.resume()
 
     def _on_stop_clicked(self) -> None:
-        if self._timer_id:
-            self.root.after_cancel(self._timer_id)
-            self._timer_id = None
-        
+        self._tick_scheduler.cancel()
+
         self.session_manager.stop_all_sessions()
         self._show_summary_view()
 
@@ -121,22 +226,46 @@ class MainWindow:
 
     def _show_summary_view(self) -> None:
         self._is_summary_view = True
-        
-        self.task_entry.pack_forget()
-        self.start_button.pack_forget()
-        self.pause_button.pack_forget()
-        self.stop_button.pack_forget()
-        self.task_list.pack_forget()
-        
+        self._tick_scheduler.suspend()
+        self._hide_main_widgets()
+
         summary_text = self._generate_summary_text()
         self.summary_label.config(text=summary_text)
         self.summary_label.pack(pady=20, padx=20, fill=tk.BOTH, expand=True)
-        self.copy_button.pack(pady=5)
-        self.back_button.pack(pady=10)
+        if self.categorizer:
+            self._show_category_summary(self.categorizer)
+        else:
+            self.copy_button.pack(pady=5)
+            self.back_button.pack(pady=10)
+
+    def _show_category_summary(self, categorizer: AsyncCategorizer) -> None:
+        if self.category_view is None:
+            self.category_view = SummaryCategoryView(
+                self.root,
+                {"categories": []},
+                back_callback=self._on_back_clicked,
+                copy_callback=self._on_copy_markdown_clicked,
+            )
+        category_view = self.category_view
+        category_view.show()
+        category_view.show_progress()
+        categorizer.submit(
+            self.session_manager.get_all_sessions(),
+            category_view.set_categorized_data,
+            lambda error: category_view.show_error(str(error)),
+            on_partial=category_view.add_task,
+        )
 
     def _show_main_view(self) -> None:
         self._is_summary_view = False
-        
+        self._tick_scheduler.resume()
+        if self.categorizer:
+            self.categorizer.cancel()
+        if self.category_view:
+            self.category_view.hide()
+        if self.history_view:
+            self.history_view.hide()
+
         self.summary_label.pack_forget()
         self.copy_button.pack_forget()
         self.back_button.pack_forget()
@@ -145,7 +274,30 @@ class MainWindow:
         self.start_button.pack(pady=5)
         self.pause_button.pack(pady=5)
         self.stop_button.pack(pady=5)
-        self.task_list.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
+        if self.history_button:
+            self.history_button.pack(pady=5)
+        self.task_list_view.frame.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
+
+    def _hide_main_widgets(self) -> None:
+        self.task_entry.pack_forget()
+        self.start_button.pack_forget()
+        self.pause_button.pack_forget()
+        self.stop_button.pack_forget()
+        if self.history_button:
+            self.history_button.pack_forget()
+        self.task_list_view.frame.pack_forget()
+
+    def _show_history_view(self) -> None:
+        store = self.session_manager.store
+        if store is None:
+            return
+
+        self._is_summary_view = True
+        self._tick_scheduler.suspend()
+        self._hide_main_widgets()
+        if self.history_view is None:
+            self.history_view = HistoryView(self.root, SessionHistory(store), back_callback=self._on_back_clicked)
+        self.history_view.show()
 
     def _on_back_clicked(self) -> None:
         self._show_main_view()
@@ -153,14 +305,14 @@ class MainWindow:
     def _on_copy_markdown_clicked(self) -> None:
         markdown_text = self.markdown_exporter.export_sessions(self.session_manager.get_all_sessions())
         
+        # With a categorizer the summary shows the category view's button, so the feedback belongs there.
+        copy_button = self.category_view.copy_button if self.categorizer and self.category_view else self.copy_button
+        original_text = copy_button.cget("text")
         if self.clipboard_manager.copy_to_clipboard(markdown_text):
-            original_text = self.copy_button.cget("text")
-            self.copy_button.config(text="✓ コピー完了!")
-            self.root.after(2000, lambda: self.copy_button.config(text=original_text))
+            copy_button.config(text="✓ コピー完了!")
         else:
-            original_text = self.copy_button.cget("text")
-            self.copy_button.config(text="✗ コピー失敗")
-            self.root.after(2000, lambda: self.copy_button.config(text=original_text))
+            copy_button.config(text="✗ コピー失敗")
+        self.root.after(2000, lambda: copy_button.config(text=original_text))
 
     def _generate_summary_text(self) -> str:
         if not self.session_manager.sessions:
@@ -171,14 +323,21 @@ class MainWindow:
             summary_lines.append(f"{i}. {session.task_name}: {session.format_duration()}")
         
         total_time = self.session_manager.get_total_time()
-        hours = int(total_time // 3600)
-        minutes = int((total_time % 3600) // 60)
-        seconds = int(total_time % 60)
-        total_formatted = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        total_formatted = format_hms(total_time)
         
         summary_lines.append(f"\n合計時間: {total_formatted}")
         return "\n".join(summary_lines)
 
+    def _on_close(self) -> None:
+        self._tick_scheduler.cancel()
+        if self.categorizer:
+            self.categorizer.shutdown()
+
+        # Time while the app is closed is not work, so the live session ends here rather than on the next launch.
+        self.session_manager.stop_all_sessions()
+        self.session_manager.close()
+        self.root.destroy()
+
     def start(self) -> None:
         self.root.mainloop()
 
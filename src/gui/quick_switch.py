@@ -0,0 +1,93 @@
+import tkinter as tk
+from typing import Any, Callable, List, Optional
+
+SearchFunction = Callable[[str, int], List[str]]
+
+
+class QuickSwitchPalette:
+    def __init__(
+        self,
+        root: tk.Tk,
+        search: SearchFunction,
+        on_select: Callable[[str], None],
+        limit: int = 10,
+    ) -> None:
+        self.root: tk.Tk = root
+        self.search: SearchFunction = search
+        self.on_select: Callable[[str], None] = on_select
+        self.limit: int = limit
+        self.matches: List[str] = []
+        self.window: Optional[tk.Toplevel] = None
+        self.entry: tk.Entry
+        self.listbox: tk.Listbox
+
+    @property
+    def is_open(self) -> bool:
+        return self.window is not None and self.window.winfo_viewable() == 1
+
+    def open(self) -> None:
+        window = self.window or self._create_window()
+        self.entry.delete(0, tk.END)
+        self.refresh()
+        window.deiconify()
+        window.lift()
+        self.entry.focus_set()
+
+    def close(self) -> None:
+        if self.window is not None:
+            self.window.withdraw()
+
+    def _create_window(self) -> tk.Toplevel:
+        self.window = tk.Toplevel(self.root)
+        self.window.title("タスク切り替え")
+        self.window.transient(self.root)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.entry = tk.Entry(self.window, width=50)
+        self.entry.pack(padx=10, pady=(10, 5), fill=tk.X)
+        self.listbox = tk.Listbox(self.window, width=50, height=self.limit, activestyle="none")
+        self.listbox.pack(padx=10, pady=(0, 10), fill=tk.BOTH, expand=True)
+
+        self.entry.bind("<KeyRelease>", self._on_key_release)
+        self.entry.bind("<Down>", lambda event: self.move_selection(1))
+        self.entry.bind("<Up>", lambda event: self.move_selection(-1))
+        self.entry.bind("<Return>", lambda event: self.choose())
+        self.entry.bind("<Escape>", lambda event: self.close())
+        self.listbox.bind("<Double-Button-1>", lambda event: self.choose())
+        return self.window
+
+    def refresh(self) -> None:
+        self.matches = self.search(self.entry.get(), self.limit)
+        self.listbox.delete(0, tk.END)
+        for task_name in self.matches:
+            self.listbox.insert(tk.END, task_name)
+        if self.matches:
+            self._select(0)
+
+    def move_selection(self, step: int) -> str:
+        if self.matches:
+            self._select((self._selected_index() + step) % len(self.matches))
+        # Returning "break" keeps the entry from also handling the arrow keys.
+        return "break"
+
+    def choose(self) -> None:
+        # With nothing matching, the typed text starts a brand-new task.
+        task_name = self.matches[self._selected_index()] if self.matches else self.entry.get().strip()
+        self.close()
+        if task_name:
+            self.on_select(task_name)
+
+    def _on_key_release(self, event: Any) -> None:
+        if event.keysym in ("Up", "Down", "Return", "Escape"):
+            return
+        self.refresh()
+
+    def _selected_index(self) -> int:
+        selection = self.listbox.curselection()
+        return int(selection[0]) if selection else 0
+
+    def _select(self, index: int) -> None:
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.activate(index)
+        self.listbox.see(index)
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from src.utils.duration_format import format_hms
 
 
 class SummaryCategoryView:
@@ -17,7 +18,14 @@ class SummaryCategoryView:
         self.copy_callback: Optional[Callable[[], None]] = copy_callback
 
         self.category_tree: ttk.Treeview
+        self.scrollbar: ttk.Scrollbar
         self.total_label: tk.Label
+        self.status_label: tk.Label
+        self.progress_bar: ttk.Progressbar
+        self._is_loading: bool = False
+        self._category_rows: Dict[str, str] = {}
+        self._category_tasks: Dict[str, List[float]] = {}
+        self._streamed_tasks: Dict[str, Tuple[str, str, float]] = {}
         self.copy_button: tk.Button
         self.back_button: tk.Button
 
@@ -26,6 +34,7 @@ class SummaryCategoryView:
     def _create_widgets(self) -> None:
         self._create_category_table()
         self._create_total_label()
+        self._create_status_widgets()
         self._create_buttons()
 
     def _create_category_table(self) -> None:
@@ -40,8 +49,8 @@ class SummaryCategoryView:
         self.category_tree.column("tasks", width=100, anchor="center")
         self.category_tree.column("duration", width=120, anchor="e")
 
-        scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.category_tree.yview)
-        self.category_tree.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.category_tree.yview)
+        self.category_tree.configure(yscrollcommand=self.scrollbar.set)
 
         self._populate_category_table()
 
@@ -73,16 +82,96 @@ class SummaryCategoryView:
 
         self.total_label = tk.Label(self.root, text=f"総作業時間: {formatted_total}", font=("Arial", 12, "bold"))
 
+    def _create_status_widgets(self) -> None:
+        self.status_label = tk.Label(self.root, text="")
+        self.progress_bar = ttk.Progressbar(self.root, mode="indeterminate", length=200)
+
+    def show_progress(self, message: str = "カテゴリを分類中...") -> None:
+        self._is_loading = True
+        # A new request starts from an empty table, or its streamed rows would pile onto the previous results.
+        self._clear_category_table()
+        self.total_label.config(text=f"総作業時間: {self._format_duration(0.0)}")
+        self.status_label.config(text=message)
+        self.status_label.pack(pady=5, before=self.category_tree)
+        self.progress_bar.pack(pady=5, before=self.category_tree)
+        self.progress_bar.start(20)
+
+    def show_error(self, message: str) -> None:
+        self._hide_progress()
+        self.status_label.config(text=f"分類に失敗しました: {message}")
+        self.status_label.pack(pady=5, before=self.category_tree)
+
+    def set_categorized_data(self, categorized_data: Dict[str, Any]) -> None:
+        self._hide_progress()
+        self.status_label.pack_forget()
+        self.categorized_data = categorized_data
+        self._clear_category_table()
+        self._populate_category_table()
+        self.total_label.config(text=f"総作業時間: {self._format_duration(self._calculate_total_time())}")
+
+    def _clear_category_table(self) -> None:
+        self.category_tree.delete(*self.category_tree.get_children())
+        self._category_rows.clear()
+        self._category_tasks.clear()
+        self._streamed_tasks.clear()
+
+    def add_task(self, task_name: str, category_name: str, duration: float) -> None:
+        streamed = self._streamed_tasks.get(task_name)
+        if streamed is not None:
+            if streamed[0] == category_name:
+                return
+            self._remove_streamed_task(task_name)
+
+        category_row = self._category_rows.get(category_name)
+        if category_row is None:
+            category_row = self._category_rows[category_name] = self.category_tree.insert(
+                "", "end", values=(category_name, "0個", self._format_duration(0.0))
+            )
+            self._category_tasks[category_name] = [0, 0.0]
+
+        task_item = self.category_tree.insert(
+            category_row, "end", values=(f"  {task_name}", "", self._format_duration(duration))
+        )
+        self._streamed_tasks[task_name] = (category_name, task_item, duration)
+        self._update_category_row(category_name, 1, duration)
+
+    def _remove_streamed_task(self, task_name: str) -> None:
+        category_name, task_item, duration = self._streamed_tasks.pop(task_name)
+        self.category_tree.delete(task_item)
+        self._update_category_row(category_name, -1, -duration)
+
+    def _update_category_row(self, category_name: str, task_delta: int, duration_delta: float) -> None:
+        counts = self._category_tasks[category_name]
+        counts[0] += task_delta
+        counts[1] += duration_delta
+        if not counts[0]:
+            self.category_tree.delete(self._category_rows.pop(category_name))
+            del self._category_tasks[category_name]
+        else:
+            self.category_tree.item(
+                self._category_rows[category_name],
+                values=(category_name, f"{int(counts[0])}個", self._format_duration(counts[1])),
+            )
+
+        streamed_total = sum(duration for _, duration in self._category_tasks.values())
+        self.total_label.config(text=f"総作業時間: {self._format_duration(streamed_total)}")
+
+    def _hide_progress(self) -> None:
+        self._is_loading = False
+        self.progress_bar.stop()
+        self.progress_bar.pack_forget()
+
+    @property
+    def is_loading(self) -> bool:
+        return self._is_loading
+
     def _create_buttons(self) -> None:
         self.copy_button = tk.Button(self.root, text="Copy Markdown", command=self._on_copy_markdown_clicked, width=15)
 
         self.back_button = tk.Button(self.root, text="戻る", command=self._on_back_clicked, width=15)
 
     def _format_duration(self, duration_seconds: float) -> str:
-        hours = int(duration_seconds // 3600)
-        minutes = int((duration_seconds % 3600) // 60)
-        seconds = int(duration_seconds % 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return format_hms(duration_seconds)
 
     def _calculate_total_time(self) -> float:
         total_time = 0.0
@@ -103,17 +192,16 @@ class SummaryCategoryView:
 
     def show(self) -> None:
         self.category_tree.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
-
-        scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.category_tree.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.category_tree.configure(yscrollcommand=scrollbar.set)
-
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.total_label.pack(pady=10)
         self.copy_button.pack(pady=5)
         self.back_button.pack(pady=10)
 
     def hide(self) -> None:
+        self._hide_progress()
+        self.status_label.pack_forget()
         self.category_tree.pack_forget()
+        self.scrollbar.pack_forget()
         self.total_label.pack_forget()
         self.copy_button.pack_forget()
         self.back_button.pack_forget()
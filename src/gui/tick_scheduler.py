@@ -0,0 +1,61 @@
+import math
+import time
+import tkinter as tk
+from typing import Callable, Optional
+
+
+class TickScheduler:
+    def __init__(
+        self,
+        root: tk.Misc,
+        callback: Callable[[], None],
+        phase: Callable[[], float] = time.time,
+    ) -> None:
+        self.root: tk.Misc = root
+        self.callback: Callable[[], None] = callback
+        self.phase: Callable[[], float] = phase
+        self.timer_id: Optional[str] = None
+        self.suspended: bool = False
+        self.tick_count: int = 0
+        self._missed_tick: bool = False
+
+    def next_delay_ms(self) -> int:
+        fraction = self.phase() % 1.0
+        return int(math.ceil((1.0 - fraction) * 1000)) + 1
+
+    def schedule(self) -> None:
+        self.cancel()
+        if self.suspended:
+            self._missed_tick = True
+            return
+        self.timer_id = self.root.after(self.next_delay_ms(), self._on_timer)
+
+    def cancel(self) -> None:
+        if self.timer_id:
+            self.root.after_cancel(self.timer_id)
+            self.timer_id = None
+        self._missed_tick = False
+
+    def suspend(self) -> None:
+        if self.suspended:
+            return
+
+        self.suspended = True
+        if self.timer_id:
+            self.root.after_cancel(self.timer_id)
+            self.timer_id = None
+            self._missed_tick = True
+
+    def resume(self) -> None:
+        if not self.suspended:
+            return
+
+        self.suspended = False
+        if self._missed_tick:
+            self._missed_tick = False
+            self._on_timer()
+
+    def _on_timer(self) -> None:
+        self.timer_id = None
+        self.tick_count += 1
+        self.callback()
@@ -0,0 +1,127 @@
+import tkinter as tk
+import tkinter.font as tkfont
+from typing import Any, Callable, List, Tuple
+
+
+class VirtualListView:
+    def __init__(
+        self,
+        parent: tk.Misc,
+        render_row: Callable[[int], str],
+        width: int = 80,
+        height: int = 15,
+    ) -> None:
+        self.render_row: Callable[[int], str] = render_row
+        self.row_count: int = 0
+        self.offset: int = 0
+        self.visible_rows: int = height
+        self.follow_tail: bool = True
+        self._rows: List[str] = []
+
+        self.frame: tk.Frame = tk.Frame(parent)
+        self.listbox: tk.Listbox = tk.Listbox(self.frame, width=width, height=height)
+        self.scrollbar: tk.Scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._line_height: int = max(1, tkfont.Font(font=self.listbox.cget("font")).metrics("linespace") + 1)
+        self.listbox.bind("<Configure>", self._on_configure)
+        self.listbox.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.listbox.bind("<Button-4>", lambda event: self._scroll_by(-3))
+        self.listbox.bind("<Button-5>", lambda event: self._scroll_by(3))
+
+    def set_row_count(self, row_count: int) -> None:
+        if row_count == self.row_count:
+            return
+
+        self.row_count = row_count
+        if self.follow_tail:
+            self.offset = self._max_offset()
+        else:
+            self.offset = min(self.offset, self._max_offset())
+        self.refresh()
+
+    def invalidate(self, index: int) -> None:
+        position = index - self.offset
+        if position < 0 or position >= len(self._rows):
+            return
+
+        text = self.render_row(index)
+        if self._rows[position] != text:
+            self._replace_row(position, text)
+
+    def refresh(self) -> None:
+        first, last = self.window()
+        texts = [self.render_row(index) for index in range(first, last)]
+
+        for position, text in enumerate(texts):
+            if position >= len(self._rows):
+                self.listbox.insert(tk.END, text)
+                self._rows.append(text)
+            elif self._rows[position] != text:
+                self._replace_row(position, text)
+
+        if len(self._rows) > len(texts):
+            self.listbox.delete(len(texts), tk.END)
+            del self._rows[len(texts) :]
+
+        self._update_scrollbar()
+
+    def reset(self) -> None:
+        self.listbox.delete(0, tk.END)
+        self._rows.clear()
+        self.row_count = 0
+        self.offset = 0
+        self.follow_tail = True
+        self._update_scrollbar()
+
+    def window(self) -> Tuple[int, int]:
+        return self.offset, min(self.row_count, self.offset + self.visible_rows)
+
+    def _replace_row(self, position: int, text: str) -> None:
+        self.listbox.delete(position)
+        self.listbox.insert(position, text)
+        self._rows[position] = text
+
+    def _max_offset(self) -> int:
+        return max(0, self.row_count - self.visible_rows)
+
+    def _scroll_to(self, offset: int) -> None:
+        offset = max(0, min(offset, self._max_offset()))
+        self.follow_tail = offset == self._max_offset()
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def _scroll_by(self, rows: int) -> str:
+        self._scroll_to(self.offset + rows)
+        return "break"
+
+    def _on_scrollbar(self, action: str, *args: Any) -> None:
+        if action == tk.MOVETO:
+            self._scroll_to(round(float(args[0]) * self.row_count))
+        elif action == tk.SCROLL:
+            step = int(args[0])
+            if args[1] == tk.PAGES:
+                step *= self.visible_rows
+            self._scroll_to(self.offset + step)
+
+    def _on_mouse_wheel(self, event: Any) -> str:
+        return self._scroll_by(-1 if event.delta > 0 else 1)
+
+    def _on_configure(self, event: Any) -> None:
+        visible_rows = max(1, event.height // self._line_height)
+        if visible_rows == self.visible_rows:
+            return
+
+        self.visible_rows = visible_rows
+        self.offset = self._max_offset() if self.follow_tail else min(self.offset, self._max_offset())
+        self.refresh()
+
+    def _update_scrollbar(self) -> None:
+        if self.row_count == 0:
+            self.scrollbar.set(0.0, 1.0)
+            return
+
+        first, last = self.window()
+        self.scrollbar.set(first / self.row_count, last / self.row_count)
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import List, Optional
+
+from src.session import Session
+from src.session_store import PageCursor, SessionStore
+from src.utils.time_ranges import TimeRange, day_range, month_range, week_range
+
+
+class HistoryRange:
+    def __init__(self, store: SessionStore, start: datetime, end: datetime, page_size: int = 200) -> None:
+        self.store: SessionStore = store
+        self.start: datetime = start
+        self.end: datetime = end
+        self.page_size: int = page_size
+        self.sessions: List[Session] = []
+        self._cursor: Optional[PageCursor] = None
+        self._exhausted: bool = False
+        self._count: Optional[int] = None
+        self._total_time: Optional[float] = None
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = self.store.count_sessions(self.start, self.end)
+        return self._count
+
+    @property
+    def total_time(self) -> float:
+        if self._total_time is None:
+            self._total_time = self.store.get_total_time(self.start, self.end)
+        return self._total_time
+
+    @property
+    def is_fully_loaded(self) -> bool:
+        return self._exhausted
+
+    def session(self, index: int) -> Session:
+        while index >= len(self.sessions) and not self._exhausted:
+            self.load_next_page()
+        return self.sessions[index]
+
+    def load_next_page(self) -> List[Session]:
+        if self._exhausted:
+            return []
+        page, self._cursor = self.store.get_session_page(self.start, self.end, self._cursor, self.page_size)
+        self.sessions.extend(page)
+        self._exhausted = self._cursor is None
+        return page
+
+
+class SessionHistory:
+    def __init__(self, store: SessionStore, page_size: int = 200, max_cached_ranges: int = 16) -> None:
+        self.store: SessionStore = store
+        self.page_size: int = page_size
+        self.max_cached_ranges: int = max_cached_ranges
+        self._ranges: "OrderedDict[TimeRange, HistoryRange]" = OrderedDict()
+
+    def get_range(self, start: datetime, end: datetime) -> HistoryRange:
+        key = (start, end)
+        history_range = self._ranges.get(key)
+        if history_range is None:
+            history_range = self._ranges[key] = HistoryRange(self.store, start, end, self.page_size)
+            while len(self._ranges) > self.max_cached_ranges:
+                self._ranges.popitem(last=False)
+        else:
+            self._ranges.move_to_end(key)
+        return history_range
+
+    def day(self, day: date) -> HistoryRange:
+        return self.get_range(*day_range(day))
+
+    def week(self, day: date) -> HistoryRange:
+        return self.get_range(*week_range(day))
+
+    def month(self, year: int, month: int) -> HistoryRange:
+        return self.get_range(*month_range(year, month))
+
+    def invalidate(self, moment: datetime) -> None:
+        # Only ranges that can still receive sessions go stale; past days stay cached.
+        stale = [key for key in self._ranges if key[0] <= moment < key[1]]
+        for key in stale:
+            del self._ranges[key]
+
+    def clear(self) -> None:
+        self._ranges.clear()
@@ -0,0 +1,91 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Tuple
+
+
+def clip_intervals(
+    intervals: Iterable[Tuple[int, int]], window_start_ns: int, window_end_ns: int
+) -> List[Tuple[int, int]]:
+    clipped: List[Tuple[int, int]] = []
+    for start_ns, end_ns in intervals:
+        start_ns = max(start_ns, window_start_ns)
+        end_ns = min(end_ns, window_end_ns)
+        if end_ns > start_ns:
+            clipped.append((start_ns, end_ns))
+    return clipped
+
+
+class IntervalIndex:
+    def __init__(self) -> None:
+        self.starts: array = array("q")
+        self.ends: array = array("q")
+        self.owners: array = array("l")
+        self._cumulative: array = array("q", [0])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def add(self, start_ns: int, end_ns: int, owner: int) -> None:
+        if end_ns <= start_ns:
+            return
+
+        if not self.starts or start_ns >= self.ends[-1]:
+            self.starts.append(start_ns)
+            self.ends.append(end_ns)
+            self.owners.append(owner)
+            self._cumulative.append(self._cumulative[-1] + end_ns - start_ns)
+            return
+
+        # Time already indexed keeps its first owner and only the uncovered gaps are added, so intervals stay
+        # disjoint and the ends stay sorted for the bisects in total_between and overlapping.
+        gaps: List[Tuple[int, int]] = []
+        cursor = start_ns
+        for i in range(bisect_right(self.ends, start_ns), bisect_left(self.starts, end_ns)):
+            if self.starts[i] > cursor:
+                gaps.append((cursor, self.starts[i]))
+            cursor = max(cursor, self.ends[i])
+        if cursor < end_ns:
+            gaps.append((cursor, end_ns))
+        if not gaps:
+            return
+
+        first_position = bisect_right(self.starts, gaps[0][0])
+        for gap_start, gap_end in gaps:
+            position = bisect_right(self.starts, gap_start)
+            self.starts.insert(position, gap_start)
+            self.ends.insert(position, gap_end)
+            self.owners.insert(position, owner)
+        self._rebuild_cumulative(first_position)
+
+    def add_all(self, intervals: Iterable[Tuple[int, int]], owner: int) -> None:
+        for start_ns, end_ns in intervals:
+            self.add(start_ns, end_ns, owner)
+
+    def total_between(self, window_start_ns: int, window_end_ns: int) -> int:
+        if window_end_ns <= window_start_ns or not self.starts:
+            return 0
+
+        first = bisect_right(self.ends, window_start_ns)
+        last = bisect_left(self.starts, window_end_ns)
+        if first >= last:
+            return 0
+
+        total = self._cumulative[last] - self._cumulative[first]
+        total -= max(0, window_start_ns - self.starts[first])
+        total -= max(0, self.ends[last - 1] - window_end_ns)
+        return total
+
+    def overlapping(self, window_start_ns: int, window_end_ns: int) -> List[Tuple[int, int, int]]:
+        first = bisect_right(self.ends, window_start_ns)
+        last = bisect_left(self.starts, window_end_ns)
+        return [
+            (self.owners[i], max(self.starts[i], window_start_ns), min(self.ends[i], window_end_ns))
+            for i in range(first, last)
+        ]
+
+    def _rebuild_cumulative(self, position: int) -> None:
+        del self._cumulative[position + 1 :]
+        running = self._cumulative[position]
+        for start_ns, end_ns in zip(self.starts[position:], self.ends[position:]):
+            running += end_ns - start_ns
+            self._cumulative.append(running)
@@ -0,0 +1,240 @@
+import os
+import re
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Set, Union
+
+from src.session import Session
+
+START = "S"
+PAUSE = "P"
+RESUME = "R"
+STOP = "E"
+
+_ESCAPES = {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+_UNESCAPES = {"t": "\t", "n": "\n", "r": "\r"}
+_ESCAPE_PATTERN = re.compile(r"[\\\t\n\r]")
+_UNESCAPE_PATTERN = re.compile(r"\\(.)")
+
+
+def _escape(text: str) -> str:
+    return _ESCAPE_PATTERN.sub(lambda match: _ESCAPES[match.group(0)], text)
+
+
+def _unescape(text: str) -> str:
+    return _UNESCAPE_PATTERN.sub(lambda match: _UNESCAPES.get(match.group(1), match.group(1)), text)
+
+
+# Both run over the raw bytes, so the journal never has to be decoded as a whole.
+# Anchored on a literal line break rather than ^ so the regex engine can jump between candidate records.
+_START_KEY_PATTERN = re.compile(f"\n{START}\t([^\t\n]*)\t[^\t\n]*\t".encode())
+# Only well-formed stop times count here; anything else is left for the record-by-record replay to judge.
+_STOP_PATTERN = re.compile(f"\n{STOP}\t([^\t\n]*)\t([0-9]+)\\.[0-9]+(?=\n)".encode())
+
+
+def _to_wall_ns(timestamp: float) -> int:
+    return round(timestamp * 1_000_000) * 1000
+
+
+def _tail_offset(data: bytes, session_keys: Set[bytes]) -> int:
+    # Ids grow with time, so the lowest id marks where the given sessions' records begin.
+    # rfind lands on the line break before that record, or on -1 when it opens the file.
+    oldest_key = min(session_keys, key=lambda session_key: int(session_key) if session_key.isdigit() else -1)
+    return data.rfind(b"\n" + START.encode() + b"\t" + oldest_key + b"\t") + 1
+
+
+def _records_of(data: bytes, session_keys: Set[bytes]) -> List[bytes]:
+    records = []
+    for record in data.split(b"\n")[:-1]:
+        fields = record.split(b"\t", 2)
+        if len(fields) > 2 and fields[1] in session_keys:
+            records.append(record)
+    return records
+
+
+def _read_whole_records(path: Path) -> bytes:
+    with open(path, "rb") as journal_file:
+        data = journal_file.read()
+    # Anything after the last newline is a record torn by a crash mid-write.
+    return data[: data.rfind(b"\n") + 1]
+
+
+def _collect_states(text: str, session_keys: Set[str]) -> Dict[str, List[Any]]:
+    records = text.split("\n")
+    records.pop()
+
+    # Timestamps stay as text until the session is built.
+    # [raw task name, start, end, pause/resume marks, paused at]
+    states: Dict[str, List[Any]] = {}
+    for record in records:
+        fields = record.split("\t", 3)
+        if len(fields) < 3:
+            continue
+
+        kind = fields[0]
+        if kind == START:
+            if len(fields) == 4 and fields[1] in session_keys:
+                states[fields[1]] = [fields[3], fields[2], None, None, None]
+            continue
+
+        state = states.get(fields[1])
+        if state is None:
+            continue
+
+        if kind == PAUSE:
+            state[4] = fields[2]
+        elif kind == RESUME or kind == STOP:
+            if state[4] is not None:
+                if state[3] is None:
+                    state[3] = []
+                state[3].extend((state[4], fields[2]))
+                state[4] = None
+            if kind == STOP:
+                state[2] = fields[2]
+    return states
+
+
+class SessionJournal:
+    def __init__(self, path: Union[str, Path], sync_every: int = 16, sync_interval: float = 1.0) -> None:
+        self.path: Path = Path(path)
+        self.sync_every: int = sync_every
+        self.sync_interval: float = sync_interval
+        self._file: Optional[IO[str]] = None
+        self._pending: int = 0
+        self._last_sync: float = time.monotonic()
+        self.next_session_id: int = 0
+        self.skipped_sessions: int = 0
+
+    def record_start(self, session: Session) -> None:
+        if session.start_wall_ns is None:
+            raise ValueError("Session has not been started")
+        self._append(START, session, session.start_wall_ns, _escape(session.task_name))
+
+    def record_pause(self, session: Session, wall_ns: int) -> None:
+        self._append(PAUSE, session, wall_ns)
+
+    def record_resume(self, session: Session, wall_ns: int) -> None:
+        self._append(RESUME, session, wall_ns)
+
+    def record_stop(self, session: Session) -> None:
+        if session.end_wall_ns is None:
+            raise ValueError("Session has not been stopped")
+        self._append(STOP, session, session.end_wall_ns)
+
+    def _append(self, kind: str, session: Session, wall_ns: int, payload: Optional[str] = None) -> None:
+        if session.session_id is None:
+            raise ValueError("Session has no journal id")
+
+        seconds, remainder = divmod(wall_ns, 1_000_000_000)
+        record = f"{kind}\t{session.session_id}\t{seconds}.{remainder // 1000:06d}"
+        if payload is not None:
+            record += f"\t{payload}"
+
+        journal_file = self._open()
+        journal_file.write(record + "\n")
+        journal_file.flush()
+        self._pending += 1
+
+        if self._pending >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def _open(self) -> IO[str]:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            needs_newline = False
+            if self.path.exists() and self.path.stat().st_size > 0:
+                with open(self.path, "rb") as existing:
+                    existing.seek(-1, os.SEEK_END)
+                    needs_newline = existing.read(1) != b"\n"
+
+            self._file = open(self.path, "a", encoding="utf-8", newline="")
+            if needs_newline:
+                self._file.write("\n")
+        return self._file
+
+    def sync(self) -> None:
+        if self._file is not None and self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def replay(self, since_wall_ns: Optional[int] = None) -> List[Session]:
+        self.next_session_id = 0
+        self.skipped_sessions = 0
+        if not self.path.exists():
+            return []
+
+        data = _read_whole_records(self.path)
+
+        # A regex pass over only the start and stop records decides which sessions are kept, so the
+        # record-by-record replay below only has to decode and cover the tail of the journal where they begin.
+        lines = b"\n" + data
+        session_keys = set(_START_KEY_PATTERN.findall(lines))
+        kept = session_keys
+        if since_wall_ns is not None:
+            # Whole seconds are enough: a session that stopped within the second before the cutoff is kept, not lost.
+            since = since_wall_ns // 1_000_000_000
+            kept = session_keys - {
+                session_key for session_key, seconds in _STOP_PATTERN.findall(lines) if int(seconds) < since
+            }
+        self.skipped_sessions = len(session_keys) - len(kept)
+        self.next_session_id = max(map(int, filter(bytes.isdigit, session_keys)), default=-1) + 1
+        if not kept:
+            return []
+
+        kept_keys = {session_key.decode("utf-8") for session_key in kept}
+        first = _tail_offset(data, kept) if len(kept) < len(session_keys) else 0
+        states = _collect_states(data[first:].decode("utf-8"), kept_keys)
+        if first and len(states) < len(kept):
+            states = _collect_states(data.decode("utf-8"), kept_keys)
+
+        sessions: List[Session] = []
+        task_names: Dict[str, str] = {}
+        from_record = Session.from_record
+        for session_key, (raw_name, started_at, ended_at, marks, paused_at) in states.items():
+            try:
+                session_id = int(session_key)
+                pause_marks = [_to_wall_ns(float(mark)) for mark in marks] if marks else None
+                end_wall_ns = None if ended_at is None else _to_wall_ns(float(ended_at))
+                paused_at_wall_ns = None if paused_at is None else _to_wall_ns(float(paused_at))
+                start_wall_ns = _to_wall_ns(float(started_at))
+            except ValueError:
+                continue
+
+            task_name = task_names.get(raw_name)
+            if task_name is None:
+                task_name = task_names[raw_name] = _unescape(raw_name)
+            pause_ns = sum(pause_marks[1::2]) - sum(pause_marks[0::2]) if pause_marks else 0
+            session = from_record(task_name, start_wall_ns, end_wall_ns, pause_ns, paused_at_wall_ns, pause_marks)
+            session.session_id = session_id
+            sessions.append(session)
+        return sessions
+
+    def compact(self, session_ids: Iterable[int]) -> None:
+        # Rewrites the journal with only the given sessions' records; the rename keeps it whole if we crash midway.
+        self.close()
+        if not self.path.exists():
+            return
+
+        keep = {str(session_id).encode() for session_id in session_ids}
+        data = _read_whole_records(self.path)
+
+        first = _tail_offset(data, keep) if keep else len(data)
+        records = _records_of(data[first:], keep)
+        if first and sum(record.startswith(START.encode() + b"\t") for record in records) < len(keep):
+            records = _records_of(data, keep)
+
+        compacted_path = self.path.with_name(self.path.name + ".compact")
+        with open(compacted_path, "wb") as compacted_file:
+            for record in records:
+                compacted_file.write(record + b"\n")
+            compacted_file.flush()
+            os.fsync(compacted_file.fileno())
+        os.replace(compacted_path, self.path)
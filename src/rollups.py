@@ -0,0 +1,147 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple
+
+from src.session import Session, datetime_to_wall_ns, wall_ns_to_datetime
+
+DAY = "day"
+WEEK = "week"
+MONTH = "month"
+
+PERIODS = (DAY, WEEK, MONTH)
+
+RollupKey = Tuple[str, date]
+
+
+def period_start(period: str, day: date) -> date:
+    if period == DAY:
+        return day
+    if period == WEEK:
+        return day - timedelta(days=day.weekday())
+    if period == MONTH:
+        return day.replace(day=1)
+    raise ValueError(f"Unknown rollup period: {period}")
+
+
+def period_end(period: str, day: date) -> date:
+    start = period_start(period, day)
+    if period == DAY:
+        return start + timedelta(days=1)
+    if period == WEEK:
+        return start + timedelta(days=7)
+    return date(start.year + 1, 1, 1) if start.month == 12 else date(start.year, start.month + 1, 1)
+
+
+def split_by_day(intervals_ns: Iterable[Tuple[int, int]]) -> Dict[date, float]:
+    # Worked time is cut at local midnight, the same day windows SessionManager.get_worked_time_between uses.
+    day_durations: Dict[date, float] = {}
+    for start_ns, end_ns in intervals_ns:
+        while start_ns < end_ns:
+            day = wall_ns_to_datetime(start_ns).date()
+            piece_end_ns = min(
+                end_ns, datetime_to_wall_ns(datetime.combine(day + timedelta(days=1), datetime.min.time()))
+            )
+            day_durations[day] = day_durations.get(day, 0.0) + (piece_end_ns - start_ns) / 1_000_000_000
+            start_ns = piece_end_ns
+    return day_durations
+
+
+def session_day_totals(session: Session) -> Iterator[Tuple[str, date, float, int]]:
+    if session.start_time is None:
+        return
+    # The session itself is counted on the day it started; later days only receive the time worked on them.
+    start_day = session.start_time.date()
+    day_durations = split_by_day(session.get_active_intervals_ns())
+    yield session.task_name, start_day, day_durations.pop(start_day, 0.0), 1
+    for day, duration in day_durations.items():
+        yield session.task_name, day, duration, 0
+
+
+class Rollup:
+    __slots__ = ("period", "start", "total_duration", "session_count", "task_totals")
+
+    def __init__(self, period: str, start: date) -> None:
+        self.period: str = period
+        self.start: date = start
+        self.total_duration: float = 0.0
+        self.session_count: int = 0
+        self.task_totals: Dict[str, float] = {}
+
+    @property
+    def end(self) -> date:
+        return period_end(self.period, self.start)
+
+    @property
+    def label(self) -> str:
+        if self.period == WEEK:
+            iso_year, iso_week, _ = self.start.isocalendar()
+            return f"{iso_year}-W{iso_week:02d}"
+        if self.period == MONTH:
+            return f"{self.start:%Y-%m}"
+        return self.start.isoformat()
+
+    def add(self, task_name: str, duration: float, session_count: int = 1) -> None:
+        self.total_duration += duration
+        self.session_count += session_count
+        self.task_totals[task_name] = self.task_totals.get(task_name, 0.0) + duration
+
+    def totals_by_category(self, categories: Mapping[str, str], default: str = "その他") -> Dict[str, float]:
+        # Categories are resolved per distinct task, so reclassifying a task never requires a rebuild.
+        totals: Dict[str, float] = {}
+        for task_name, duration in self.task_totals.items():
+            category = categories.get(task_name, default)
+            totals[category] = totals.get(category, 0.0) + duration
+        return totals
+
+
+class Rollups:
+    def __init__(self) -> None:
+        self._rollups: Dict[RollupKey, Rollup] = {}
+
+    def __len__(self) -> int:
+        return len(self._rollups)
+
+    def add(self, task_name: str, day: date, duration: float, session_count: int = 1) -> None:
+        for period in PERIODS:
+            key = (period, period_start(period, day))
+            rollup = self._rollups.get(key)
+            if rollup is None:
+                rollup = self._rollups[key] = Rollup(*key)
+            rollup.add(task_name, duration, session_count)
+
+    def add_session(self, session: Session) -> None:
+        if session.is_running:
+            return
+        for task_name, day, duration, session_count in session_day_totals(session):
+            self.add(task_name, day, duration, session_count)
+
+    def rebuild(self, daily_task_totals: Iterable[Tuple[str, date, float, int]]) -> None:
+        self._rollups.clear()
+        for task_name, day, duration, session_count in daily_task_totals:
+            self.add(task_name, day, duration, session_count)
+
+    def rebuild_from_sessions(self, sessions: Iterable[Session]) -> None:
+        self._rollups.clear()
+        for session in sessions:
+            self.add_session(session)
+
+    def get(self, period: str, day: date) -> Rollup:
+        key = (period, period_start(period, day))
+        return self._rollups.get(key) or Rollup(*key)
+
+    def day(self, day: date) -> Rollup:
+        return self.get(DAY, day)
+
+    def week(self, day: date) -> Rollup:
+        return self.get(WEEK, day)
+
+    def month(self, year: int, month: int) -> Rollup:
+        return self.get(MONTH, date(year, month, 1))
+
+    def days_in(self, rollup: Rollup) -> List[Rollup]:
+        return [day_rollup for day_rollup in self.iter_days(rollup.start, rollup.end) if day_rollup.task_totals]
+
+    def iter_days(self, first_day: date, end_day: date) -> Iterator[Rollup]:
+        day = first_day
+        while day < end_day:
+            yield self.day(day)
+            day += timedelta(days=1)
@@ -1,24 +1,205 @@
+import time
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from src.utils.duration_format import format_hms
+
+if TYPE_CHECKING:
+    from src.journal import SessionJournal
+
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_MICROSECOND = 1_000
+_MONOTONIC_ANCHOR_NS = time.monotonic_ns()
+_WALL_ANCHOR_NS = time.time_ns()
+
+
+def _wall_to_monotonic_ns(wall_ns: int) -> int:
+    return wall_ns - _WALL_ANCHOR_NS + _MONOTONIC_ANCHOR_NS
+
+
+def datetime_to_wall_ns(value: datetime) -> int:
+    seconds = round(value.timestamp() - value.microsecond / 1_000_000)
+    return seconds * _NS_PER_SECOND + value.microsecond * _NS_PER_MICROSECOND
+
+
+def wall_ns_to_datetime(wall_ns: int) -> datetime:
+    seconds, remainder = divmod(wall_ns, _NS_PER_SECOND)
+    return datetime.fromtimestamp(seconds).replace(microsecond=remainder // _NS_PER_MICROSECOND)
 
 
 class Session:
+    __slots__ = (
+        "task_name",
+        "task_id",
+        "session_id",
+        "journal",
+        "is_running",
+        "is_paused",
+        "_start_ns",
+        "_end_ns",
+        "_paused_at_ns",
+        "_pause_ns",
+        "_start_wall_ns",
+        "_end_wall_ns",
+        "_paused_at_wall_ns",
+        "_pause_marks",
+    )
+
     def __init__(self, task_name: str) -> None:
         self.task_name: str = task_name
-        self.start_time: Optional[datetime] = None
-        self.end_time: Optional[datetime] = None
+        self.task_id: Optional[int] = None
+        self.session_id: Optional[int] = None
+        self.journal: Optional["SessionJournal"] = None
         self.is_running: bool = False
         self.is_paused: bool = False
-        self.pause_time: Optional[datetime] = None
-        self.total_pause_duration: float = 0.0
+        self._start_ns: Optional[int] = None
+        self._end_ns: Optional[int] = None
+        self._paused_at_ns: Optional[int] = None
+        self._pause_ns: int = 0
+        self._start_wall_ns: Optional[int] = None
+        self._end_wall_ns: Optional[int] = None
+        self._paused_at_wall_ns: Optional[int] = None
+        self._pause_marks: Optional[List[int]] = None
+
+    @classmethod
+    def from_record(
+        cls,
+        task_name: str,
+        start_wall_ns: int,
+        end_wall_ns: Optional[int] = None,
+        pause_ns: int = 0,
+        paused_at_wall_ns: Optional[int] = None,
+        pause_marks: Optional[Sequence[int]] = None,
+    ) -> "Session":
+        session = cls(task_name)
+        session._start_wall_ns = start_wall_ns
+        session._start_ns = _wall_to_monotonic_ns(start_wall_ns)
+        session._pause_ns = pause_ns
+        if pause_marks:
+            session._pause_marks = list(pause_marks)
+        if end_wall_ns is not None:
+            session._end_wall_ns = end_wall_ns
+            session._end_ns = session._start_ns + end_wall_ns - start_wall_ns
+        else:
+            session.is_running = True
+            if paused_at_wall_ns is not None:
+                session._paused_at_wall_ns = paused_at_wall_ns
+                session._paused_at_ns = session._start_ns + paused_at_wall_ns - start_wall_ns
+                session.is_paused = True
+        return session
+
+    def _to_monotonic_ns(self, value: Optional[datetime]) -> Optional[int]:
+        if value is None:
+            return None
+
+        wall_ns = datetime_to_wall_ns(value)
+        if self._start_ns is None or self._start_wall_ns is None:
+            return _wall_to_monotonic_ns(wall_ns)
+        return self._start_ns + wall_ns - self._start_wall_ns
+
+    @property
+    def start_time(self) -> Optional[datetime]:
+        return None if self._start_wall_ns is None else wall_ns_to_datetime(self._start_wall_ns)
+
+    @start_time.setter
+    def start_time(self, value: Optional[datetime]) -> None:
+        self._start_wall_ns = None if value is None else datetime_to_wall_ns(value)
+        self._start_ns = None if self._start_wall_ns is None else _wall_to_monotonic_ns(self._start_wall_ns)
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        return None if self._end_wall_ns is None else wall_ns_to_datetime(self._end_wall_ns)
+
+    @end_time.setter
+    def end_time(self, value: Optional[datetime]) -> None:
+        self._end_wall_ns = None if value is None else datetime_to_wall_ns(value)
+        self._end_ns = self._to_monotonic_ns(value)
+
+    @property
+    def pause_time(self) -> Optional[datetime]:
+        return None if self._paused_at_wall_ns is None else wall_ns_to_datetime(self._paused_at_wall_ns)
+
+    @pause_time.setter
+    def pause_time(self, value: Optional[datetime]) -> None:
+        self._paused_at_wall_ns = None if value is None else datetime_to_wall_ns(value)
+        self._paused_at_ns = self._to_monotonic_ns(value)
+
+    @property
+    def total_pause_duration(self) -> float:
+        return self._pause_ns / _NS_PER_SECOND
+
+    @total_pause_duration.setter
+    def total_pause_duration(self, value: float) -> None:
+        self._pause_ns = round(value * _NS_PER_SECOND)
+
+    @property
+    def start_wall_ns(self) -> Optional[int]:
+        return self._start_wall_ns
+
+    @property
+    def end_wall_ns(self) -> Optional[int]:
+        return self._end_wall_ns
+
+    @property
+    def pause_ns(self) -> int:
+        return self._pause_ns
+
+    @property
+    def pause_marks_wall_ns(self) -> List[int]:
+        return list(self._pause_marks) if self._pause_marks else []
+
+    def get_active_intervals_ns(self) -> List[Tuple[int, int]]:
+        # Intervals are placed on the wall clock, so time the machine spent suspended still falls between them.
+        if self._start_wall_ns is None:
+            return []
+
+        if self._end_wall_ns is not None:
+            end_ns = self._end_wall_ns
+        elif self.is_paused and self._paused_at_wall_ns is not None:
+            end_ns = self._paused_at_wall_ns
+        else:
+            end_ns = time.time_ns()
+
+        if self._pause_marks is None:
+            # Sessions restored without pause marks only know their total pause time.
+            boundaries = [self._start_wall_ns, end_ns - self._pause_ns if self._end_wall_ns is not None else end_ns]
+        else:
+            boundaries = [self._start_wall_ns, *self._pause_marks, end_ns]
+
+        return [
+            (boundaries[i], boundaries[i + 1])
+            for i in range(0, len(boundaries) - 1, 2)
+            if boundaries[i + 1] > boundaries[i]
+        ]
+
+    def get_active_intervals(self) -> List[Tuple[datetime, datetime]]:
+        return [
+            (wall_ns_to_datetime(start_ns), wall_ns_to_datetime(end_ns))
+            for start_ns, end_ns in self.get_active_intervals_ns()
+        ]
+
+    def get_duration_between(self, start: datetime, end: datetime) -> float:
+        window_start_ns = datetime_to_wall_ns(start)
+        window_end_ns = datetime_to_wall_ns(end)
+        worked_ns = 0
+        for interval_start, interval_end in self.get_active_intervals_ns():
+            overlap = min(interval_end, window_end_ns) - max(interval_start, window_start_ns)
+            if overlap > 0:
+                worked_ns += overlap
+        return worked_ns / _NS_PER_SECOND
 
     def start(self) -> None:
         if self.is_running:
             raise ValueError("Session is already running")
 
-        self.start_time = datetime.now()
+        self._start_ns = time.monotonic_ns()
+        self._start_wall_ns = time.time_ns()
         self.is_running = True
-        self.end_time = None
+        self._end_ns = None
+        self._end_wall_ns = None
+
+        if self.journal:
+            self.journal.record_start(self)
 
     def pause(self) -> None:
         if not self.is_running:
@@ -26,20 +207,33 @@ class Session:
         if self.is_paused:
             raise ValueError("Session is already paused")
 
-        self.pause_time = datetime.now()
+        self._paused_at_ns = time.monotonic_ns()
+        self._paused_at_wall_ns = time.time_ns()
         self.is_paused = True
 
+        if self.journal:
+            self.journal.record_pause(self, self._paused_at_wall_ns)
+
     def resume(self) -> None:
         if not self.is_paused:
             raise ValueError("Session is not paused")
 
-        if self.pause_time:
-            pause_duration = (datetime.now() - self.pause_time).total_seconds()
-            self.total_pause_duration += pause_duration
+        resumed_at_ns = time.monotonic_ns()
+        resumed_at_wall_ns = time.time_ns()
+        if self._paused_at_ns is not None:
+            self._pause_ns += resumed_at_ns - self._paused_at_ns
+        if self._paused_at_wall_ns is not None:
+            if self._pause_marks is None:
+                self._pause_marks = []
+            self._pause_marks.extend((self._paused_at_wall_ns, resumed_at_wall_ns))
 
-        self.pause_time = None
+        self._paused_at_ns = None
+        self._paused_at_wall_ns = None
         self.is_paused = False
 
+        if self.journal:
+            self.journal.record_resume(self, resumed_at_wall_ns)
+
     def stop(self) -> None:
         if not self.is_running:
             raise ValueError("Session is not running")
@@ -47,28 +241,32 @@ class Session:
         if self.is_paused:
             self.resume()
 
-        self.end_time = datetime.now()
+        # The monotonic clock only measures the duration; it stands still while the machine is suspended,
+        # so the stop time itself is read from the wall clock.
+        self._end_ns = time.monotonic_ns()
+        self._end_wall_ns = time.time_ns()
         self.is_running = False
 
+        if self.journal:
+            self.journal.record_stop(self)
+
     def get_duration(self) -> float:
-        if self.start_time is None:
+        start_ns = self._start_ns
+        if start_ns is None:
             return 0.0
 
-        end_time = self.end_time if self.end_time else datetime.now()
-        total_seconds = (end_time - self.start_time).total_seconds()
+        end_ns = self._end_ns
+        if end_ns is None:
+            end_ns = time.monotonic_ns()
 
-        current_pause_duration = 0.0
-        if self.is_paused and self.pause_time:
-            current_pause_duration = (datetime.now() - self.pause_time).total_seconds()
+        pause_ns = self._pause_ns
+        if self.is_paused and self._paused_at_ns is not None:
+            pause_ns += end_ns - self._paused_at_ns
 
-        return total_seconds - self.total_pause_duration - current_pause_duration
+        return (end_ns - start_ns - pause_ns) / _NS_PER_SECOND
 
     def format_duration(self) -> str:
-        duration = self.get_duration()
-        hours = int(duration // 3600)
-        minutes = int((duration % 3600) // 60)
-        seconds = int(duration % 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return format_hms(self.get_duration())
 
     def __str__(self) -> str:
         return f"{self.task_name}: {self.format_duration()}"
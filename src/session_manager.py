@@ -1,17 +1,79 @@
-from typing import List, Optional
-from src.session import Session
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from src.interval_index import IntervalIndex, clip_intervals
+from src.journal import SessionJournal
+from src.rollups import Rollups
+from src.session import Session, datetime_to_wall_ns, wall_ns_to_datetime
+from src.session_table import SessionTable
+from src.session_store import SessionStore
+from src.task_registry import TaskRegistry
 
 
 class SessionManager:
-    def __init__(self) -> None:
+    def __init__(self, journal: Optional[SessionJournal] = None, store: Optional[SessionStore] = None) -> None:
         self.sessions: List[Session] = []
         self.current_session: Optional[Session] = None
+        self.journal: Optional[SessionJournal] = journal
+        self.store: Optional[SessionStore] = store
+        self._next_session_id: int = 0
+        self._closed_total: float = 0.0
+        self.task_registry: TaskRegistry = TaskRegistry()
+        self._task_totals: Dict[int, float] = {}
+        self._stored_names_loaded: bool = False
+        self.session_table: SessionTable = SessionTable()
+        self.interval_index: IntervalIndex = IntervalIndex()
+        self._frozen_count: int = 0
+        self._rollups: Optional[Rollups] = None
+
+        if self.journal:
+            self._restore_from_journal(self.journal)
+
+    def _restore_from_journal(self, journal: SessionJournal) -> None:
+        # Only today and a still-open session come back; older days are read from the store on demand.
+        day_start_ns = datetime_to_wall_ns(datetime.combine(date.today(), datetime.min.time()))
+        last_saved_end = self.store.get_last_saved_end_time() if self.store else None
+        since_ns = day_start_ns
+        if self.store:
+            since_ns = 0 if last_saved_end is None else min(day_start_ns, int(last_saved_end * 1_000_000_000))
+        replayed = journal.replay(since_ns)
+
+        if self.store:
+            # Sessions are saved in the order they stop, so anything ending after the last saved one was lost
+            # between the journal write and the save (or predates the store) and is saved now.
+            self.store.save_sessions(
+                session
+                for session in replayed
+                if not session.is_running
+                and (last_saved_end is None or (session.end_wall_ns or 0) / 1_000_000_000 > last_saved_end + 0.001)
+            )
+
+        self.sessions = [
+            session for session in replayed if session.is_running or (session.end_wall_ns or 0) >= day_start_ns
+        ]
+        if self.store and (journal.skipped_sessions or len(self.sessions) < len(replayed)):
+            # Everything dropped is in the store now, so the journal only needs to cover today.
+            journal.compact(session.session_id for session in self.sessions if session.session_id is not None)
+
+        for position, session in enumerate(self.sessions):
+            session.journal = journal
+            self._intern_task(session)
+            if not session.is_running:
+                self._add_to_totals(session)
+                self.interval_index.add_all(session.get_active_intervals_ns(), position)
+
+        self._next_session_id = journal.next_session_id
+        if self.sessions and self.sessions[-1].is_running:
+            self.current_session = self.sessions[-1]
 
     def start_session(self, task_name: str) -> Session:
         if self.current_session and self.current_session.is_running:
-            self.current_session.stop()
+            self._stop_session(self.current_session)
 
         new_session = Session(task_name)
+        self._intern_task(new_session)
+        new_session.session_id = self._next_session_id
+        new_session.journal = self.journal
+        self._next_session_id += 1
         new_session.start()
         self.sessions.append(new_session)
         self.current_session = new_session
@@ -19,19 +81,213 @@ class SessionManager:
 
     def stop_current_session(self) -> None:
         if self.current_session and self.current_session.is_running:
-            self.current_session.stop()
+            self._stop_session(self.current_session)
             self.current_session = None
 
-    def get_all_sessions(self) -> List[Session]:
-        return self.sessions.copy()
+    def _stop_session(self, session: Session) -> None:
+        session.stop()
+        self._add_to_totals(session)
+        if self._rollups is not None:
+            self._rollups.add_session(session)
+        # The manager only ever stops its current session, which is always the last one started.
+        self.interval_index.add_all(session.get_active_intervals_ns(), len(self.sessions) - 1)
+        if self.store:
+            self.store.save_session(session)
+
+    def _intern_task(self, session: Session) -> None:
+        # Variants of a name ("ＡＰＩ実装" / "API実装 ") share one id and one display string.
+        task_id = session.task_id = self.task_registry.intern(session.task_name)
+        session.task_name = self.task_registry.name(task_id)
+        self.task_registry.record_use(task_id, used_at=session.start_time.timestamp() if session.start_time else None)
+
+    def _add_to_totals(self, session: Session) -> None:
+        duration = session.get_duration()
+        self._closed_total += duration
+        task_id = session.task_id if session.task_id is not None else self.task_registry.intern(session.task_name)
+        self._task_totals[task_id] = self._task_totals.get(task_id, 0.0) + duration
+
+    def _live_session(self) -> Optional[Session]:
+        if self.current_session and self.current_session.is_running:
+            return self.current_session
+        return None
+
+    def get_all_sessions(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        task_name: Optional[str] = None,
+    ) -> List[Session]:
+        if start is None and end is None and task_name is None:
+            return self.sessions.copy()
+
+        sessions = self.get_completed_sessions(start, end, task_name)
+        if self.current_session and self._matches(self.current_session, start, end, task_name):
+            sessions.append(self.current_session)
+        return sessions
+
+    def get_completed_sessions(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        task_name: Optional[str] = None,
+    ) -> List[Session]:
+        if self.store and (start is not None or end is not None or task_name is not None):
+            return self.store.get_sessions(start, end, task_name)
+
+        return [
+            session
+            for session in self.sessions
+            if not session.is_running and self._matches(session, start, end, task_name)
+        ]
+
+    def get_total_time(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        task_name: Optional[str] = None,
+    ) -> float:
+        if start is None and end is None and task_name is None:
+            live_session = self._live_session()
+            return self._closed_total + (live_session.get_duration() if live_session else 0.0)
+
+        if not self.store:
+            return sum(session.get_duration() for session in self.get_all_sessions(start, end, task_name))
 
-    def get_completed_sessions(self) -> List[Session]:
-        return [session for session in self.sessions if not session.is_running]
+        total_time = self.store.get_total_time(start, end, task_name)
+        if self.current_session and self._matches(self.current_session, start, end, task_name):
+            total_time += self.current_session.get_duration()
+        return total_time
 
-    def get_total_time(self) -> float:
-        return sum(session.get_duration() for session in self.sessions)
+    def get_task_totals(self) -> Dict[str, float]:
+        names = self.task_registry.names
+        task_totals = {names[task_id]: total for task_id, total in self._task_totals.items()}
+        live_session = self._live_session()
+        if live_session:
+            task_totals[live_session.task_name] = (
+                task_totals.get(live_session.task_name, 0.0) + live_session.get_duration()
+            )
+        return task_totals
+
+    def get_task_total(self, task_name: str) -> float:
+        task_id = self.task_registry.lookup(task_name)
+        if task_id is None:
+            return 0.0
+        total_time = self._task_totals.get(task_id, 0.0)
+        live_session = self._live_session()
+        if live_session and live_session.task_id == task_id:
+            total_time += live_session.get_duration()
+        return total_time
+
+    def complete_task_name(self, text: str, limit: int = 10) -> List[str]:
+        self._load_stored_task_names()
+        return self.task_registry.complete(text, limit)
+
+    def search_tasks(self, text: str, limit: int = 10) -> List[str]:
+        self._load_stored_task_names()
+        return self.task_registry.search(text, limit)
+
+    def _load_stored_task_names(self) -> None:
+        if self.store and not self._stored_names_loaded:
+            # Past task names are only read once someone actually starts typing.
+            self._stored_names_loaded = True
+            # Closed sessions held here are already in the store's counts, so they are taken back out once.
+            saved_uses: Dict[int, int] = {}
+            for session in self.sessions:
+                if not session.is_running and session.task_id is not None:
+                    saved_uses[session.task_id] = saved_uses.get(session.task_id, 0) + 1
+            for task_name, count, last_used in self.store.iter_task_usage():
+                task_id = self.task_registry.intern(task_name)
+                self.task_registry.record_use(task_id, count - saved_uses.pop(task_id, 0), last_used)
+
+    def get_day_total(self, day: date) -> float:
+        # One definition of a day's work: time inside the day's window, so sessions past midnight are split.
+        day_start = datetime.combine(day, datetime.min.time())
+        return self.get_worked_time_between(day_start, day_start + timedelta(days=1))
+
+    def get_worked_time_between(self, start: datetime, end: datetime) -> float:
+        window_start_ns = datetime_to_wall_ns(start)
+        window_end_ns = datetime_to_wall_ns(end)
+        worked_ns = self.interval_index.total_between(window_start_ns, window_end_ns)
+
+        live_session = self._live_session()
+        if live_session:
+            for interval_start, interval_end in clip_intervals(
+                live_session.get_active_intervals_ns(), window_start_ns, window_end_ns
+            ):
+                worked_ns += interval_end - interval_start
+        return worked_ns / 1_000_000_000
+
+    def get_intervals_between(self, start: datetime, end: datetime) -> List[Tuple[Session, datetime, datetime]]:
+        window_start_ns = datetime_to_wall_ns(start)
+        window_end_ns = datetime_to_wall_ns(end)
+        intervals = [
+            (self.sessions[owner], wall_ns_to_datetime(interval_start), wall_ns_to_datetime(interval_end))
+            for owner, interval_start, interval_end in self.interval_index.overlapping(window_start_ns, window_end_ns)
+        ]
+
+        live_session = self._live_session()
+        if live_session:
+            for interval_start, interval_end in clip_intervals(
+                live_session.get_active_intervals_ns(), window_start_ns, window_end_ns
+            ):
+                intervals.append((live_session, wall_ns_to_datetime(interval_start), wall_ns_to_datetime(interval_end)))
+        return intervals
+
+    def get_daily_worked_time(self, first_day: date, last_day: date) -> Dict[date, float]:
+        daily: Dict[date, float] = {}
+        day = first_day
+        while day <= last_day:
+            daily[day] = self.get_day_total(day)
+            day += timedelta(days=1)
+        return daily
+
+    @property
+    def rollups(self) -> Rollups:
+        if self._rollups is None:
+            self._rollups = Rollups()
+            self.rebuild_rollups()
+        return self._rollups
+
+    def rebuild_rollups(self) -> Rollups:
+        if self._rollups is None:
+            self._rollups = Rollups()
+        if self.store:
+            self._rollups.rebuild(self.store.iter_daily_task_totals())
+        else:
+            self._rollups.rebuild_from_sessions(self.sessions)
+        return self._rollups
+
+    def freeze_completed_sessions(self) -> SessionTable:
+        index = self._frozen_count
+        while index < len(self.sessions) and not self.sessions[index].is_running:
+            self.session_table.append(self.sessions[index])
+            index += 1
+        self._frozen_count = index
+        return self.session_table
+
+    def _matches(
+        self, session: Session, start: Optional[datetime], end: Optional[datetime], task_name: Optional[str]
+    ) -> bool:
+        if task_name is not None and session.task_name != task_name:
+            return False
+        if session.start_time is None:
+            return start is None and end is None
+        if start is not None and session.start_time < start:
+            return False
+        if end is not None and session.start_time >= end:
+            return False
+        return True
 
     def stop_all_sessions(self) -> None:
         if self.current_session and self.current_session.is_running:
-            self.current_session.stop()
-        self.current_session = None
\ No newline at end of file
+            self._stop_session(self.current_session)
+        self.current_session = None
+
+        if self.journal:
+            self.journal.sync()
+
+    def close(self) -> None:
+        if self.journal:
+            self.journal.close()
+        if self.store:
+            self.store.close()
@@ -0,0 +1,184 @@
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.rollups import session_day_totals
+from src.session import Session
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    task_name TEXT NOT NULL,
+    start_time REAL NOT NULL,
+    end_time REAL NOT NULL,
+    pause_duration REAL NOT NULL DEFAULT 0,
+    pause_marks TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_start_time ON sessions (start_time);
+CREATE INDEX IF NOT EXISTS idx_sessions_task_name ON sessions (task_name, start_time);
+"""
+
+_NS_PER_SECOND = 1_000_000_000
+
+_INSERT_SESSION = (
+    "INSERT INTO sessions (task_name, start_time, end_time, pause_duration, pause_marks) VALUES (?, ?, ?, ?, ?)"
+)
+_SELECT_SESSIONS = "SELECT task_name, start_time, end_time, pause_duration, pause_marks FROM sessions"
+_SELECT_TOTAL = "SELECT COALESCE(SUM(end_time - start_time - pause_duration), 0.0) FROM sessions"
+_SELECT_COUNT = "SELECT COUNT(*) FROM sessions"
+_SELECT_LAST_SAVED_END = "SELECT end_time FROM sessions ORDER BY id DESC LIMIT 1"
+_SELECT_TASK_USAGE = "SELECT task_name, COUNT(*), MAX(start_time) FROM sessions GROUP BY task_name"
+_SAME_DAY = "date(start_time, 'unixepoch', 'localtime') = date(end_time, 'unixepoch', 'localtime')"
+_SELECT_DAILY_TASK_TOTALS = (
+    "SELECT task_name, date(start_time, 'unixepoch', 'localtime') AS day,"
+    f" SUM(end_time - start_time - pause_duration), COUNT(*) FROM sessions WHERE {_SAME_DAY}"
+    " GROUP BY day, task_name ORDER BY day"
+)
+_SELECT_SESSIONS_OVER_MIDNIGHT = f"{_SELECT_SESSIONS} WHERE NOT {_SAME_DAY}"
+_SELECT_PAGE = "SELECT task_name, start_time, end_time, pause_duration, pause_marks, id FROM sessions"
+
+PageCursor = Tuple[float, int]
+
+
+class SessionStore:
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        self.path: str = str(path)
+        self.connection: sqlite3.Connection = sqlite3.connect(self.path, cached_statements=64)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(sessions)")}
+        if "pause_marks" not in columns:
+            self.connection.execute("ALTER TABLE sessions ADD COLUMN pause_marks TEXT NOT NULL DEFAULT ''")
+            self.connection.commit()
+
+    def save_session(self, session: Session) -> int:
+        cursor = self.connection.execute(_INSERT_SESSION, self._session_to_row(session))
+        self.connection.commit()
+        return cursor.lastrowid or 0
+
+    def save_sessions(self, sessions: Iterable[Session]) -> None:
+        self.connection.executemany(_INSERT_SESSION, (self._session_to_row(session) for session in sessions))
+        self.connection.commit()
+
+    def get_last_saved_end_time(self) -> Optional[float]:
+        row = self.connection.execute(_SELECT_LAST_SAVED_END).fetchone()
+        return None if row is None else float(row[0])
+
+    def get_sessions(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        task_name: Optional[str] = None,
+    ) -> List[Session]:
+        return list(self.iter_sessions(start, end, task_name))
+
+    def iter_sessions(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        task_name: Optional[str] = None,
+    ) -> Iterator[Session]:
+        where, params = self._build_filter(start, end, task_name)
+        cursor = self.connection.execute(f"{_SELECT_SESSIONS}{where} ORDER BY start_time", params)
+        for row in cursor:
+            yield self._row_to_session(row)
+
+    def get_session_page(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        after: Optional[PageCursor] = None,
+        limit: int = 200,
+    ) -> Tuple[List[Session], Optional[PageCursor]]:
+        where, params = self._build_filter(start, end, None)
+        if after is not None:
+            # Keyset pagination: the index on start_time seeks straight to the cursor instead of skipping OFFSET rows.
+            where += " AND " if where else " WHERE "
+            where += "(start_time, id) > (?, ?)"
+            params += after
+        rows = self.connection.execute(
+            f"{_SELECT_PAGE}{where} ORDER BY start_time, id LIMIT ?", params + (limit,)
+        ).fetchall()
+
+        sessions = [self._row_to_session(row[:5]) for row in rows]
+        cursor = (rows[-1][1], rows[-1][5]) if len(rows) == limit else None
+        return sessions, cursor
+
+    def get_total_time(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        task_name: Optional[str] = None,
+    ) -> float:
+        where, params = self._build_filter(start, end, task_name)
+        return float(self.connection.execute(f"{_SELECT_TOTAL}{where}", params).fetchone()[0])
+
+    def count_sessions(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        task_name: Optional[str] = None,
+    ) -> int:
+        where, params = self._build_filter(start, end, task_name)
+        return int(self.connection.execute(f"{_SELECT_COUNT}{where}", params).fetchone()[0])
+
+    def iter_task_usage(self) -> Iterator[Tuple[str, int, float]]:
+        for task_name, session_count, last_start in self.connection.execute(_SELECT_TASK_USAGE):
+            yield task_name, int(session_count), float(last_start)
+
+    def iter_daily_task_totals(self) -> Iterator[Tuple[str, date, float, int]]:
+        # SQLite folds the raw rows into one row per task and day, so only the aggregates cross into Python.
+        for task_name, day, duration, session_count in self.connection.execute(_SELECT_DAILY_TASK_TOTALS):
+            yield task_name, date.fromisoformat(day), float(duration), int(session_count)
+        # The few sessions that run past midnight are split in Python, where their pause marks can be read.
+        for row in self.connection.execute(_SELECT_SESSIONS_OVER_MIDNIGHT):
+            yield from session_day_totals(self._row_to_session(row))
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _build_filter(
+        self, start: Optional[datetime], end: Optional[datetime], task_name: Optional[str]
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        conditions: List[str] = []
+        params: List[Any] = []
+
+        if task_name is not None:
+            conditions.append("task_name = ?")
+            params.append(task_name)
+        if start is not None:
+            conditions.append("start_time >= ?")
+            params.append(start.timestamp())
+        if end is not None:
+            conditions.append("start_time < ?")
+            params.append(end.timestamp())
+
+        if not conditions:
+            return "", ()
+        return " WHERE " + " AND ".join(conditions), tuple(params)
+
+    def _session_to_row(self, session: Session) -> Tuple[str, float, float, float, str]:
+        if session.start_wall_ns is None or session.end_wall_ns is None:
+            raise ValueError("Only completed sessions can be stored")
+        return (
+            session.task_name,
+            session.start_wall_ns / _NS_PER_SECOND,
+            session.end_wall_ns / _NS_PER_SECOND,
+            session.pause_ns / _NS_PER_SECOND,
+            ",".join(str(mark // 1000) for mark in session.pause_marks_wall_ns),
+        )
+
+    def _row_to_session(self, row: Tuple[str, float, float, float, str]) -> Session:
+        task_name, start_time, end_time, pause_duration, pause_marks = row
+        return Session.from_record(
+            task_name,
+            round(start_time * 1_000_000) * 1000,
+            round(end_time * 1_000_000) * 1000,
+            round(pause_duration * _NS_PER_SECOND),
+            pause_marks=[int(mark) * 1000 for mark in pause_marks.split(",")] if pause_marks else None,
+        )
@@ -0,0 +1,85 @@
+from array import array
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple
+
+from src.session import Session
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class SessionTable:
+    def __init__(self) -> None:
+        self.start_ns: array = array("q")
+        self.end_ns: array = array("q")
+        self.pause_seconds: array = array("d")
+        self.task_ids: array = array("l")
+        self.task_names: List[str] = []
+        self._task_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+    def task_id(self, task_name: str) -> int:
+        task_id = self._task_index.get(task_name)
+        if task_id is None:
+            task_id = self._task_index[task_name] = len(self.task_names)
+            self.task_names.append(task_name)
+        return task_id
+
+    def append(self, session: Session) -> None:
+        if session.is_running or session.start_wall_ns is None or session.end_wall_ns is None:
+            raise ValueError("Only completed sessions can be frozen")
+
+        self.start_ns.append(session.start_wall_ns)
+        self.end_ns.append(session.end_wall_ns)
+        self.pause_seconds.append(session.total_pause_duration)
+        self.task_ids.append(self.task_id(session.task_name))
+
+    def extend(self, sessions: Iterable[Session]) -> None:
+        for session in sessions:
+            self.append(session)
+
+    def durations(self) -> array:
+        return array(
+            "d",
+            [
+                (end - start) / _NS_PER_SECOND - pause
+                for start, end, pause in zip(self.start_ns, self.end_ns, self.pause_seconds)
+            ],
+        )
+
+    def total_duration(self) -> float:
+        return (sum(self.end_ns) - sum(self.start_ns)) / _NS_PER_SECOND - sum(self.pause_seconds)
+
+    def totals_by_task(self) -> Dict[str, float]:
+        totals = [0.0] * len(self.task_names)
+        for task_id, duration in zip(self.task_ids, self.durations()):
+            totals[task_id] += duration
+        return {task_name: totals[task_id] for task_id, task_name in enumerate(self.task_names) if totals[task_id]}
+
+    def totals_by_day(self) -> Dict[date, float]:
+        totals: Dict[date, float] = {}
+        day_start_ns = day_end_ns = 0
+        day = date.min
+
+        for start, duration in zip(self.start_ns, self.durations()):
+            if not day_start_ns <= start < day_end_ns:
+                day = datetime.fromtimestamp(start // _NS_PER_SECOND).date()
+                day_start = datetime.combine(day, time.min)
+                day_start_ns = int(day_start.timestamp()) * _NS_PER_SECOND
+                day_end_ns = int((day_start + timedelta(days=1)).timestamp()) * _NS_PER_SECOND
+            totals[day] = totals.get(day, 0.0) + duration
+
+        return totals
+
+    def totals_by_category(self, categories: Mapping[str, str], default: str = "その他") -> Dict[str, float]:
+        totals: Dict[str, float] = {}
+        for task_name, duration in self.totals_by_task().items():
+            category = categories.get(task_name, default)
+            totals[category] = totals.get(category, 0.0) + duration
+        return totals
+
+    def rows(self) -> Iterator[Tuple[str, int, int, float]]:
+        task_names = self.task_names
+        for task_id, start, end, duration in zip(self.task_ids, self.start_ns, self.end_ns, self.durations()):
+            yield task_names[task_id], start, end, duration
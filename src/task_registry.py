@@ -0,0 +1,149 @@
+import heapq
+import math
+import re
+import sys
+import time
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.utils.task_names import normalize_task_name
+
+_MAX_CHAR = chr(sys.maxunicode)
+RECENCY_HALF_LIFE = 7 * 24 * 60 * 60
+_LEADER_COUNT = 50
+
+
+def _grams(normalized_name: str) -> Set[str]:
+    # Bigrams rather than trigrams: many Japanese task words are only two characters long.
+    # Single characters are indexed too; they narrow fuzzy subsequence candidates.
+    grams = set(normalized_name)
+    grams.update(normalized_name[i : i + 2] for i in range(len(normalized_name) - 1))
+    return grams
+
+
+class TaskRegistry:
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.use_counts: List[int] = []
+        self.last_used: List[float] = []
+        self._scores: List[float] = []
+        self._leaders: List[int] = []
+        self._ids: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._sorted_keys: List[Tuple[str, int]] = []
+        self._gram_index: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, task_name: object) -> bool:
+        return isinstance(task_name, str) and normalize_task_name(task_name) in self._ids
+
+    def intern(self, task_name: str) -> int:
+        key = normalize_task_name(task_name)
+        task_id = self._ids.get(key)
+        if task_id is not None:
+            return task_id
+
+        # The first spelling seen becomes the display name every later variant resolves to.
+        task_id = self._ids[key] = len(self.names)
+        self.names.append(sys.intern(task_name.strip()))
+        self.use_counts.append(0)
+        self.last_used.append(0.0)
+        self._scores.append(-math.inf)
+        self._keys.append(key)
+        insort(self._sorted_keys, (key, task_id))
+        for gram in _grams(key):
+            self._gram_index.setdefault(gram, set()).add(task_id)
+        return task_id
+
+    def lookup(self, task_name: str) -> Optional[int]:
+        return self._ids.get(normalize_task_name(task_name))
+
+    def name(self, task_id: int) -> str:
+        return self.names[task_id]
+
+    def record_use(self, task_id: int, count: int = 1, used_at: Optional[float] = None) -> None:
+        self.use_counts[task_id] += count
+        used_at = time.time() if used_at is None else used_at
+        if used_at > self.last_used[task_id]:
+            self.last_used[task_id] = used_at
+        # count * 0.5 ** (age / half-life) decays at the same rate for every task, so its log order
+        # never changes with the clock and can be stored instead of recomputed per query.
+        self._scores[task_id] = math.log2(self.use_counts[task_id]) + self.last_used[task_id] / RECENCY_HALF_LIFE
+        self._update_leaders(task_id)
+
+    def _update_leaders(self, task_id: int) -> None:
+        # Scores only ever rise, so a task can only enter the leaders through its own use and the list stays exact.
+        leaders = self._leaders
+        scores = self._scores
+        if task_id not in leaders:
+            if len(leaders) >= _LEADER_COUNT and scores[task_id] <= scores[leaders[-1]]:
+                return
+            leaders.append(task_id)
+        leaders.sort(key=scores.__getitem__, reverse=True)
+        del leaders[_LEADER_COUNT:]
+
+    def register_all(self, task_usage: Iterable[Tuple[str, int, float]]) -> None:
+        for task_name, count, last_used in task_usage:
+            self.record_use(self.intern(task_name), count, last_used)
+
+    def complete(self, text: str, limit: int = 10) -> List[str]:
+        query = normalize_task_name(text)
+        if not query:
+            return []
+        return [self.names[task_id] for task_id in self._match_ids(query, limit, fuzzy=False)]
+
+    def search(self, text: str, limit: int = 10) -> List[str]:
+        query = normalize_task_name(text)
+        if not query:
+            top_ids = self._leaders if limit <= _LEADER_COUNT else self._rank(range(len(self.names)), limit)
+            return [self.names[task_id] for task_id in top_ids[:limit] if self.use_counts[task_id]]
+        return [self.names[task_id] for task_id in self._match_ids(query, limit, fuzzy=True)]
+
+    def _match_ids(self, query: str, limit: int, fuzzy: bool) -> List[int]:
+        # Tiers (prefix, substring, subsequence) are only searched while the results are still short.
+        first = bisect_left(self._sorted_keys, (query, -1))
+        last = bisect_left(self._sorted_keys, (query + _MAX_CHAR, -1), first)
+        seen = {task_id for _, task_id in self._sorted_keys[first:last]}
+        ranked = self._rank(seen, limit)
+
+        if len(ranked) < limit:
+            substring_ids = [task_id for task_id in self._substring_ids(query) if task_id not in seen]
+            seen.update(substring_ids)
+            ranked += self._rank(substring_ids, limit - len(ranked))
+
+        if fuzzy and len(ranked) < limit:
+            ranked += self._subsequence_ids(query.replace(" ", ""), seen, limit - len(ranked))
+        return ranked
+
+    def _subsequence_ids(self, chars: str, exclude: Set[int], limit: int) -> List[int]:
+        if len(chars) < 2:
+            return []
+
+        candidates = self._candidates(set(chars)) - exclude
+        pattern = re.compile(".*?".join(map(re.escape, chars)))
+        gaps: Dict[int, int] = {}
+        for task_id in candidates:
+            match = pattern.search(self._keys[task_id])
+            if match:
+                gaps[task_id] = match.end() - match.start() - len(chars)
+        # Tighter matches win first; frecency only orders matches that are equally scattered.
+        scores = self._scores
+        return heapq.nsmallest(limit, gaps, key=lambda task_id: (gaps[task_id], -scores[task_id]))
+
+    def _substring_ids(self, query: str) -> List[int]:
+        # One- and two-character queries are index keys themselves, so their postings need no checking.
+        if len(query) <= 2:
+            return list(self._gram_index.get(query, ()))
+
+        # Sharing every bigram is necessary but not sufficient, so the candidates are confirmed against the key.
+        candidates = self._candidates({query[i : i + 2] for i in range(len(query) - 1)})
+        return [task_id for task_id in candidates if query in self._keys[task_id]]
+
+    def _candidates(self, grams: Set[str]) -> Set[int]:
+        postings = sorted((self._gram_index.get(gram, set()) for gram in grams), key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def _rank(self, task_ids: Iterable[int], limit: int) -> List[int]:
+        return heapq.nlargest(limit, task_ids, key=self._scores.__getitem__)
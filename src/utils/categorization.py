@@ -1,4 +1,6 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping
+from src.rollups import Rollup
+from src.session_table import SessionTable
 
 
 class CategoryCalculator:
@@ -7,22 +9,21 @@ class CategoryCalculator:
             raise KeyError("Missing 'categories' key in response")
 
         processed_categories: List[Dict[str, Any]] = []
+        append_category = processed_categories.append
 
         for category in gemini_response["categories"]:
             if "name" not in category or "tasks" not in category:
                 raise KeyError("Missing required fields in category")
 
-            category_name = category["name"]
             tasks = category["tasks"]
-
+            # Validation and summing share one pass; the task dicts themselves are passed through untouched.
+            calculated_total = 0.0
             for task in tasks:
                 if "name" not in task or "duration" not in task:
                     raise KeyError("Missing required fields in task")
+                calculated_total += task["duration"]
 
-            calculated_total = sum(task["duration"] for task in tasks)
-
-            processed_category = {"name": category_name, "tasks": tasks, "total_duration": calculated_total}
-            processed_categories.append(processed_category)
+            append_category({"name": category["name"], "tasks": tasks, "total_duration": calculated_total})
 
         return {"categories": processed_categories}
 
@@ -36,3 +37,28 @@ class CategoryCalculator:
                 total_time += category["total_duration"]
 
         return total_time
+
+    def calculate_category_totals_from_table(
+        self, table: SessionTable, task_categories: Mapping[str, str], default_category: str = "その他"
+    ) -> Dict[str, Any]:
+        return self.build_category_totals(table.totals_by_task(), task_categories, default_category)
+
+    def calculate_category_totals_from_rollup(
+        self, rollup: Rollup, task_categories: Mapping[str, str], default_category: str = "その他"
+    ) -> Dict[str, Any]:
+        return self.build_category_totals(rollup.task_totals, task_categories, default_category)
+
+    def build_category_totals(
+        self, task_durations: Mapping[str, float], task_categories: Mapping[str, str], default_category: str = "その他"
+    ) -> Dict[str, Any]:
+        categories: Dict[str, Dict[str, Any]] = {}
+        for task_name, duration in task_durations.items():
+            category_name = task_categories.get(task_name, default_category)
+            category = categories.get(category_name)
+            if category is None:
+                category = categories[category_name] = {"name": category_name, "tasks": [], "total_duration": 0.0}
+            category["tasks"].append({"name": task_name, "duration": duration})
+            category["total_duration"] += duration
+
+        # The tasks were built here, so they do not need to go through calculate_category_totals' validation.
+        return {"categories": list(categories.values())}
@@ -1,17 +1,99 @@
+import shutil
+import subprocess
 import tkinter as tk
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+
+_CLIPBOARD_COMMANDS: List[List[str]] = [
+    ["wl-copy"],
+    ["xclip", "-selection", "clipboard"],
+    ["xsel", "--clipboard", "--input"],
+    ["pbcopy"],
+    ["clip.exe"],
+]
+
+
+class ClipboardBackend(ABC):
+    @abstractmethod
+    def copy(self, text: str) -> None:
+        pass
+
+
+class TkClipboardBackend(ClipboardBackend):
+    def __init__(self, root: tk.Misc) -> None:
+        self.root: tk.Misc = root
+
+    def copy(self, text: str) -> None:
+        # The app's root owns the selection for as long as it lives, so there is no update() round trip to wait on
+        # and the contents survive until the next copy.
+        self.root.clipboard_clear()
+        self.root.clipboard_append(text)
+
+
+class TemporaryTkClipboardBackend(ClipboardBackend):
+    def copy(self, text: str) -> None:
+        root = tk.Tk()
+        root.withdraw()
+
+        root.clipboard_clear()
+        root.clipboard_append(text)
+        root.update()
+        root.destroy()
+
+
+class CommandClipboardBackend(ClipboardBackend):
+    def __init__(self, command: Sequence[str], timeout: float = 5.0) -> None:
+        self.command: List[str] = list(command)
+        self.timeout: float = timeout
+
+    @classmethod
+    def detect(cls) -> Optional["CommandClipboardBackend"]:
+        for command in _CLIPBOARD_COMMANDS:
+            if shutil.which(command[0]):
+                return cls(command)
+        return None
+
+    def copy(self, text: str) -> None:
+        subprocess.run(self.command, input=text.encode("utf-8"), check=True, timeout=self.timeout)
+
+
+class MemoryClipboardBackend(ClipboardBackend):
+    def __init__(self) -> None:
+        self.text: Optional[str] = None
+
+    def copy(self, text: str) -> None:
+        self.text = text
 
 
 class ClipboardManager:
+    def __init__(
+        self,
+        root: Optional[tk.Misc] = None,
+        backend: Optional[ClipboardBackend] = None,
+        fallback: Optional[ClipboardBackend] = None,
+        detect_fallback: bool = False,
+    ) -> None:
+        if backend is None:
+            backend = TkClipboardBackend(root) if root is not None else TemporaryTkClipboardBackend()
+        self.backend: ClipboardBackend = backend
+        self.fallback: Optional[ClipboardBackend] = fallback
+        self._detect_fallback: bool = detect_fallback and fallback is None
+
     def copy_to_clipboard(self, text: str) -> bool:
         try:
-            root = tk.Tk()
-            root.withdraw()
-            
-            root.clipboard_clear()
-            root.clipboard_append(text)
-            root.update()
-            root.destroy()
-            
+            self.backend.copy(text)
+            return True
+        except Exception:
+            pass
+
+        if self._detect_fallback:
+            # Searching PATH is only worth it once Tk has actually failed, e.g. without a display.
+            self._detect_fallback = False
+            self.fallback = CommandClipboardBackend.detect()
+        if self.fallback is None:
+            return False
+        try:
+            self.fallback.copy(text)
             return True
         except Exception:
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,8 @@
+import os
+from pathlib import Path
+
+
+def get_data_dir() -> Path:
+    data_dir = Path(os.getenv("TASK_TRACKER_DATA_DIR", str(Path.home() / ".task-tracker-llm")))
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
@@ -0,0 +1,77 @@
+import math
+from functools import lru_cache
+from typing import Dict, Tuple
+
+HMS = "hms"
+DECIMAL_HOURS = "decimal_hours"
+ISO_8601 = "iso8601"
+LOCALIZED = "localized"
+
+_LOCALE_UNITS: Dict[str, Tuple[str, str, str, str]] = {
+    "ja": ("時間", "分", "秒", ""),
+    "en": ("h", "m", "s", " "),
+}
+
+
+def _split(total_seconds: int) -> Tuple[int, int, int]:
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return hours, minutes, seconds
+
+
+# Every visible row is re-rendered on each tick, and most of them show a value that has not changed since the last one.
+@lru_cache(maxsize=4096)
+def _format_hms(total_seconds: int) -> str:
+    hours, minutes, seconds = _split(total_seconds)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def format_hms(duration: float) -> str:
+    return _format_hms(math.floor(duration))
+
+
+def format_decimal_hours(duration: float, places: int = 2) -> str:
+    return f"{duration / 3600:.{places}f}"
+
+
+@lru_cache(maxsize=1024)
+def _format_iso8601(total_seconds: int) -> str:
+    if total_seconds <= 0:
+        return "PT0S"
+    hours, minutes, seconds = _split(total_seconds)
+    parts = [f"{value}{unit}" for value, unit in ((hours, "H"), (minutes, "M"), (seconds, "S")) if value]
+    return "PT" + "".join(parts)
+
+
+def format_iso8601(duration: float) -> str:
+    return _format_iso8601(math.floor(duration))
+
+
+@lru_cache(maxsize=1024)
+def _format_localized(total_seconds: int, locale: str) -> str:
+    hour_unit, minute_unit, second_unit, separator = _LOCALE_UNITS.get(locale, _LOCALE_UNITS["ja"])
+    hours, minutes, seconds = _split(max(total_seconds, 0))
+    parts = []
+    if hours:
+        parts.append(f"{hours}{hour_unit}")
+    if minutes:
+        parts.append(f"{minutes}{minute_unit}")
+    if seconds or not parts:
+        parts.append(f"{seconds}{second_unit}")
+    return separator.join(parts)
+
+
+def format_localized(duration: float, locale: str = "ja") -> str:
+    return _format_localized(math.floor(duration), locale)
+
+
+def format_duration(duration: float, style: str = HMS, locale: str = "ja") -> str:
+    if style == HMS:
+        return format_hms(duration)
+    if style == DECIMAL_HOURS:
+        return format_decimal_hours(duration)
+    if style == ISO_8601:
+        return format_iso8601(duration)
+    if style == LOCALIZED:
+        return format_localized(duration, locale)
+    raise ValueError(f"Unknown duration format: {style}")
@@ -0,0 +1,158 @@
+import math
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from src.utils.task_names import normalize_task_name
+
+DEFAULT_CATEGORY = "その他"
+
+DEFAULT_CATEGORY_RULES: Dict[str, List[str]] = {
+    "開発": ["実装", "コード", "プログラミング", "開発", "バグ修正", "フロントエンド", "バックエンド"],
+    "設計・デザイン": ["設計", "デザイン", "UI", "UX", "画面", "レイアウト"],
+    "テスト・検証": ["テスト", "検証", "確認", "デバッグ"],
+}
+
+Classification = Tuple[Optional[str], float]
+
+_ASCII_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _keyword_pattern(keyword: str) -> str:
+    # ASCII keywords such as "ui" must stand alone, or "build" and "linux" would count as design work.
+    if _ASCII_WORD.fullmatch(keyword):
+        return rf"(?<![a-z0-9]){keyword}(?![a-z0-9])"
+    return re.escape(keyword)
+
+
+class RuleClassifier:
+    def __init__(self, rules: Mapping[str, Sequence[str]] = DEFAULT_CATEGORY_RULES) -> None:
+        self.categories: List[str] = list(rules)
+        self._group_categories: Dict[int, int] = {}
+        alternatives: List[str] = []
+        for category_index, keywords in enumerate(rules.values()):
+            keywords = sorted({normalize_task_name(keyword) for keyword in keywords if keyword}, key=len, reverse=True)
+            if not keywords:
+                continue
+            alternatives.append("(" + "|".join(_keyword_pattern(keyword) for keyword in keywords) + ")")
+            self._group_categories[len(alternatives)] = category_index
+        # One pass over the name finds every category keyword at once; lookahead keeps overlapping matches.
+        self._pattern: Optional[re.Pattern] = re.compile("(?=" + "|".join(alternatives) + ")") if alternatives else None
+
+    def classify(self, task_name: str) -> Classification:
+        if self._pattern is None:
+            return None, 0.0
+
+        matched = set()
+        for match in self._pattern.finditer(normalize_task_name(task_name)):
+            matched.add(self._group_categories[match.lastindex or 0])
+        if not matched:
+            return None, 0.0
+
+        # Rule order breaks ties; names that hit several categories are only half trusted.
+        return self.categories[min(matched)], 1.0 if len(matched) == 1 else 0.5
+
+
+class NearestNeighbourClassifier:
+    def __init__(self) -> None:
+        self._examples: Dict[str, str] = {}
+        self._categories: List[str] = []
+        self._idf: Dict[str, float] = {}
+        self._postings: Dict[str, List[Tuple[int, float]]] = {}
+        self._is_stale: bool = False
+
+    def __len__(self) -> int:
+        return len(self._examples)
+
+    def learn(self, task_categories: Mapping[str, str]) -> None:
+        for task_name, category in task_categories.items():
+            self._examples[normalize_task_name(task_name)] = category
+        self._is_stale = True
+
+    def classify(self, task_name: str) -> Classification:
+        if self._is_stale:
+            self._rebuild()
+        if not self._postings:
+            return None, 0.0
+
+        query = self._weigh(self._features(normalize_task_name(task_name)))
+        scores: Dict[int, float] = {}
+        for feature, weight in query.items():
+            for example_index, example_weight in self._postings.get(feature, ()):
+                scores[example_index] = scores.get(example_index, 0.0) + weight * example_weight
+        if not scores:
+            return None, 0.0
+
+        best_index = max(scores, key=scores.__getitem__)
+        return self._categories[best_index], min(scores[best_index], 1.0)
+
+    def _features(self, normalized_name: str) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        text = normalized_name.replace(" ", "")
+        grams = [text[i : i + 2] for i in range(len(text) - 1)] or [text]
+        for gram in grams:
+            counts[gram] = counts.get(gram, 0) + 1
+        return counts
+
+    def _weigh(self, counts: Mapping[str, int]) -> Dict[str, float]:
+        weights = {feature: count * self._idf[feature] for feature, count in counts.items() if feature in self._idf}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        if not norm:
+            return {}
+        return {feature: weight / norm for feature, weight in weights.items()}
+
+    def _rebuild(self) -> None:
+        example_features = [self._features(name) for name in self._examples]
+        self._categories = list(self._examples.values())
+
+        document_frequency: Dict[str, int] = {}
+        for counts in example_features:
+            for feature in counts:
+                document_frequency[feature] = document_frequency.get(feature, 0) + 1
+        example_count = len(example_features)
+        self._idf = {
+            feature: math.log((1 + example_count) / (1 + frequency)) + 1.0
+            for feature, frequency in document_frequency.items()
+        }
+
+        self._postings = {}
+        for example_index, counts in enumerate(example_features):
+            for feature, weight in self._weigh(counts).items():
+                self._postings.setdefault(feature, []).append((example_index, weight))
+        self._is_stale = False
+
+
+class LocalClassifier:
+    def __init__(
+        self,
+        rules: Mapping[str, Sequence[str]] = DEFAULT_CATEGORY_RULES,
+        model: Optional[NearestNeighbourClassifier] = None,
+        min_confidence: float = 0.6,
+    ) -> None:
+        self.rules: RuleClassifier = RuleClassifier(rules)
+        self.model: Optional[NearestNeighbourClassifier] = model
+        self.min_confidence: float = min_confidence
+
+    def classify(self, task_name: str) -> Classification:
+        category, confidence = self.rules.classify(task_name)
+        if confidence >= self.min_confidence or self.model is None:
+            return category, confidence
+
+        model_category, model_confidence = self.model.classify(task_name)
+        if model_confidence > confidence:
+            return model_category, model_confidence
+        return category, confidence
+
+    def classify_many(self, task_names: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+        confident: Dict[str, str] = {}
+        uncertain: List[str] = []
+        for task_name in task_names:
+            category, confidence = self.classify(task_name)
+            if category is not None and confidence >= self.min_confidence:
+                confident[task_name] = category
+            else:
+                uncertain.append(task_name)
+        return confident, uncertain
+
+    def learn(self, task_categories: Mapping[str, str]) -> None:
+        if self.model is not None:
+            self.model.learn(task_categories)
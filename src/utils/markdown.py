@@ -1,43 +1,104 @@
 from datetime import datetime
-from typing import List
+from typing import Iterable, Iterator, Mapping, Optional, TextIO
+from src.rollups import DAY, Rollup, Rollups
 from src.session import Session
+from src.session_table import SessionTable
+from src.utils.duration_format import format_hms
 
 
 class MarkdownExporter:
-    def export_sessions(self, sessions: List[Session]) -> str:
-        if not sessions:
-            return "# 作業セッション記録\n\nセッションがありません。"
-        
-        lines = []
-        lines.append("# 作業セッション記録")
-        lines.append("")
-        lines.append(f"**生成日時:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-        lines.append("")
-        lines.append("## セッション一覧")
-        lines.append("")
-        lines.append("| # | タスク名 | 開始時刻 | 終了時刻 | 経過時間 |")
-        lines.append("|---|---|---|---|---|")
-        
+    def export_sessions(self, sessions: Iterable[Session]) -> str:
+        return "".join(self.iter_export_sessions(sessions))
+
+    def write_sessions(self, sessions: Iterable[Session], stream: TextIO) -> None:
+        for chunk in self.iter_export_sessions(sessions):
+            stream.write(chunk)
+
+    def iter_export_sessions(self, sessions: Iterable[Session]) -> Iterator[str]:
+        session_iter = iter(sessions)
+        session = next(session_iter, None)
+        if session is None:
+            yield "# 作業セッション記録\n\nセッションがありません。"
+            return
+
+        yield (
+            "# 作業セッション記録\n"
+            "\n"
+            f"**生成日時:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
+            "\n"
+            "## セッション一覧\n"
+            "\n"
+            "| # | タスク名 | 開始時刻 | 終了時刻 | 経過時間 |\n"
+            "|---|---|---|---|---|"
+        )
+
         total_duration = 0.0
-        
-        for i, session in enumerate(sessions, 1):
-            start_time = session.start_time.strftime('%H:%M:%S') if session.start_time else "未設定"
-            end_time = session.end_time.strftime('%H:%M:%S') if session.end_time else "未設定"
-            duration = session.format_duration()
-            total_duration += session.get_duration()
-            
-            lines.append(f"| {i} | {session.task_name} | {start_time} | {end_time} | {duration} |")
-        
-        lines.append("")
-        lines.append("## サマリー")
-        lines.append("")
-        
-        total_hours = int(total_duration // 3600)
-        total_minutes = int((total_duration % 3600) // 60)
-        total_seconds = int(total_duration % 60)
-        total_formatted = f"{total_hours:02d}:{total_minutes:02d}:{total_seconds:02d}"
-        
-        lines.append(f"**合計時間:** {total_formatted}")
-        lines.append(f"**セッション数:** {len(sessions)}")
-        
-        return "\n".join(lines)
\ No newline at end of file
+        session_count = 0
+        while session is not None:
+            session_count += 1
+            start_time = session.start_time
+            end_time = session.end_time
+            duration = session.get_duration()
+            total_duration += duration
+
+            yield (
+                f"\n| {session_count} | {session.task_name} "
+                f"| {start_time.strftime('%H:%M:%S') if start_time else '未設定'} "
+                f"| {end_time.strftime('%H:%M:%S') if end_time else '未設定'} "
+                f"| {self._format_seconds(duration)} |"
+            )
+            session = next(session_iter, None)
+
+        yield (
+            "\n\n## サマリー\n\n"
+            f"**合計時間:** {self._format_seconds(total_duration)}\n"
+            f"**セッション数:** {session_count}"
+        )
+
+    def export_table(self, table: SessionTable) -> str:
+        if not len(table):
+            return "# 作業時間集計\n\nセッションがありません。"
+
+        lines = ["# 作業時間集計", "", "## タスク別集計", "", "| タスク名 | 合計時間 |", "|---|---|"]
+        for task_name, duration in sorted(table.totals_by_task().items(), key=lambda item: -item[1]):
+            lines.append(f"| {task_name} | {self._format_seconds(duration)} |")
+
+        lines.extend(["", "## 日別集計", "", "| 日付 | 合計時間 |", "|---|---|"])
+        for day, duration in sorted(table.totals_by_day().items()):
+            lines.append(f"| {day.isoformat()} | {self._format_seconds(duration)} |")
+
+        lines.extend(["", "## サマリー", ""])
+        lines.append(f"**合計時間:** {self._format_seconds(table.total_duration())}")
+        lines.append(f"**セッション数:** {len(table)}")
+        return "\n".join(lines)
+
+    def export_rollup(
+        self, rollups: Rollups, rollup: Rollup, categories: Optional[Mapping[str, str]] = None, default: str = "その他"
+    ) -> str:
+        # A day can hold time from a session that started the evening before, so emptiness is judged by its tasks.
+        if not rollup.task_totals:
+            return f"# 作業時間集計 ({rollup.label})\n\nセッションがありません。"
+
+        # Everything below is read from the pre-aggregated buckets; no session is visited.
+        lines = [f"# 作業時間集計 ({rollup.label})", "", "## タスク別集計", "", "| タスク名 | 合計時間 |", "|---|---|"]
+        for task_name, duration in sorted(rollup.task_totals.items(), key=lambda item: -item[1]):
+            lines.append(f"| {task_name} | {self._format_seconds(duration)} |")
+
+        if categories is not None:
+            lines.extend(["", "## カテゴリ別集計", "", "| カテゴリ | 合計時間 |", "|---|---|"])
+            category_totals = rollup.totals_by_category(categories, default)
+            for category, duration in sorted(category_totals.items(), key=lambda item: -item[1]):
+                lines.append(f"| {category} | {self._format_seconds(duration)} |")
+
+        if rollup.period != DAY:
+            lines.extend(["", "## 日別集計", "", "| 日付 | 合計時間 |", "|---|---|"])
+            for day_rollup in rollups.days_in(rollup):
+                lines.append(f"| {day_rollup.label} | {self._format_seconds(day_rollup.total_duration)} |")
+
+        lines.extend(["", "## サマリー", ""])
+        lines.append(f"**合計時間:** {self._format_seconds(rollup.total_duration)}")
+        lines.append(f"**セッション数:** {rollup.session_count}")
+        return "\n".join(lines)
+
+    def _format_seconds(self, duration: float) -> str:
+        return format_hms(duration)
@@ -0,0 +1,8 @@
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_task_name(task_name: str) -> str:
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", task_name)).strip().casefold()
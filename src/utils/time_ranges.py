@@ -0,0 +1,21 @@
+from datetime import date, datetime, time, timedelta
+from typing import Tuple
+
+TimeRange = Tuple[datetime, datetime]
+
+
+def day_range(day: date) -> TimeRange:
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
+
+
+def week_range(day: date) -> TimeRange:
+    monday = day - timedelta(days=day.weekday())
+    start = datetime.combine(monday, time.min)
+    return start, start + timedelta(days=7)
+
+
+def month_range(year: int, month: int) -> TimeRange:
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
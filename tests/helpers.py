@@ -0,0 +1,11 @@
+from datetime import timedelta
+
+
+def make_session(task_name, start, end=None, pause_duration=0.0, minutes=30):
+    from src.session import Session
+
+    session = Session(task_name)
+    session.start_time = start
+    session.end_time = end if end is not None else start + timedelta(minutes=minutes)
+    session.total_pause_duration = pause_duration
+    return session
@@ -0,0 +1,168 @@
+import threading
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+
+def make_session(task_name):
+    from src.session import Session
+
+    session = Session(task_name)
+    session.start_time = datetime(2024, 1, 1, 10, 0, 0)
+    session.end_time = datetime(2024, 1, 1, 11, 0, 0)
+    session.is_running = False
+    return session
+
+
+class TestAsyncCategorizer(unittest.TestCase):
+    def setUp(self):
+        self.root = MagicMock()
+        self.root.after.side_effect = lambda delay, callback: f"after#{self.root.after.call_count}"
+
+    def poll(self):
+        self.root.after.call_args[0][1]()
+
+    def test_result_is_delivered_on_the_tk_thread(self):
+        from src.gui.async_categorizer import AsyncCategorizer
+
+        worker_threads = []
+
+        def categorize(sessions):
+            worker_threads.append(threading.current_thread())
+            return {"categories": [{"name": "開発", "tasks": [], "total_duration": 0.0}]}
+
+        categorizer = AsyncCategorizer(self.root, categorize)
+        on_done = MagicMock()
+        categorizer.submit([make_session("実装")], on_done)
+        categorizer._future.result(timeout=5)
+
+        on_done.assert_not_called()
+        self.poll()
+
+        on_done.assert_called_once_with({"categories": [{"name": "開発", "tasks": [], "total_duration": 0.0}]})
+        self.assertIsNot(worker_threads[0], threading.current_thread())
+        self.assertFalse(categorizer.is_busy)
+        categorizer.shutdown()
+
+    def test_poll_reschedules_until_done(self):
+        from src.gui.async_categorizer import AsyncCategorizer
+
+        release = threading.Event()
+        categorizer = AsyncCategorizer(self.root, lambda sessions: release.wait(5) and {"categories": []})
+        on_done = MagicMock()
+        categorizer.submit([make_session("実装")], on_done)
+
+        self.poll()
+        self.assertEqual(self.root.after.call_count, 2)
+        on_done.assert_not_called()
+
+        release.set()
+        categorizer._future.result(timeout=5)
+        self.poll()
+        on_done.assert_called_once_with({"categories": []})
+        categorizer.shutdown()
+
+    def test_cancel_drops_pending_result(self):
+        from src.gui.async_categorizer import AsyncCategorizer
+
+        release = threading.Event()
+        categorizer = AsyncCategorizer(self.root, lambda sessions: release.wait(5) and {"categories": []})
+        on_done = MagicMock()
+        categorizer.submit([make_session("実装")], on_done)
+        poll = self.root.after.call_args[0][1]
+
+        categorizer.cancel()
+        release.set()
+        poll()
+
+        self.root.after_cancel.assert_called_once_with("after#1")
+        on_done.assert_not_called()
+        self.assertFalse(categorizer.is_busy)
+        categorizer.shutdown()
+
+    def test_errors_are_reported(self):
+        from src.gui.async_categorizer import AsyncCategorizer
+
+        def categorize(sessions):
+            raise ValueError("API Error")
+
+        categorizer = AsyncCategorizer(self.root, categorize)
+        on_error = MagicMock()
+        categorizer.submit([make_session("実装")], MagicMock(), on_error)
+        categorizer._future.exception(timeout=5)
+        self.poll()
+
+        self.assertEqual(str(on_error.call_args[0][0]), "API Error")
+        categorizer.shutdown()
+
+    def test_partial_results_are_delivered_before_the_final_result(self):
+        from src.gui.async_categorizer import AsyncCategorizer
+
+        release = threading.Event()
+
+        def categorize(sessions, on_task_categorized):
+            on_task_categorized("実装", "開発", 60.0)
+            release.wait(5)
+            on_task_categorized("会議", "ミーティング", 30.0)
+            return {"categories": []}
+
+        events = []
+        categorizer = AsyncCategorizer(self.root, categorize)
+        categorizer.submit(
+            [make_session("実装")],
+            lambda result: events.append(("done", result)),
+            on_partial=lambda *partial: events.append(partial),
+        )
+
+        while not events:
+            self.poll()
+        self.assertEqual(events, [("実装", "開発", 60.0)])
+
+        release.set()
+        categorizer._future.result(timeout=5)
+        self.poll()
+        self.assertEqual(events, [("実装", "開発", 60.0), ("会議", "ミーティング", 30.0), ("done", {"categories": []})])
+        categorizer.shutdown()
+
+    def test_cancel_drops_pending_partial_results(self):
+        from src.gui.async_categorizer import AsyncCategorizer
+
+        def categorize(sessions, on_task_categorized):
+            on_task_categorized("実装", "開発", 60.0)
+            return {"categories": []}
+
+        on_partial = MagicMock()
+        categorizer = AsyncCategorizer(self.root, categorize)
+        categorizer.submit([make_session("実装")], MagicMock(), on_partial=on_partial)
+        poll = self.root.after.call_args[0][1]
+        categorizer._future.result(timeout=5)
+
+        categorizer.cancel()
+        poll()
+
+        on_partial.assert_not_called()
+        categorizer.shutdown()
+
+    def test_running_sessions_are_snapshotted(self):
+        from src.gui.async_categorizer import AsyncCategorizer
+        from src.session import Session
+
+        received = []
+        categorizer = AsyncCategorizer(self.root, lambda sessions: received.extend(sessions) or {"categories": []})
+        running = Session("実行中")
+        running.start()
+        completed = make_session("完了")
+
+        categorizer.submit([completed, running], MagicMock())
+        categorizer._future.result(timeout=5)
+
+        self.assertIs(received[0], completed)
+        self.assertIsNot(received[1], running)
+        self.assertFalse(received[1].is_running)
+        self.assertEqual(received[1].task_name, "実行中")
+        self.assertTrue(running.is_running)
+        categorizer.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -107,6 +107,53 @@ class TestCategoryCalculator(unittest.TestCase):
         with self.assertRaises(KeyError):
             calculator.calculate_category_totals(invalid_response)
 
+    def test_calculate_category_totals_reuses_task_objects(self) -> None:
+        tasks = [{"name": "API実装", "duration": 3600.0}, {"name": "UI作成", "duration": 1800.0}]
+        gemini_response = {"categories": [{"name": "開発", "tasks": tasks}]}
+
+        calculator = CategoryCalculator()
+        result = calculator.calculate_category_totals(gemini_response)
+
+        self.assertIs(result["categories"][0]["tasks"], tasks)
+        self.assertEqual(result["categories"][0]["total_duration"], 5400.0)
+        self.assertNotIn("total_duration", gemini_response["categories"][0])
+
+    def test_build_category_totals_groups_tasks_in_first_seen_order(self) -> None:
+        calculator = CategoryCalculator()
+        result = calculator.build_category_totals(
+            {"API実装": 3600.0, "定例会議": 1800.0, "UI作成": 900.0, "雑務": 60.0},
+            {"API実装": "開発", "定例会議": "ミーティング", "UI作成": "開発"},
+        )
+
+        self.assertEqual(
+            result["categories"],
+            [
+                {
+                    "name": "開発",
+                    "tasks": [{"name": "API実装", "duration": 3600.0}, {"name": "UI作成", "duration": 900.0}],
+                    "total_duration": 4500.0,
+                },
+                {"name": "ミーティング", "tasks": [{"name": "定例会議", "duration": 1800.0}], "total_duration": 1800.0},
+                {"name": "その他", "tasks": [{"name": "雑務", "duration": 60.0}], "total_duration": 60.0},
+            ],
+        )
+
+    def test_calculate_category_totals_from_rollup(self) -> None:
+        from datetime import date
+        from src.rollups import Rollups
+
+        rollups = Rollups()
+        rollups.add("API実装", date(2024, 3, 1), 3600.0)
+        rollups.add("UI作成", date(2024, 3, 2), 1800.0)
+
+        calculator = CategoryCalculator()
+        result = calculator.calculate_category_totals_from_rollup(
+            rollups.month(2024, 3), {"API実装": "開発", "UI作成": "開発"}
+        )
+
+        self.assertEqual(len(result["categories"]), 1)
+        self.assertEqual(result["categories"][0]["total_duration"], 5400.0)
+
     def test_get_total_work_time_single_category(self) -> None:
         categorized_data = {"categories": [{"name": "開発", "total_duration": 3600.0}]}
 
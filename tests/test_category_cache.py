@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCategoryCache(unittest.TestCase):
+    def test_normalize_task_name(self):
+        from src.api.category_cache import normalize_task_name
+
+        self.assertEqual(normalize_task_name("  ＵＩ　実装  "), "ui 実装")
+        self.assertEqual(normalize_task_name("API\tDesign"), normalize_task_name("api design"))
+
+    def test_lookup_uses_normalized_name(self):
+        from src.api.category_cache import CategoryCache
+
+        cache = CategoryCache()
+        cache.put("ＵＩ実装", "開発")
+
+        self.assertEqual(cache.get("ui実装"), "開発")
+        self.assertIsNone(cache.get("設計"))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_entries_expire_after_ttl(self):
+        from src.api.category_cache import CategoryCache
+
+        clock = FakeClock()
+        cache = CategoryCache(ttl=60, clock=clock)
+        cache.put("会議", "ミーティング")
+
+        clock.now += 59
+        self.assertEqual(cache.get("会議"), "ミーティング")
+        clock.now += 2
+        self.assertIsNone(cache.get("会議"))
+        self.assertEqual(len(cache), 0)
+
+    def test_categories_lists_live_entries(self):
+        from src.api.category_cache import CategoryCache
+
+        clock = FakeClock()
+        cache = CategoryCache(ttl=60, clock=clock)
+        cache.put("会議", "ミーティング")
+        clock.now += 30
+        cache.put("ＡＰＩ実装", "開発")
+        clock.now += 40
+
+        self.assertEqual(cache.categories(), {"api実装": "開発"})
+
+    def test_least_recently_used_entry_is_evicted(self):
+        from src.api.category_cache import CategoryCache
+
+        cache = CategoryCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+        self.assertEqual(cache.get_many(["a", "b", "c"]), {"a": "1", "c": "3"})
+
+    def test_cache_persists_to_disk(self):
+        from src.api.category_cache import CategoryCache
+
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "categories.json"
+            cache = CategoryCache(path, ttl=60, clock=clock)
+            cache.update({"設計": "設計・デザイン", "実装": "開発"})
+            cache.save()
+
+            self.assertEqual(CategoryCache(path, clock=clock).get("実装"), "開発")
+            clock.now += 120
+            self.assertEqual(len(CategoryCache(path, ttl=60, clock=clock)), 0)
+
+    def test_corrupt_cache_file_is_ignored(self):
+        from src.api.category_cache import CategoryCache
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "categories.json"
+            path.write_text("{not json", encoding="utf-8")
+
+            self.assertEqual(len(CategoryCache(path)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -105,6 +105,57 @@ class TestClipboardManager(unittest.TestCase):
         self.assertIsInstance(manager1, ClipboardManager)
         self.assertIsInstance(manager2, ClipboardManager)
 
+    @patch('tkinter.Tk')
+    def test_app_root_is_reused_across_copies(self, mock_tk):
+        from src.utils.clipboard import ClipboardManager
+
+        root = MagicMock()
+        manager = ClipboardManager(root)
+
+        self.assertTrue(manager.copy_to_clipboard("一回目"))
+        self.assertTrue(manager.copy_to_clipboard("二回目"))
+
+        mock_tk.assert_not_called()
+        self.assertEqual(root.clipboard_append.call_count, 2)
+        root.update.assert_not_called()
+        root.destroy.assert_not_called()
+
+    def test_fallback_backend_is_used_when_tk_fails(self):
+        from src.utils.clipboard import ClipboardManager, MemoryClipboardBackend
+
+        root = MagicMock()
+        root.clipboard_clear.side_effect = Exception("no display")
+        fallback = MemoryClipboardBackend()
+        manager = ClipboardManager(root, fallback=fallback)
+        large_text = "| タスク | 01:00:00 |\n" * 100_000
+
+        self.assertTrue(manager.copy_to_clipboard(large_text))
+        self.assertEqual(fallback.text, large_text)
+
+    @patch('src.utils.clipboard.shutil.which')
+    def test_command_fallback_is_detected_only_after_a_failure(self, mock_which):
+        from src.utils.clipboard import ClipboardManager
+
+        mock_which.side_effect = lambda name: "/usr/bin/xclip" if name == "xclip" else None
+        root = MagicMock()
+        manager = ClipboardManager(root, detect_fallback=True)
+
+        self.assertTrue(manager.copy_to_clipboard("テキスト"))
+        mock_which.assert_not_called()
+
+        root.clipboard_clear.side_effect = Exception("no display")
+        with patch('src.utils.clipboard.subprocess.run') as mock_run:
+            self.assertTrue(manager.copy_to_clipboard("テキスト"))
+
+        self.assertEqual(mock_run.call_args[0][0], ["xclip", "-selection", "clipboard"])
+        self.assertEqual(mock_run.call_args[1]["input"], "テキスト".encode("utf-8"))
+
+    def test_backends_must_implement_copy(self):
+        from src.utils.clipboard import ClipboardBackend
+
+        with self.assertRaises(TypeError):
+            ClipboardBackend()
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,41 @@
+import unittest
+
+
+class TestDurationFormat(unittest.TestCase):
+    def test_hms_truncates_to_whole_seconds(self):
+        from src.utils.duration_format import format_hms
+
+        self.assertEqual(format_hms(0.0), "00:00:00")
+        self.assertEqual(format_hms(3599.9), "00:59:59")
+        self.assertEqual(format_hms(7265.0), "02:01:05")
+        self.assertEqual(format_hms(360000.0), "100:00:00")
+
+    def test_hms_matches_float_divmod_formatting(self):
+        from src.utils.duration_format import format_hms
+
+        for duration in (0.4, 59.99, 61.5, 3600.0, 86399.999, 123456.7):
+            hours = int(duration // 3600)
+            minutes = int((duration % 3600) // 60)
+            seconds = int(duration % 60)
+            self.assertEqual(format_hms(duration), f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+
+    def test_format_variants(self):
+        from src.utils.duration_format import DECIMAL_HOURS, ISO_8601, LOCALIZED, format_duration
+
+        self.assertEqual(format_duration(5400.0, DECIMAL_HOURS), "1.50")
+        self.assertEqual(format_duration(3725.0, ISO_8601), "PT1H2M5S")
+        self.assertEqual(format_duration(3600.0, ISO_8601), "PT1H")
+        self.assertEqual(format_duration(0.0, ISO_8601), "PT0S")
+        self.assertEqual(format_duration(3725.0, LOCALIZED), "1時間2分5秒")
+        self.assertEqual(format_duration(3725.0, LOCALIZED, locale="en"), "1h 2m 5s")
+        self.assertEqual(format_duration(0.0, LOCALIZED), "0秒")
+
+    def test_unknown_format_raises(self):
+        from src.utils.duration_format import format_duration
+
+        with self.assertRaises(ValueError):
+            format_duration(1.0, "weeks")
+
+
+if __name__ == "__main__":
+    unittest.main()
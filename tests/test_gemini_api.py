@@ -3,6 +3,13 @@ from unittest.mock import patch, MagicMock
 
 
 class TestGeminiAPIClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        import src.api.gemini
+
+        # The SDK is imported lazily; load it before the tests patch os.getenv for the whole process.
+        src.api.gemini.genai
+
     @patch("src.api.gemini.os.getenv")
     def test_gemini_client_creation(self, mock_getenv: MagicMock) -> None:
         from src.api.gemini import GeminiAPIClient
@@ -146,10 +153,7 @@ class TestGeminiAPIClient(unittest.TestCase):
         mock_model_class.return_value = mock_model
 
         mock_response = MagicMock()
-        mock_response.text = (
-            '{"categories": [{"name": "開発", "tasks": '
-            '[{"name": "テスト作業", "duration": 3600.0}], "total_duration": 3600.0}]}'
-        )
+        mock_response.text = '{"assignments": [{"id": 1, "category": "開発"}]}'
         mock_model.generate_content.return_value = mock_response
 
         session = Session("テスト作業")
@@ -209,6 +213,357 @@ class TestGeminiAPIClient(unittest.TestCase):
         with self.assertRaises(Exception):
             client.categorize_tasks([session])
 
+    @patch("src.api.gemini.genai.GenerativeModel")
+    @patch("src.api.gemini.genai.configure")
+    @patch("src.api.gemini.os.getenv")
+    def test_categorize_tasks_only_sends_unseen_names(
+        self,
+        mock_getenv: MagicMock,
+        mock_configure: MagicMock,
+        mock_model_class: MagicMock,
+    ) -> None:
+        from src.api.category_cache import CategoryCache
+        from src.api.gemini import GeminiAPIClient
+        from src.session import Session
+        from datetime import datetime
+
+        mock_getenv.return_value = "test-api-key"
+        mock_model = MagicMock()
+        mock_model_class.return_value = mock_model
+        mock_response = MagicMock()
+        mock_response.text = '{"assignments": [{"id": 1, "category": "ミーティング"}]}'
+        mock_model.generate_content.return_value = mock_response
+
+        sessions = []
+        for task_name, hour in [("UI実装", 9), ("定例会議", 10), ("UI実装", 11)]:
+            session = Session(task_name)
+            session.start_time = datetime(2024, 1, 1, hour, 0, 0)
+            session.end_time = datetime(2024, 1, 1, hour, 30, 0)
+            session.is_running = False
+            sessions.append(session)
+
+        cache = CategoryCache()
+        cache.put("UI実装", "開発")
+        client = GeminiAPIClient(cache=cache)
+        result = client.categorize_tasks(sessions)
+
+        prompt = mock_model.generate_content.call_args[0][0]
+        self.assertIn("定例会議", prompt)
+        self.assertNotIn("UI実装", prompt)
+        self.assertEqual(
+            result["categories"],
+            [
+                {"name": "開発", "tasks": [{"name": "UI実装", "duration": 3600.0}], "total_duration": 3600.0},
+                {"name": "ミーティング", "tasks": [{"name": "定例会議", "duration": 1800.0}], "total_duration": 1800.0},
+            ],
+        )
+        self.assertEqual(cache.get("定例会議"), "ミーティング")
+
+        mock_model.generate_content.reset_mock()
+        client.categorize_tasks(sessions)
+        mock_model.generate_content.assert_not_called()
+
+    @patch("src.api.gemini.genai.GenerativeModel")
+    @patch("src.api.gemini.genai.configure")
+    @patch("src.api.gemini.os.getenv")
+    def test_large_task_lists_are_chunked_and_sent_concurrently(
+        self,
+        mock_getenv: MagicMock,
+        mock_configure: MagicMock,
+        mock_model_class: MagicMock,
+    ) -> None:
+        import json
+        import re
+        import threading
+        from src.api.gemini import GeminiAPIClient
+        from src.session import Session
+        from datetime import datetime
+
+        mock_getenv.return_value = "test-api-key"
+        mock_model = MagicMock()
+        mock_model_class.return_value = mock_model
+        barrier = threading.Barrier(2, timeout=5)
+        sent_names = []
+
+        def generate_content(prompt, generation_config=None):
+            lines = re.findall(r"^(\d+)\t(.+)$", prompt, re.MULTILINE)
+            sent_names.append([name for _, name in lines])
+            barrier.wait()
+            response = MagicMock()
+            response.text = json.dumps(
+                {"assignments": [{"id": int(task_id), "category": f"カテゴリ{name[-1]}"} for task_id, name in lines]}
+            )
+            return response
+
+        mock_model.generate_content.side_effect = generate_content
+
+        sessions = []
+        for index in range(8):
+            session = Session(f"タスク{index % 4}")
+            session.start_time = datetime(2024, 1, 1, 9, index, 0)
+            session.end_time = datetime(2024, 1, 1, 9, index, 30)
+            session.is_running = False
+            sessions.append(session)
+
+        client = GeminiAPIClient(max_chunk_tokens=12, max_concurrency=2)
+        result = client.categorize_tasks(sessions)
+
+        self.assertEqual(sorted(sent_names), [["タスク0", "タスク1"], ["タスク2", "タスク3"]])
+        self.assertEqual([category["name"] for category in result["categories"]], [f"カテゴリ{i}" for i in range(4)])
+        self.assertEqual([category["total_duration"] for category in result["categories"]], [60.0] * 4)
+
+    @patch("src.api.gemini.genai.GenerativeModel")
+    @patch("src.api.gemini.genai.configure")
+    @patch("src.api.gemini.os.getenv")
+    def test_only_unmatched_names_are_requeried(
+        self,
+        mock_getenv: MagicMock,
+        mock_configure: MagicMock,
+        mock_model_class: MagicMock,
+    ) -> None:
+        import re
+        from src.api.gemini import GeminiAPIClient
+        from src.session import Session
+
+        mock_getenv.return_value = "test-api-key"
+        first = MagicMock()
+        first.text = (
+            '{"assignments": [{"id": 1, "category": "ミーティング"}, {"id": 1, "category": "開発"},'
+            ' {"id": 5, "category": "開発"}]}'
+        )
+        second = MagicMock()
+        second.text = '{"assignments": []}'
+        mock_model = mock_model_class.return_value
+        mock_model.generate_content.side_effect = [first, second]
+
+        client = GeminiAPIClient()
+        result = client.categorize_tasks([Session("定例会議"), Session("雑談"), Session("UI実装")])
+
+        prompts = [call[0][0] for call in mock_model.generate_content.call_args_list]
+        self.assertEqual(len(prompts), 2)
+        self.assertEqual(re.findall(r"^\d+\t(.+)$", prompts[1], re.MULTILINE), ["雑談", "UI実装"])
+        self.assertEqual(client.unmatched_tasks, ["雑談", "UI実装"])
+        self.assertEqual(
+            [(category["name"], [task["name"] for task in category["tasks"]]) for category in result["categories"]],
+            [("ミーティング", ["定例会議"]), ("その他", ["雑談"]), ("開発", ["UI実装"])],
+        )
+
+    @patch("src.api.gemini.genai.GenerativeModel")
+    @patch("src.api.gemini.genai.configure")
+    @patch("src.api.gemini.os.getenv")
+    def test_local_classifier_handles_confident_names(
+        self,
+        mock_getenv: MagicMock,
+        mock_configure: MagicMock,
+        mock_model_class: MagicMock,
+    ) -> None:
+        from src.api.gemini import GeminiAPIClient
+        from src.session import Session
+        from src.utils.local_classifier import LocalClassifier, NearestNeighbourClassifier
+
+        mock_getenv.return_value = "test-api-key"
+        mock_model = MagicMock()
+        mock_model_class.return_value = mock_model
+        mock_response = MagicMock()
+        mock_response.text = '{"assignments": [{"id": 1, "category": "ミーティング"}]}'
+        mock_model.generate_content.return_value = mock_response
+
+        classifier = LocalClassifier(model=NearestNeighbourClassifier())
+        client = GeminiAPIClient(local_classifier=classifier)
+        result = client.categorize_tasks([Session("API実装"), Session("週次定例会議")])
+
+        prompt = mock_model.generate_content.call_args[0][0]
+        self.assertIn("週次定例会議", prompt)
+        self.assertNotIn("API実装", prompt)
+        self.assertEqual([category["name"] for category in result["categories"]], ["開発", "ミーティング"])
+
+        mock_model.generate_content.reset_mock()
+        client.categorize_tasks([Session("定例会議")])
+        mock_model.generate_content.assert_not_called()
+
+    @patch("src.api.gemini.genai.GenerativeModel")
+    @patch("src.api.gemini.genai.configure")
+    @patch("src.api.gemini.os.getenv")
+    def test_open_circuit_falls_back_to_local_rules(
+        self,
+        mock_getenv: MagicMock,
+        mock_configure: MagicMock,
+        mock_model_class: MagicMock,
+    ) -> None:
+        from src.api.gemini import GeminiAPIClient
+        from src.api.resilience import CircuitBreaker, ResilientCaller, RetryPolicy
+        from src.session import Session
+
+        mock_getenv.return_value = "test-api-key"
+        mock_model = MagicMock()
+        mock_model_class.return_value = mock_model
+        mock_model.generate_content.side_effect = ConnectionError("unavailable")
+
+        resilience = ResilientCaller(
+            retry_policy=RetryPolicy(max_attempts=2, random_source=lambda: 0.0),
+            circuit_breaker=CircuitBreaker(failure_threshold=2),
+            sleep=lambda seconds: None,
+        )
+        client = GeminiAPIClient(resilience=resilience)
+
+        result = client.categorize_tasks([Session("API実装"), Session("ランチ")])
+        self.assertTrue(client.fallback_used)
+        self.assertEqual([category["name"] for category in result["categories"]], ["開発", "その他"])
+        self.assertEqual(mock_model.generate_content.call_count, 2)
+        self.assertIn("timeout", mock_model.generate_content.call_args.kwargs["request_options"])
+
+        client.categorize_tasks([Session("API実装")])
+        self.assertEqual(mock_model.generate_content.call_count, 2)
+        self.assertEqual(resilience.metrics.rejected, 1)
+
+    @patch("src.api.gemini.genai.GenerativeModel")
+    @patch("src.api.gemini.genai.configure")
+    @patch("src.api.gemini.os.getenv")
+    def test_errors_are_raised_as_gemini_api_error(
+        self,
+        mock_getenv: MagicMock,
+        mock_configure: MagicMock,
+        mock_model_class: MagicMock,
+    ) -> None:
+        from src.api.gemini import GeminiAPIClient, GeminiAPIError
+        from src.session import Session
+
+        mock_getenv.return_value = "test-api-key"
+        mock_model_class.return_value.generate_content.return_value.text = '{"unexpected": []}'
+
+        with self.assertRaises(GeminiAPIError) as context:
+            GeminiAPIClient().categorize_tasks([Session("テスト作業")])
+        self.assertIn("Invalid response structure", str(context.exception))
+
+    def test_importing_the_app_does_not_load_the_sdk(self) -> None:
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        probe = (
+            "import sys, main; "
+            "print([name for name in ('google.generativeai', 'pydantic', 'dotenv') if name in sys.modules])"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, check=True, cwd=Path(__file__).parent.parent
+        ).stdout
+
+        self.assertEqual(output.strip(), "[]")
+
+    @patch("src.api.gemini.os.getenv")
+    def test_sdk_is_configured_on_first_request(self, mock_getenv: MagicMock) -> None:
+        from src.api.gemini import GeminiAPIClient
+
+        mock_getenv.return_value = "test-api-key"
+        with patch("src.api.gemini.genai.configure") as mock_configure:
+            client = GeminiAPIClient()
+            mock_configure.assert_not_called()
+
+            with patch("src.api.gemini.genai.GenerativeModel") as mock_model_class:
+                self.assertIs(client.model, mock_model_class.return_value)
+                self.assertIs(client.model, mock_model_class.return_value)
+
+        mock_configure.assert_called_once_with(api_key="test-api-key")
+        mock_model_class.assert_called_once_with("test-api-key")
+
+    @patch("src.api.gemini.genai.GenerativeModel")
+    @patch("src.api.gemini.genai.configure")
+    @patch("src.api.gemini.os.getenv")
+    def test_streamed_assignments_are_reported_per_task(
+        self,
+        mock_getenv: MagicMock,
+        mock_configure: MagicMock,
+        mock_model_class: MagicMock,
+    ) -> None:
+        from src.api.category_cache import CategoryCache
+        from src.api.gemini import GeminiAPIClient
+        from src.session import Session
+        from datetime import datetime
+
+        mock_getenv.return_value = "test-api-key"
+        mock_model = MagicMock()
+        mock_model_class.return_value = mock_model
+        reported = []
+        chunks = [
+            '{"assignments": [{"id": 1, "cat',
+            'egory": "ミーティング"}, {"id": 2, ',
+            '"category": "ドキュメント作成"}]}',
+        ]
+
+        def generate_content(prompt, generation_config=None, stream=False):
+            self.assertTrue(stream)
+            for text in chunks:
+                # Every finished assignment has been reported before the next chunk arrives.
+                reported.append(len(calls))
+                chunk = MagicMock()
+                chunk.text = text
+                yield chunk
+
+        mock_model.generate_content.side_effect = generate_content
+
+        sessions = []
+        for task_name, hour in [("UI実装", 9), ("定例会議", 10), ("議事録", 11)]:
+            session = Session(task_name)
+            session.start_time = datetime(2024, 1, 1, hour, 0, 0)
+            session.end_time = datetime(2024, 1, 1, hour, 30, 0)
+            session.is_running = False
+            sessions.append(session)
+
+        cache = CategoryCache()
+        cache.put("UI実装", "開発")
+        calls = []
+        client = GeminiAPIClient(cache=cache)
+        result = client.categorize_tasks(sessions, lambda *call: calls.append(call))
+
+        self.assertEqual(
+            calls,
+            [("UI実装", "開発", 1800.0), ("定例会議", "ミーティング", 1800.0), ("議事録", "ドキュメント作成", 1800.0)],
+        )
+        self.assertEqual(reported, [1, 1, 2])
+        self.assertEqual(
+            [category["name"] for category in result["categories"]], ["開発", "ミーティング", "ドキュメント作成"]
+        )
+
+    @patch("src.api.gemini.genai.GenerativeModel")
+    @patch("src.api.gemini.genai.configure")
+    @patch("src.api.gemini.os.getenv")
+    def test_truncated_stream_raises_gemini_api_error(
+        self,
+        mock_getenv: MagicMock,
+        mock_configure: MagicMock,
+        mock_model_class: MagicMock,
+    ) -> None:
+        from src.api.gemini import GeminiAPIClient, GeminiAPIError
+        from src.session import Session
+
+        mock_getenv.return_value = "test-api-key"
+        chunk = MagicMock()
+        chunk.text = '{"assignments": [{"id": 1, "category": "ミーティング"}'
+        mock_model_class.return_value.generate_content.return_value = [chunk]
+
+        client = GeminiAPIClient()
+        with self.assertRaises(GeminiAPIError):
+            client.categorize_tasks([Session("定例会議")], MagicMock())
+
+    def test_lazy_categorizer_falls_back_to_rules_without_api_key(self) -> None:
+        from src.api.gemini import GeminiAPIClient, LazyCategorizer
+        from src.session import Session
+
+        factory = MagicMock(side_effect=ValueError("GEMINI_API_KEY environment variable is required"))
+        categorizer = LazyCategorizer(factory)
+
+        result = categorizer([Session("API実装")])
+        categorizer([Session("API実装")])
+
+        factory.assert_called_once()
+        self.assertFalse(categorizer.is_configured)
+        self.assertEqual(result["categories"][0]["name"], "開発")
+
+        client = MagicMock(spec=GeminiAPIClient)
+        categorizer = LazyCategorizer(lambda: client)
+        categorizer([Session("API実装")])
+        client.categorize_tasks.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from datetime import date, datetime
+
+from tests.helpers import make_session
+
+
+class TestSessionHistory(unittest.TestCase):
+    def setUp(self):
+        from src.session_store import SessionStore
+
+        self.store = SessionStore()
+        for index in range(5):
+            self.store.save_session(make_session(f"タスク{index}", datetime(2024, 3, 4, 9 + index)))
+        self.store.save_session(make_session("翌日", datetime(2024, 3, 5, 9)))
+        self.store.save_session(make_session("来月", datetime(2024, 4, 1, 9)))
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_pages_are_loaded_only_when_rows_are_read(self):
+        from src.history import SessionHistory
+
+        history = SessionHistory(self.store, page_size=2)
+        day = history.day(date(2024, 3, 4))
+
+        self.assertEqual(len(day), 5)
+        self.assertEqual(day.total_time, 5 * 1800.0)
+        self.assertEqual(day.sessions, [])
+
+        self.assertEqual(day.session(2).task_name, "タスク2")
+        self.assertEqual(len(day.sessions), 4)
+        self.assertFalse(day.is_fully_loaded)
+
+        self.assertEqual(day.session(4).task_name, "タスク4")
+        self.assertTrue(day.is_fully_loaded)
+        self.assertEqual(day.load_next_page(), [])
+
+    def test_week_and_month_ranges(self):
+        from src.history import SessionHistory
+
+        history = SessionHistory(self.store)
+
+        self.assertEqual(len(history.week(date(2024, 3, 6))), 6)
+        self.assertEqual(len(history.month(2024, 3)), 6)
+        self.assertEqual(history.month(2024, 4).session(0).task_name, "来月")
+
+    def test_recently_viewed_ranges_are_cached(self):
+        from src.history import SessionHistory
+
+        history = SessionHistory(self.store, max_cached_ranges=2)
+        march_fourth = history.day(date(2024, 3, 4))
+        march_fourth.session(0)
+
+        self.assertIs(history.day(date(2024, 3, 4)), march_fourth)
+        history.day(date(2024, 3, 5))
+        history.day(date(2024, 3, 6))
+        self.assertIsNot(history.day(date(2024, 3, 4)), march_fourth)
+
+    def test_invalidate_drops_only_ranges_containing_the_moment(self):
+        from src.history import SessionHistory
+
+        history = SessionHistory(self.store)
+        past_day = history.day(date(2024, 3, 4))
+        current_day = history.day(date(2024, 3, 5))
+        current_month = history.month(2024, 3)
+
+        history.invalidate(datetime(2024, 3, 5, 12))
+
+        self.assertIs(history.day(date(2024, 3, 4)), past_day)
+        self.assertIsNot(history.day(date(2024, 3, 5)), current_day)
+        self.assertIsNot(history.month(2024, 3), current_month)
+
+
+if __name__ == "__main__":
+    unittest.main()
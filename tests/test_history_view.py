@@ -0,0 +1,67 @@
+import unittest
+import tkinter as tk
+from datetime import date, datetime, timedelta
+
+from tests.helpers import make_session
+
+
+class TestHistoryView(unittest.TestCase):
+    def setUp(self):
+        from src.history import SessionHistory
+        from src.session_store import SessionStore
+
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.store = SessionStore()
+        for index in range(50):
+            self.store.save_session(make_session(f"タスク{index}", datetime(2023, 3, 4, 8) + timedelta(minutes=index)))
+        self.store.save_session(make_session("翌週", datetime(2023, 3, 13, 9)))
+        self.history = SessionHistory(self.store, page_size=10)
+
+    def tearDown(self):
+        self.store.close()
+        self.root.destroy()
+
+    def test_day_view_loads_only_the_first_page(self):
+        from src.gui.history_view import HistoryView
+
+        view = HistoryView(self.root, self.history, today=date(2023, 3, 4))
+        view.show()
+
+        self.assertEqual(view.range_label.cget("text"), "2023-03-04")
+        self.assertEqual(view.session_list_view.row_count, 50)
+        self.assertIn("タスク0", view.session_list_view.listbox.get(0))
+        self.assertLess(len(view.current_range.sessions), 50)
+        self.assertIn("25:00:00", view.total_label.cget("text"))
+
+    def test_navigation_between_periods(self):
+        from src.gui.history_view import MONTH, WEEK, HistoryView
+
+        view = HistoryView(self.root, self.history, today=date(2023, 3, 4))
+        view.show()
+
+        view.set_period(WEEK)
+        view.show_next()
+        self.assertEqual(view.range_label.cget("text"), "2023-03-06 〜 2023-03-12")
+        self.assertEqual(view.session_list_view.row_count, 0)
+
+        view.show_next()
+        self.assertEqual(view.session_list_view.row_count, 1)
+
+        view.set_period(MONTH)
+        view.show_previous()
+        self.assertEqual(view.range_label.cget("text"), "2023年02月")
+
+    def test_back_button_callback(self):
+        from unittest.mock import MagicMock
+        from src.gui.history_view import HistoryView
+
+        back_callback = MagicMock()
+        view = HistoryView(self.root, self.history, back_callback=back_callback)
+        view.back_button.invoke()
+
+        back_callback.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
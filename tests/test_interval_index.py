@@ -0,0 +1,61 @@
+import unittest
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def setUp(self):
+        from src.interval_index import IntervalIndex
+
+        self.index = IntervalIndex()
+        self.index.add(100, 200, 0)
+        self.index.add(300, 400, 1)
+        self.index.add(500, 600, 1)
+
+    def test_total_between_covers_whole_intervals(self):
+        self.assertEqual(self.index.total_between(0, 1000), 300)
+        self.assertEqual(self.index.total_between(200, 300), 0)
+
+    def test_total_between_clips_partial_intervals(self):
+        self.assertEqual(self.index.total_between(150, 350), 100)
+        self.assertEqual(self.index.total_between(320, 340), 20)
+        self.assertEqual(self.index.total_between(550, 2000), 50)
+
+    def test_out_of_order_insert_keeps_index_sorted(self):
+        self.index.add(220, 280, 2)
+
+        self.assertEqual(list(self.index.starts), [100, 220, 300, 500])
+        self.assertEqual(self.index.total_between(0, 1000), 360)
+        self.assertEqual(self.index.total_between(250, 350), 80)
+
+    def test_overlapping_returns_clipped_owners(self):
+        self.assertEqual(self.index.overlapping(150, 520), [(0, 150, 200), (1, 300, 400), (1, 500, 520)])
+        self.assertEqual(self.index.overlapping(700, 800), [])
+
+    def test_overlapping_intervals_are_clamped_to_uncovered_time(self):
+        from src.interval_index import IntervalIndex
+
+        index = IntervalIndex()
+        index.add(0, 100, 0)
+        index.add(200, 300, 1)
+        index.add(150, 400, 2)
+        index.add(50, 80, 3)
+
+        self.assertEqual(list(index.starts), [0, 150, 200, 300])
+        self.assertEqual(list(index.ends), [100, 200, 300, 400])
+        self.assertEqual(index.total_between(0, 1000), 350)
+        self.assertEqual(index.total_between(120, 350), 200)
+        self.assertEqual(index.total_between(350, 1000), 50)
+        self.assertEqual(index.overlapping(250, 350), [(1, 250, 300), (2, 300, 350)])
+
+    def test_empty_intervals_are_ignored(self):
+        self.index.add(700, 700, 3)
+
+        self.assertEqual(len(self.index), 3)
+
+    def test_clip_intervals(self):
+        from src.interval_index import clip_intervals
+
+        self.assertEqual(clip_intervals([(0, 10), (20, 30), (40, 50)], 5, 25), [(5, 10), (20, 25)])
+
+
+if __name__ == "__main__":
+    unittest.main()
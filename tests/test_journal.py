@@ -0,0 +1,223 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+
+class TestSessionJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal_path = Path(self.temp_dir.name) / "sessions.journal"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_replay_missing_journal_returns_no_sessions(self):
+        from src.journal import SessionJournal
+
+        journal = SessionJournal(self.journal_path)
+        self.assertEqual(journal.replay(), [])
+
+    def test_session_manager_writes_one_record_per_event(self):
+        from src.journal import SessionJournal
+        from src.session_manager import SessionManager
+
+        journal = SessionJournal(self.journal_path)
+        manager = SessionManager(journal=journal)
+        manager.start_session("タスク1")
+        manager.current_session.pause()
+        manager.current_session.resume()
+        manager.start_session("タスク2")
+        manager.stop_current_session()
+        manager.close()
+
+        records = self.journal_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual([record.split("\t")[0] for record in records], ["S", "P", "R", "E", "S", "E"])
+
+    def test_replay_rebuilds_sessions(self):
+        from src.journal import SessionJournal
+        from src.session_manager import SessionManager
+
+        manager = SessionManager(journal=SessionJournal(self.journal_path))
+        manager.start_session("タスク1")
+        time.sleep(0.05)
+        manager.current_session.pause()
+        time.sleep(0.05)
+        manager.current_session.resume()
+        manager.start_session("タスク\t2\n\\r")
+        manager.stop_all_sessions()
+        manager.close()
+
+        restored = SessionManager(journal=SessionJournal(self.journal_path))
+
+        self.assertEqual([session.task_name for session in restored.sessions], ["タスク1", "タスク\t2\n\\r"])
+        self.assertIsNone(restored.current_session)
+        for original, replayed in zip(manager.sessions, restored.sessions):
+            self.assertFalse(replayed.is_running)
+            self.assertAlmostEqual(original.get_duration(), replayed.get_duration(), delta=0.001)
+            self.assertAlmostEqual(original.total_pause_duration, replayed.total_pause_duration, delta=0.001)
+        self.assertEqual(len(restored.sessions[0].pause_marks_wall_ns), 2)
+        self.assertEqual(len(restored.sessions[0].get_active_intervals_ns()), 2)
+
+    def test_replay_restores_running_and_paused_session(self):
+        from src.journal import SessionJournal
+        from src.session_manager import SessionManager
+
+        manager = SessionManager(journal=SessionJournal(self.journal_path))
+        manager.start_session("タスク1")
+        manager.start_session("タスク2")
+        manager.current_session.pause()
+        manager.close()
+
+        restored = SessionManager(journal=SessionJournal(self.journal_path))
+
+        self.assertIsNotNone(restored.current_session)
+        self.assertEqual(restored.current_session.task_name, "タスク2")
+        self.assertTrue(restored.current_session.is_running)
+        self.assertTrue(restored.current_session.is_paused)
+
+        restored.current_session.resume()
+        restored.start_session("タスク3")
+        restored.close()
+
+        self.assertEqual(restored.sessions[-1].session_id, 2)
+        replayed = SessionJournal(self.journal_path).replay()
+        self.assertEqual([session.task_name for session in replayed], ["タスク1", "タスク2", "タスク3"])
+        self.assertFalse(replayed[1].is_running)
+
+    def test_replay_ignores_torn_trailing_record(self):
+        from src.journal import SessionJournal
+        from src.session_manager import SessionManager
+
+        manager = SessionManager(journal=SessionJournal(self.journal_path))
+        manager.start_session("タスク1")
+        manager.close()
+
+        with open(self.journal_path, "a", encoding="utf-8") as journal_file:
+            journal_file.write("E\t0\t17")
+
+        restored = SessionManager(journal=SessionJournal(self.journal_path))
+        self.assertTrue(restored.current_session.is_running)
+
+        restored.stop_current_session()
+        restored.close()
+
+        replayed = SessionJournal(self.journal_path).replay()
+        self.assertEqual(len(replayed), 1)
+        self.assertFalse(replayed[0].is_running)
+        self.assertGreater(replayed[0].end_time, replayed[0].start_time)
+
+    def test_fsync_is_batched(self):
+        from unittest.mock import patch
+        from src.journal import SessionJournal
+        from src.session_manager import SessionManager
+
+        journal = SessionJournal(self.journal_path, sync_every=4, sync_interval=3600.0)
+        manager = SessionManager(journal=journal)
+
+        with patch("src.journal.os.fsync", wraps=os.fsync) as mock_fsync:
+            for i in range(8):
+                manager.start_session(f"タスク{i}")
+
+        # 8 starts + 7 implicit stops = 15 records, synced after every 4th.
+        self.assertEqual(mock_fsync.call_count, 3)
+        manager.close()
+
+    def test_replay_many_records(self):
+        from src.journal import SessionJournal
+
+        base = 1_700_000_000.0
+        with open(self.journal_path, "w", encoding="utf-8") as journal_file:
+            for i in range(10_000):
+                start = base + i * 100
+                journal_file.write(f"S\t{i}\t{start:.6f}\tタスク{i % 10}\n")
+                journal_file.write(f"P\t{i}\t{start + 10:.6f}\n")
+                journal_file.write(f"R\t{i}\t{start + 30:.6f}\n")
+                journal_file.write(f"E\t{i}\t{start + 60:.6f}\n")
+
+        sessions = SessionJournal(self.journal_path).replay()
+
+        self.assertEqual(len(sessions), 10_000)
+        self.assertAlmostEqual(sum(session.get_duration() for session in sessions), 10_000 * 40.0, delta=1.0)
+
+    def write_records(self, *records):
+        with open(self.journal_path, "a", encoding="utf-8") as journal_file:
+            for record in records:
+                journal_file.write("\t".join(str(field) for field in record) + "\n")
+
+    def test_replay_since_skips_sessions_that_ended_earlier(self):
+        from src.journal import SessionJournal
+
+        self.write_records(("S", 0, 100.0, "古い"), ("E", 0, 200.0), ("S", 4, 150.0, "開いたまま"))
+        self.write_records(("S", 2, 300.0, "新しい"), ("P", 2, 310.0), ("R", 2, 320.0), ("E", 2, 400.0))
+        journal = SessionJournal(self.journal_path)
+
+        sessions = journal.replay(since_wall_ns=250 * 1_000_000_000)
+
+        self.assertEqual([session.task_name for session in sessions], ["開いたまま", "新しい"])
+        self.assertEqual(journal.skipped_sessions, 1)
+        self.assertEqual(journal.next_session_id, 5)
+        self.assertEqual(sessions[1].total_pause_duration, 10.0)
+
+    def test_replay_since_and_compact_handle_ids_out_of_order(self):
+        from src.journal import SessionJournal
+
+        self.write_records(("S", 9, 100.0, "開いたまま"), ("S", 1, 150.0, "古い"), ("E", 1, 160.0))
+        self.write_records(("S", 2, 300.0, "新しい"), ("E", 2, 400.0))
+        journal = SessionJournal(self.journal_path)
+
+        sessions = journal.replay(since_wall_ns=250 * 1_000_000_000)
+        self.assertEqual([session.task_name for session in sessions], ["開いたまま", "新しい"])
+
+        journal.compact(session.session_id for session in sessions)
+        self.assertEqual([session.task_name for session in journal.replay()], ["開いたまま", "新しい"])
+        self.assertEqual(journal.skipped_sessions, 0)
+        self.assertEqual(journal.next_session_id, 10)
+
+    def test_restore_keeps_only_today_and_the_open_session(self):
+        from src.journal import SessionJournal
+        from src.session_manager import SessionManager
+
+        two_days_ago = time.time() - 2 * 24 * 60 * 60
+        self.write_records(("S", 0, two_days_ago, "一昨日"), ("E", 0, two_days_ago + 60))
+        manager = SessionManager(journal=SessionJournal(self.journal_path))
+        manager.start_session("今日")
+        manager.close()
+
+        restored = SessionManager(journal=SessionJournal(self.journal_path))
+
+        self.assertEqual([session.task_name for session in restored.sessions], ["今日"])
+        self.assertEqual(restored.current_session.task_name, "今日")
+        self.assertEqual(list(restored.get_task_totals()), ["今日"])
+        self.assertEqual(restored.start_session("次").session_id, 2)
+        restored.close()
+
+    def test_restore_saves_unsaved_sessions_and_compacts_the_journal(self):
+        from src.journal import SessionJournal
+        from src.session_manager import SessionManager
+        from src.session_store import SessionStore
+
+        two_days_ago = time.time() - 2 * 24 * 60 * 60
+        store = SessionStore()
+        self.write_records(("S", 5, two_days_ago, "保存済み"), ("E", 5, two_days_ago + 60))
+        store.save_session(SessionJournal(self.journal_path).replay()[0])
+        manager = SessionManager(journal=SessionJournal(self.journal_path), store=store)
+        manager.start_session("今日")
+        manager.stop_current_session()
+        manager.journal.close()
+        # Stopped in the journal, but the app died before the store saved it.
+        self.write_records(("S", 7, time.time(), "未保存"), ("E", 7, time.time() + 1))
+
+        restored = SessionManager(journal=SessionJournal(self.journal_path), store=store)
+
+        self.assertEqual([session.task_name for session in restored.sessions], ["今日", "未保存"])
+        self.assertEqual(store.count_sessions(), 3)
+        replayed = SessionJournal(self.journal_path).replay()
+        self.assertEqual([session.task_name for session in replayed], ["今日", "未保存"])
+        self.assertEqual(restored.start_session("次").session_id, 8)
+        restored.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
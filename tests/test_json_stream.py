@@ -0,0 +1,40 @@
+import unittest
+
+
+class TestJsonArrayStreamParser(unittest.TestCase):
+    def test_elements_are_emitted_as_soon_as_they_are_complete(self):
+        from src.api.json_stream import JsonArrayStreamParser
+
+        parser = JsonArrayStreamParser("assignments")
+
+        self.assertEqual(parser.feed('{"assign'), [])
+        self.assertEqual(parser.feed('ments": [{"id": 1, "cate'), [])
+        self.assertEqual(parser.feed('gory": "開発"}, {"id": 2,'), [{"id": 1, "category": "開発"}])
+        self.assertFalse(parser.finished)
+        self.assertEqual(parser.feed(' "category": "その他"}]}'), [{"id": 2, "category": "その他"}])
+        self.assertTrue(parser.finished)
+
+    def test_brackets_and_escapes_inside_strings_are_ignored(self):
+        from src.api.json_stream import JsonArrayStreamParser
+
+        parser = JsonArrayStreamParser("assignments")
+        text = '{"assignments": [{"id": 1, "category": "a}]\\"b"}, {"id": 2, "category": "[c]"}]}'
+
+        elements = []
+        for character in text:
+            elements.extend(parser.feed(character))
+
+        self.assertEqual(elements, [{"id": 1, "category": 'a}]"b'}, {"id": 2, "category": "[c]"}])
+        self.assertTrue(parser.finished)
+
+    def test_unterminated_array_is_not_finished(self):
+        from src.api.json_stream import JsonArrayStreamParser
+
+        parser = JsonArrayStreamParser("assignments")
+
+        self.assertEqual(parser.feed('{"assignments": [{"id": 1, "category": "開発"}'), [{"id": 1, "category": "開発"}])
+        self.assertFalse(parser.finished)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+
+class TestRuleClassifier(unittest.TestCase):
+    def test_default_rules(self):
+        from src.utils.local_classifier import RuleClassifier
+
+        classifier = RuleClassifier()
+
+        self.assertEqual(classifier.classify("フロントエンド実装"), ("開発", 1.0))
+        self.assertEqual(classifier.classify("ＵＩ設計"), ("設計・デザイン", 1.0))
+        self.assertEqual(classifier.classify("結合テスト"), ("テスト・検証", 1.0))
+        self.assertEqual(classifier.classify("ランチ"), (None, 0.0))
+
+    def test_names_matching_several_categories_are_low_confidence(self):
+        from src.utils.local_classifier import RuleClassifier
+
+        self.assertEqual(RuleClassifier().classify("画面テスト"), ("設計・デザイン", 0.5))
+
+    def test_ascii_keywords_only_match_whole_words(self):
+        from src.utils.local_classifier import RuleClassifier
+
+        classifier = RuleClassifier()
+
+        for task_name in ["Build pipeline", "quick sync with Bob", "Linux setup", "requirements review"]:
+            self.assertEqual(classifier.classify(task_name), (None, 0.0), task_name)
+        self.assertEqual(classifier.classify("UI改善"), ("設計・デザイン", 1.0))
+        self.assertEqual(classifier.classify("new ux flow"), ("設計・デザイン", 1.0))
+        self.assertEqual(classifier.classify("ui2 review"), (None, 0.0))
+
+    def test_custom_rules(self):
+        from src.utils.local_classifier import RuleClassifier
+
+        classifier = RuleClassifier({"ミーティング": ["会議", "MTG"], "空": []})
+
+        self.assertEqual(classifier.classify("週次mtg"), ("ミーティング", 1.0))
+        self.assertEqual(classifier.classify("a.b"), (None, 0.0))
+
+
+class TestNearestNeighbourClassifier(unittest.TestCase):
+    def test_untrained_model_has_no_opinion(self):
+        from src.utils.local_classifier import NearestNeighbourClassifier
+
+        self.assertEqual(NearestNeighbourClassifier().classify("定例会議"), (None, 0.0))
+
+    def test_similar_names_get_the_learned_category(self):
+        from src.utils.local_classifier import NearestNeighbourClassifier
+
+        model = NearestNeighbourClassifier()
+        model.learn({"週次定例会議": "ミーティング", "議事録作成": "ドキュメント作成"})
+
+        category, confidence = model.classify("定例会議")
+        self.assertEqual(category, "ミーティング")
+        self.assertGreater(confidence, 0.6)
+        self.assertEqual(model.classify("議事録の作成")[0], "ドキュメント作成")
+        self.assertEqual(model.classify("ランチ"), (None, 0.0))
+
+    def test_exact_match_is_full_confidence(self):
+        from src.utils.local_classifier import NearestNeighbourClassifier
+
+        model = NearestNeighbourClassifier()
+        model.learn({"顧客打ち合わせ": "ミーティング"})
+
+        self.assertAlmostEqual(model.classify("顧客打ち合わせ")[1], 1.0)
+
+
+class TestLocalClassifier(unittest.TestCase):
+    def test_classify_many_splits_confident_and_uncertain_names(self):
+        from src.utils.local_classifier import LocalClassifier, NearestNeighbourClassifier
+
+        classifier = LocalClassifier(model=NearestNeighbourClassifier())
+        classifier.learn({"週次定例会議": "ミーティング"})
+
+        confident, uncertain = classifier.classify_many(["API実装", "定例会議", "画面テスト", "ランチ"])
+
+        self.assertEqual(confident, {"API実装": "開発", "定例会議": "ミーティング"})
+        self.assertEqual(uncertain, ["画面テスト", "ランチ"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -281,6 +281,21 @@ class TestMainWindow(unittest.TestCase):
         item_text = window.task_list.get(0)
         self.assertRegex(item_text, r"\d{2}:\d{2}:\d{2}")
 
+    def test_task_list_tick_only_updates_running_row(self):
+        from src.gui.main_window import MainWindow
+
+        window = MainWindow(self.root)
+        for task_name in ["タスク1", "タスク2", "タスク3"]:
+            window.task_entry.insert(0, task_name)
+            window._on_start_clicked()
+
+        with patch.object(window, "_format_session_row", wraps=window._format_session_row) as mock_format:
+            window.task_list_view.render_row = mock_format
+            window._update_task_list()
+
+        self.assertEqual([call.args[0] for call in mock_format.call_args_list], [2])
+        self.assertEqual(window.task_list.size(), 3)
+
     def test_real_time_update_timer_starts(self):
         from src.gui.main_window import MainWindow
 
@@ -301,6 +316,36 @@ class TestMainWindow(unittest.TestCase):
         window._update_display()
         self.assertIsNone(window._timer_id)
 
+    def test_real_time_updates_suspend_while_minimized(self):
+        from src.gui.main_window import MainWindow
+        from unittest.mock import MagicMock
+
+        window = MainWindow(self.root)
+        window.task_entry.insert(0, "最小化テスト")
+        window._on_start_clicked()
+
+        window._on_root_unmap(MagicMock(widget=self.root))
+        self.assertIsNone(window._timer_id)
+
+        with patch.object(window, "_update_task_list") as mock_update:
+            window._on_root_map(MagicMock(widget=self.root))
+            mock_update.assert_called_once()
+        self.assertIsNotNone(window._timer_id)
+
+    def test_real_time_updates_stop_while_paused(self):
+        from src.gui.main_window import MainWindow
+
+        window = MainWindow(self.root)
+        window.task_entry.insert(0, "一時停止タイマーテスト")
+        window._on_start_clicked()
+        window._on_pause_clicked()
+
+        window._update_display()
+        self.assertIsNone(window._timer_id)
+
+        window._on_pause_clicked()
+        self.assertIsNotNone(window._timer_id)
+
     def test_stop_button_exists(self):
         from src.gui.main_window import MainWindow
 
@@ -451,6 +496,116 @@ class TestMainWindow(unittest.TestCase):
                 call_args = [call[1] for call in mock_config.call_args_list]
                 self.assertTrue(any('text' in kwargs and 'コピー失敗' in str(kwargs.get('text', '')) for kwargs in call_args))
 
+    def test_categorization_runs_off_the_tk_thread_and_cancels_on_back(self):
+        import threading
+        from src.gui.main_window import MainWindow
+
+        release = threading.Event()
+
+        def categorize(sessions):
+            release.wait(5)
+            return {"categories": []}
+
+        window = MainWindow(self.root, categorize=categorize)
+        window.task_entry.insert(0, "テストタスク")
+        window._on_start_clicked()
+        window._on_stop_clicked()
+
+        self.assertTrue(window.categorizer.is_busy)
+        self.assertTrue(window.category_view.is_loading)
+
+        window._on_back_clicked()
+        release.set()
+
+        self.assertFalse(window.categorizer.is_busy)
+        self.assertFalse(window.category_view.is_loading)
+        window.categorizer.shutdown()
+
+    def test_copy_feedback_is_shown_on_the_category_view_button(self):
+        from src.gui.main_window import MainWindow
+
+        window = MainWindow(self.root, categorize=lambda sessions, on_task_categorized=None: {"categories": []})
+        window.task_entry.insert(0, "コピーテスト")
+        window._on_start_clicked()
+        window._on_stop_clicked()
+
+        copy_button = window.category_view.copy_button
+        self.assertEqual(copy_button.winfo_manager(), "pack")
+        self.assertEqual(window.copy_button.winfo_manager(), "")
+        with patch.object(window.clipboard_manager, "copy_to_clipboard", return_value=True):
+            copy_button.invoke()
+
+        self.assertEqual(copy_button.cget("text"), "✓ コピー完了!")
+        window.categorizer.shutdown()
+
+    def test_history_view_is_opened_from_the_main_view(self):
+        from src.gui.main_window import MainWindow
+        from src.session_manager import SessionManager
+        from src.session_store import SessionStore
+
+        self.assertIsNone(MainWindow(self.root).history_button)
+
+        store = SessionStore()
+        window = MainWindow(self.root, session_manager=SessionManager(store=store))
+        window.history_button.invoke()
+
+        self.assertIsNotNone(window.history_view)
+        self.assertEqual(window.history_view.back_button.winfo_manager(), "pack")
+        self.assertEqual(window.task_list_view.frame.winfo_manager(), "")
+
+        window.history_view.back_button.invoke()
+        self.assertFalse(window._is_summary_view)
+        self.assertEqual(window.history_view.back_button.winfo_manager(), "")
+        self.assertEqual(window.task_list_view.frame.winfo_manager(), "pack")
+        store.close()
+
+    def test_task_entry_completes_known_task_names(self):
+        from types import SimpleNamespace
+        from src.gui.main_window import MainWindow
+
+        window = MainWindow(self.root)
+        window.session_manager.start_session("データベース設計")
+        window.session_manager.stop_current_session()
+
+        window.task_entry.insert(0, "データ")
+        window._on_task_entry_key(SimpleNamespace(char="タ"))
+
+        self.assertEqual(window.task_entry.get(), "データベース設計")
+        self.assertEqual(window.task_entry.selection_get(), "ベース設計")
+
+        window._on_task_entry_key(SimpleNamespace(char="\x08"))
+        self.assertEqual(window.task_entry.get(), "データベース設計")
+
+    def test_quick_switch_starts_the_chosen_task(self):
+        from types import SimpleNamespace
+        from src.gui.main_window import MainWindow
+
+        window = MainWindow(self.root)
+        window.session_manager.start_session("データベース設計")
+        window.session_manager.start_session("レビュー")
+
+        self.assertEqual(window._on_quick_switch_key(SimpleNamespace()), "break")
+        window.quick_switch.entry.insert(0, "デ設計")
+        window.quick_switch.refresh()
+        window.quick_switch.choose()
+
+        self.assertEqual(window.session_manager.current_session.task_name, "データベース設計")
+        self.assertEqual(len(window.session_manager.sessions), 3)
+        self.assertEqual(window.pause_button.cget("state"), "normal")
+
+    def test_closing_the_window_stops_the_live_session(self):
+        from src.gui.main_window import MainWindow
+
+        window = MainWindow(self.root)
+        session = window.session_manager.start_session("閉じる前")
+
+        window._on_close()
+        self.root = None
+
+        self.assertFalse(session.is_running)
+        self.assertIsNone(window.session_manager.current_session)
+        self.assertEqual(window.session_manager.get_total_time(), session.get_duration())
+
 
 if __name__ == "__main__":
     unittest.main()
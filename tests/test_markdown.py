@@ -129,6 +129,65 @@ class TestMarkdownExporter(unittest.TestCase):
         self.assertIn("日本語タスク名：データベース設計", markdown)
         self.assertIsInstance(markdown, str)
 
+    def test_write_sessions_streams_same_output(self):
+        import io
+        from src.utils.markdown import MarkdownExporter
+        from src.session import Session
+
+        sessions = []
+        for hour in range(9, 12):
+            session = Session(f"タスク{hour}")
+            session.start_time = datetime(2024, 1, 1, hour, 0, 0)
+            session.end_time = datetime(2024, 1, 1, hour, 45, 0)
+            session.is_running = False
+            sessions.append(session)
+
+        exporter = MarkdownExporter()
+        stream = io.StringIO()
+        with patch("src.utils.markdown.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 6, 20, 15, 30, 0)
+            exporter.write_sessions(iter(sessions), stream)
+            expected = exporter.export_sessions(sessions)
+
+        self.assertEqual(stream.getvalue(), expected)
+        self.assertIn("**セッション数:** 3", expected)
+
+    def test_iter_export_computes_each_duration_once(self):
+        from src.utils.markdown import MarkdownExporter
+        from src.session import Session
+
+        session = Session("タスク")
+        session.start_time = datetime(2024, 1, 1, 10, 0, 0)
+        session.end_time = datetime(2024, 1, 1, 11, 0, 0)
+        session.is_running = False
+
+        with patch.object(Session, "get_duration", return_value=3600.0) as mock_get_duration:
+            chunks = list(MarkdownExporter().iter_export_sessions([session, session]))
+
+        self.assertEqual(mock_get_duration.call_count, 2)
+        self.assertGreater(len(chunks), 2)
+        self.assertIn("02:00:00", chunks[-1])
+
+    def test_export_rollup_renders_a_month_report(self):
+        from datetime import date
+        from src.rollups import Rollups
+        from src.utils.markdown import MarkdownExporter
+
+        rollups = Rollups()
+        rollups.add("API実装", date(2024, 3, 1), 3600.0)
+        rollups.add("定例会議", date(2024, 3, 1), 1800.0)
+        rollups.add("API実装", date(2024, 3, 15), 1800.0)
+
+        markdown = MarkdownExporter().export_rollup(rollups, rollups.month(2024, 3), {"API実装": "開発"})
+
+        self.assertIn("# 作業時間集計 (2024-03)", markdown)
+        self.assertIn("| API実装 | 01:30:00 |", markdown)
+        self.assertIn("| 開発 | 01:30:00 |", markdown)
+        self.assertIn("| その他 | 00:30:00 |", markdown)
+        self.assertIn("| 2024-03-15 | 00:30:00 |", markdown)
+        self.assertIn("**セッション数:** 3", markdown)
+        self.assertIn("セッションがありません", MarkdownExporter().export_rollup(rollups, rollups.month(2024, 4)))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,54 @@
+import unittest
+
+
+class TestPrompt(unittest.TestCase):
+    def test_prompt_lists_unique_names_with_ids(self):
+        from src.api.prompt import build_categorization_prompt
+
+        prompt = build_categorization_prompt(["設計", "実装\tAPI"])
+
+        self.assertIn("1\t設計\n2\t実装 API", prompt)
+        self.assertIn("assignments", prompt)
+        self.assertNotIn("duration", prompt)
+
+    def test_parse_assignments_maps_ids_back_to_names(self):
+        from src.api.prompt import parse_category_assignments
+
+        result = {
+            "assignments": [
+                {"id": 2, "category": "開発"},
+                {"id": "1", "category": "設計・デザイン"},
+                {"id": 9, "category": "その他"},
+                {"id": 3, "category": ""},
+            ]
+        }
+
+        self.assertEqual(
+            parse_category_assignments(result, ["設計", "実装", "会議"]), {"設計": "設計・デザイン", "実装": "開発"}
+        )
+
+    def test_parse_assignments_rejects_wrong_structure(self):
+        from src.api.prompt import parse_category_assignments
+
+        with self.assertRaises(KeyError):
+            parse_category_assignments({"categories": []}, ["設計"])
+
+    def test_estimate_tokens(self):
+        from src.api.prompt import estimate_tokens
+
+        self.assertEqual(estimate_tokens("abcd"), 1)
+        self.assertEqual(estimate_tokens("設計abcde"), 4)
+
+    def test_chunks_respect_token_budget(self):
+        from src.api.prompt import chunk_task_names
+
+        names = [f"タスク{index}" for index in range(10)]
+        chunks = chunk_task_names(names, 12)
+
+        self.assertEqual([name for chunk in chunks for name in chunk], names)
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 2, 2, 2])
+        self.assertEqual(chunk_task_names(["とても長いタスク名" * 10], 12), [["とても長いタスク名" * 10]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import tkinter as tk
+from types import SimpleNamespace
+
+
+class TestQuickSwitchPalette(unittest.TestCase):
+    def setUp(self):
+        from src.task_registry import TaskRegistry
+
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.registry = TaskRegistry()
+        self.registry.register_all([("API実装", 3, 300.0), ("API設計", 1, 200.0), ("定例会議", 5, 100.0)])
+        self.selected = []
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def make_palette(self):
+        from src.gui.quick_switch import QuickSwitchPalette
+
+        return QuickSwitchPalette(self.root, self.registry.search, self.selected.append)
+
+    def test_typing_filters_and_enter_selects_the_top_match(self):
+        palette = self.make_palette()
+        palette.open()
+        self.assertEqual(palette.listbox.get(0, tk.END), ("定例会議", "API実装", "API設計"))
+
+        palette.entry.insert(0, "api")
+        palette._on_key_release(SimpleNamespace(keysym="i"))
+        self.assertEqual(palette.matches, ["API実装", "API設計"])
+
+        palette.move_selection(1)
+        palette.choose()
+        self.assertEqual(self.selected, ["API設計"])
+
+    def test_unmatched_text_starts_a_new_task(self):
+        palette = self.make_palette()
+        palette.open()
+        palette.entry.insert(0, "新しいタスク")
+        palette.refresh()
+
+        self.assertEqual(palette.matches, [])
+        palette.choose()
+        self.assertEqual(self.selected, ["新しいタスク"])
+
+    def test_selection_wraps_around(self):
+        palette = self.make_palette()
+        palette.open()
+
+        self.assertEqual(palette.move_selection(-1), "break")
+        self.assertEqual(palette.listbox.curselection(), (2,))
+        palette.move_selection(1)
+        self.assertEqual(palette.listbox.curselection(), (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+
+class TestReconciliation(unittest.TestCase):
+    def test_assignments_detect_missing_duplicated_and_hallucinated_ids(self):
+        from src.api.reconciliation import reconcile_assignments
+
+        assignments = [
+            {"id": 1, "category": "開発"},
+            {"id": 1, "category": "ミーティング"},
+            {"id": 7, "category": "その他"},
+            {"id": "x", "category": "その他"},
+            {"id": 3, "category": "ドキュメント作成"},
+        ]
+
+        reconciliation = reconcile_assignments(assignments, ["API実装", "定例会議", "議事録"])
+
+        self.assertEqual(reconciliation.task_categories, {"API実装": "開発", "議事録": "ドキュメント作成"})
+        self.assertEqual(reconciliation.duplicated, {"API実装": ["開発", "ミーティング"]})
+        self.assertEqual(reconciliation.hallucinated, [7, "x"])
+        self.assertEqual(reconciliation.missing, ["定例会議"])
+        self.assertFalse(reconciliation.is_complete)
+
+
+if __name__ == "__main__":
+    unittest.main()
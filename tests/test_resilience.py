@@ -0,0 +1,160 @@
+import unittest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FlakyModel:
+    def __init__(self, failures, latency=0.5, clock=None):
+        self.failures = failures
+        self.latency = latency
+        self.clock = clock
+        self.calls = []
+
+    def generate(self, timeout):
+        self.calls.append(timeout)
+        if self.clock:
+            self.clock.now += self.latency
+        if len(self.calls) <= self.failures:
+            raise ConnectionError("unavailable")
+        return "ok"
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_delay_is_jittered_exponential_backoff(self):
+        from src.api.resilience import RetryPolicy
+
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, random_source=lambda: 0.5)
+
+        self.assertEqual([policy.delay(attempt) for attempt in range(4)], [0.5, 1.0, 2.0, 2.5])
+
+    def test_should_retry_respects_attempts_and_error_types(self):
+        from src.api.resilience import RetryPolicy
+
+        policy = RetryPolicy(max_attempts=2, retry_on=(ConnectionError,))
+
+        self.assertTrue(policy.should_retry(ConnectionError(), 0))
+        self.assertFalse(policy.should_retry(ConnectionError(), 1))
+        self.assertFalse(policy.should_retry(ValueError(), 0))
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_bucket_refills_over_time(self):
+        from src.api.resilience import TokenBucket
+
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+        self.assertTrue(bucket.try_acquire())
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+        self.assertTrue(bucket.acquire(timeout=1.0))
+        self.assertEqual(clock.now, 0.5)
+        self.assertFalse(bucket.acquire(timeout=0.1))
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold_and_half_opens_after_timeout(self):
+        from src.api.resilience import CircuitBreaker
+
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "closed")
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+        self.assertFalse(breaker.allow())
+
+        clock.now += 10
+        self.assertEqual(breaker.state, "half_open")
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+
+        clock.now += 10
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+
+
+class TestResilientCaller(unittest.TestCase):
+    def make_caller(self, clock, **kwargs):
+        from src.api.resilience import CircuitBreaker, ResilientCaller, RetryPolicy
+
+        return ResilientCaller(
+            retry_policy=kwargs.pop("retry_policy", RetryPolicy(max_attempts=3, random_source=lambda: 1.0)),
+            circuit_breaker=kwargs.pop("circuit_breaker", CircuitBreaker(failure_threshold=10, clock=clock)),
+            clock=clock,
+            sleep=clock.sleep,
+            **kwargs,
+        )
+
+    def test_retries_until_success(self):
+        clock = FakeClock()
+        model = FlakyModel(failures=2, clock=clock)
+        caller = self.make_caller(clock, deadline=30.0)
+
+        self.assertEqual(caller.call(model.generate), "ok")
+        self.assertEqual(len(model.calls), 3)
+        self.assertEqual(model.calls[0], 30.0)
+        self.assertLess(model.calls[2], model.calls[1])
+
+        metrics = caller.metrics.snapshot()
+        self.assertEqual((metrics["calls"], metrics["failures"], metrics["retries"]), (1, 2, 2))
+        self.assertAlmostEqual(metrics["failure_rate"], 2 / 3)
+        self.assertAlmostEqual(metrics["latency_avg"], 0.5)
+
+    def test_gives_up_after_max_attempts(self):
+        clock = FakeClock()
+        model = FlakyModel(failures=5, clock=clock)
+        caller = self.make_caller(clock)
+
+        with self.assertRaises(ConnectionError):
+            caller.call(model.generate)
+        self.assertEqual(len(model.calls), 3)
+
+    def test_deadline_stops_retries(self):
+        clock = FakeClock()
+        model = FlakyModel(failures=5, latency=2.8, clock=clock)
+        caller = self.make_caller(clock, deadline=3.0)
+
+        with self.assertRaises(ConnectionError):
+            caller.call(model.generate)
+        self.assertEqual(len(model.calls), 1)
+
+    def test_open_circuit_rejects_calls(self):
+        from src.api.resilience import CircuitBreaker, CircuitOpenError
+
+        clock = FakeClock()
+        model = FlakyModel(failures=5, clock=clock)
+        caller = self.make_caller(clock, circuit_breaker=CircuitBreaker(failure_threshold=2, clock=clock))
+
+        with self.assertRaises(CircuitOpenError):
+            caller.call(model.generate)
+        with self.assertRaises(CircuitOpenError):
+            caller.call(model.generate)
+
+        self.assertEqual(len(model.calls), 2)
+        self.assertEqual(caller.metrics.rejected, 2)
+
+    def test_rate_limiter_is_consulted(self):
+        from src.api.resilience import DeadlineExceededError, TokenBucket
+
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0.1, capacity=1, clock=clock, sleep=clock.sleep)
+        caller = self.make_caller(clock, rate_limiter=bucket, deadline=5.0)
+
+        self.assertEqual(caller.call(FlakyModel(failures=0).generate), "ok")
+        with self.assertRaises(DeadlineExceededError):
+            caller.call(FlakyModel(failures=0).generate)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from datetime import date, datetime
+
+from tests.helpers import make_session
+
+
+class TestRollups(unittest.TestCase):
+    def test_sessions_roll_up_into_day_iso_week_and_month(self):
+        from src.rollups import Rollups
+
+        rollups = Rollups()
+        rollups.add_session(make_session("設計", datetime(2024, 2, 28, 9), minutes=60))
+        rollups.add_session(make_session("実装", datetime(2024, 3, 1, 9), minutes=30))
+        rollups.add_session(make_session("設計", datetime(2024, 3, 4, 9), minutes=90))
+
+        self.assertEqual(rollups.day(date(2024, 3, 1)).task_totals, {"実装": 1800.0})
+        week = rollups.week(date(2024, 3, 1))
+        self.assertEqual(week.label, "2024-W09")
+        self.assertEqual(week.task_totals, {"設計": 3600.0, "実装": 1800.0})
+        march = rollups.month(2024, 3)
+        self.assertEqual(march.label, "2024-03")
+        self.assertEqual(march.session_count, 2)
+        self.assertEqual(march.total_duration, 7200.0)
+        self.assertEqual([day.label for day in rollups.days_in(march)], ["2024-03-01", "2024-03-04"])
+
+    def test_sessions_past_midnight_are_split_between_days(self):
+        from src.rollups import Rollups
+        from src.session_manager import SessionManager
+        from src.session_store import SessionStore
+
+        session = make_session("設計", datetime(2024, 3, 1, 23), minutes=120)
+        rollups = Rollups()
+        rollups.add_session(session)
+        store = SessionStore()
+        store.save_session(session)
+        manager = SessionManager(store=store)
+
+        for built in (rollups, manager.rollups):
+            self.assertEqual(built.day(date(2024, 3, 1)).task_totals, {"設計": 3600.0})
+            self.assertEqual(built.day(date(2024, 3, 2)).task_totals, {"設計": 3600.0})
+            self.assertEqual(built.month(2024, 3).session_count, 1)
+            self.assertEqual(built.month(2024, 3).total_duration, 7200.0)
+        self.assertEqual(session.get_duration_between(datetime(2024, 3, 2), datetime(2024, 3, 3)), 3600.0)
+        store.close()
+
+    def test_running_sessions_are_not_rolled_up(self):
+        from src.rollups import Rollups
+        from src.session import Session
+
+        rollups = Rollups()
+        running = Session("実装")
+        running.start()
+        rollups.add_session(running)
+
+        self.assertEqual(len(rollups), 0)
+        self.assertEqual(rollups.day(date.today()).session_count, 0)
+
+    def test_category_totals_follow_the_current_mapping(self):
+        from src.rollups import Rollups
+
+        rollups = Rollups()
+        rollups.add("API実装", date(2024, 3, 1), 3600.0)
+        rollups.add("定例会議", date(2024, 3, 1), 1800.0)
+        rollups.add("雑務", date(2024, 3, 2), 600.0)
+        march = rollups.month(2024, 3)
+
+        self.assertEqual(
+            march.totals_by_category({"API実装": "開発", "定例会議": "ミーティング"}),
+            {"開発": 3600.0, "ミーティング": 1800.0, "その他": 600.0},
+        )
+        self.assertEqual(
+            march.totals_by_category({"API実装": "開発", "定例会議": "開発"}), {"開発": 5400.0, "その他": 600.0}
+        )
+
+    def test_manager_rebuilds_from_the_store_and_then_updates_incrementally(self):
+        from src.session_manager import SessionManager
+        from src.session_store import SessionStore
+
+        store = SessionStore()
+        store.save_session(make_session("設計", datetime(2023, 5, 1, 9), minutes=60))
+        store.save_session(make_session("設計", datetime(2023, 5, 1, 13), minutes=30))
+        store.save_session(make_session("実装", datetime(2023, 5, 2, 9), minutes=30))
+        manager = SessionManager(store=store)
+
+        may = manager.rollups.month(2023, 5)
+        self.assertEqual(may.task_totals, {"設計": 5400.0, "実装": 1800.0})
+        self.assertEqual(may.session_count, 3)
+
+        manager.start_session("レビュー")
+        manager.stop_current_session()
+        today = manager.rollups.day(date.today())
+        self.assertEqual(today.session_count, 1)
+        self.assertIn("レビュー", today.task_totals)
+
+        manager.rebuild_rollups()
+        self.assertEqual(manager.rollups.day(date.today()).session_count, 1)
+        self.assertEqual(manager.rollups.month(2023, 5).session_count, 3)
+        store.close()
+
+    def test_manager_without_store_rolls_up_its_own_sessions(self):
+        from src.session_manager import SessionManager
+
+        manager = SessionManager()
+        manager.start_session("設計")
+        manager.start_session("実装")
+        manager.stop_current_session()
+
+        self.assertEqual(manager.rollups.day(date.today()).session_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -83,7 +83,7 @@ class TestSession(unittest.TestCase):
         from src.session import Session
 
         session = Session("テストタスク")
-        with patch.object(session, "get_duration", return_value=3661.5):
+        with patch.object(Session, "get_duration", return_value=3661.5):
             formatted = session.format_duration()
             self.assertEqual(formatted, "01:01:01")
 
@@ -178,6 +178,122 @@ class TestSession(unittest.TestCase):
         self.assertFalse(session.is_paused)
         self.assertIsNotNone(session.end_time)
 
+    def test_session_uses_slots(self):
+        from src.session import Session
+
+        session = Session("テストタスク")
+        self.assertFalse(hasattr(session, "__dict__"))
+
+    def test_duration_ignores_wall_clock_changes(self):
+        from src.session import Session
+
+        session = Session("テストタスク")
+        with patch("src.session.time.monotonic_ns", return_value=1_000_000_000):
+            session.start()
+        with patch("src.session.time.time_ns", return_value=0):
+            with patch("src.session.time.monotonic_ns", return_value=6_500_000_000):
+                self.assertAlmostEqual(session.get_duration(), 5.5)
+                session.stop()
+
+        self.assertAlmostEqual(session.get_duration(), 5.5)
+        self.assertEqual(session.end_wall_ns, 0)
+
+    def test_timestamps_follow_the_wall_clock_across_a_suspend(self):
+        from src.session import Session
+
+        start_ns = 1_700_000_000 * 1_000_000_000
+        hour_ns = 3600 * 1_000_000_000
+        session = Session("テストタスク")
+        with patch("src.session.time.time_ns", return_value=start_ns):
+            with patch("src.session.time.monotonic_ns", return_value=0):
+                session.start()
+        # The monotonic clock stands still while the machine sleeps for an hour.
+        with patch("src.session.time.time_ns", return_value=start_ns + hour_ns + 60_000_000_000):
+            with patch("src.session.time.monotonic_ns", return_value=60_000_000_000):
+                session.pause()
+        with patch("src.session.time.time_ns", return_value=start_ns + hour_ns + 120_000_000_000):
+            with patch("src.session.time.monotonic_ns", return_value=120_000_000_000):
+                session.resume()
+                session.stop()
+
+        self.assertEqual(session.end_wall_ns, start_ns + hour_ns + 120_000_000_000)
+        self.assertEqual(session.pause_marks_wall_ns, [start_ns + hour_ns + 60_000_000_000, session.end_wall_ns])
+        self.assertEqual(session.end_time, datetime.fromtimestamp(1_700_000_000 + 3720))
+        self.assertAlmostEqual(session.get_duration(), 60.0)
+
+    def test_get_duration_does_not_allocate_datetimes(self):
+        from src.session import Session
+
+        session = Session("テストタスク")
+        session.start()
+        session.pause()
+
+        with patch("src.session.datetime") as mock_datetime:
+            session.get_duration()
+            mock_datetime.now.assert_not_called()
+            mock_datetime.fromtimestamp.assert_not_called()
+
+    def test_wall_clock_fields_round_trip(self):
+        from src.session import Session
+
+        session = Session("テストタスク")
+        session.start_time = datetime(2024, 1, 1, 10, 0, 0, 123456)
+        session.end_time = datetime(2024, 1, 1, 11, 30, 0)
+        session.total_pause_duration = 600.0
+
+        self.assertEqual(session.start_time, datetime(2024, 1, 1, 10, 0, 0, 123456))
+        self.assertEqual(session.end_time, datetime(2024, 1, 1, 11, 30, 0))
+        self.assertAlmostEqual(session.get_duration(), 5400.0 - 600.0 - 0.123456)
+
+    def test_from_record_restores_paused_session(self):
+        from src.session import Session
+
+        start_ns = 1_700_000_000 * 1_000_000_000
+        session = Session.from_record(
+            "テストタスク", start_ns, pause_ns=2_000_000_000, paused_at_wall_ns=start_ns + 10**10
+        )
+
+        self.assertTrue(session.is_running)
+        self.assertTrue(session.is_paused)
+        self.assertAlmostEqual(session.get_duration(), 8.0)
+        self.assertEqual(session.pause_time, datetime.fromtimestamp(1_700_000_010))
+
+    def test_active_intervals_follow_pause_marks(self):
+        from src.session import Session
+
+        def wall_ns(hour, minute=0):
+            return int(datetime(2024, 1, 1, hour, minute).timestamp()) * 1_000_000_000
+
+        session = Session.from_record(
+            "テストタスク", wall_ns(9), wall_ns(12), 3600 * 1_000_000_000, pause_marks=[wall_ns(10), wall_ns(11)]
+        )
+
+        self.assertEqual(
+            session.get_active_intervals(),
+            [(datetime(2024, 1, 1, 9), datetime(2024, 1, 1, 10)), (datetime(2024, 1, 1, 11), datetime(2024, 1, 1, 12))],
+        )
+        self.assertEqual(session.pause_marks_wall_ns, [wall_ns(10), wall_ns(11)])
+        self.assertAlmostEqual(
+            session.get_duration_between(datetime(2024, 1, 1, 9, 30), datetime(2024, 1, 1, 11, 15)), 2700.0
+        )
+
+    def test_resume_records_pause_marks(self):
+        from src.session import Session
+
+        session = Session("テストタスク")
+        session.start()
+        session.pause()
+        time.sleep(0.01)
+        session.resume()
+        session.stop()
+
+        intervals = session.get_active_intervals_ns()
+        self.assertEqual(len(session.pause_marks_wall_ns), 2)
+        self.assertEqual(len(intervals), 2)
+        self.assertAlmostEqual(
+            sum(end - start for start, end in intervals) / 1_000_000_000, session.get_duration(), delta=0.001
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 import time
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from unittest.mock import patch
 
 
@@ -150,6 +150,200 @@ class TestSessionManager(unittest.TestCase):
         self.assertEqual(len(manager.sessions), 0)
         self.assertIsNone(manager.current_session)
 
+    def test_task_and_day_totals(self):
+        from src.session_manager import SessionManager
+
+        manager = SessionManager()
+        manager.start_session("タスク1")
+        time.sleep(0.05)
+        manager.start_session("タスク2")
+        time.sleep(0.05)
+        manager.start_session("タスク1")
+        time.sleep(0.05)
+
+        task_totals = manager.get_task_totals()
+        self.assertEqual(set(task_totals), {"タスク1", "タスク2"})
+        self.assertGreaterEqual(task_totals["タスク1"], 0.1)
+        self.assertAlmostEqual(manager.get_task_total("タスク2"), manager.sessions[1].get_duration())
+        self.assertEqual(manager.get_task_total("未使用"), 0.0)
+
+        today = datetime.now().date()
+        self.assertAlmostEqual(manager.get_day_total(today), manager.get_total_time(), delta=0.01)
+        self.assertEqual(manager.get_day_total(datetime(2000, 1, 1).date()), 0.0)
+
+    def test_day_total_splits_sessions_at_midnight(self):
+        from src.session_manager import SessionManager
+
+        start_ns = int(datetime(2024, 3, 1, 23).timestamp()) * 1_000_000_000
+        manager = SessionManager()
+        with patch("src.session.time.time_ns", return_value=start_ns):
+            with patch("src.session.time.monotonic_ns", return_value=0):
+                manager.start_session("夜間作業")
+        with patch("src.session.time.time_ns", return_value=start_ns + 7200 * 1_000_000_000):
+            with patch("src.session.time.monotonic_ns", return_value=7200 * 1_000_000_000):
+                manager.stop_current_session()
+
+        self.assertEqual(manager.get_day_total(date(2024, 3, 1)), 3600.0)
+        self.assertEqual(
+            manager.get_daily_worked_time(date(2024, 3, 1), date(2024, 3, 2)),
+            {date(2024, 3, 1): 3600.0, date(2024, 3, 2): 3600.0},
+        )
+
+    def test_total_time_does_not_rescan_closed_sessions(self):
+        from src.session_manager import SessionManager
+        from src.session import Session
+
+        manager = SessionManager()
+        for i in range(100):
+            manager.start_session(f"タスク{i}")
+        manager.stop_current_session()
+        expected = sum(session.get_duration() for session in manager.sessions)
+
+        with patch.object(Session, "get_duration") as mock_get_duration:
+            total_time = manager.get_total_time()
+            manager.get_day_total(datetime.now().date())
+            mock_get_duration.assert_not_called()
+
+        self.assertAlmostEqual(total_time, expected)
+
+    def test_totals_restored_from_journal(self):
+        import tempfile
+        from pathlib import Path
+        from src.journal import SessionJournal
+        from src.session_manager import SessionManager
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            journal_path = Path(temp_dir) / "sessions.journal"
+            manager = SessionManager(journal=SessionJournal(journal_path))
+            manager.start_session("タスク1")
+            time.sleep(0.01)
+            manager.stop_all_sessions()
+            manager.close()
+
+            restored = SessionManager(journal=SessionJournal(journal_path))
+            restored.close()
+
+        self.assertAlmostEqual(restored.get_total_time(), manager.get_total_time(), delta=0.001)
+        self.assertAlmostEqual(restored.get_task_total("タスク1"), manager.get_task_total("タスク1"), delta=0.001)
+
+    def test_worked_time_between_uses_pause_intervals(self):
+        from src.session import Session
+        from src.session_manager import SessionManager
+
+        manager = SessionManager()
+        session = Session.from_record(
+            "タスク1",
+            int(datetime(2024, 1, 1, 9).timestamp()) * 1_000_000_000,
+            int(datetime(2024, 1, 1, 12).timestamp()) * 1_000_000_000,
+            3600 * 1_000_000_000,
+            pause_marks=[
+                int(datetime(2024, 1, 1, 10).timestamp()) * 1_000_000_000,
+                int(datetime(2024, 1, 1, 11).timestamp()) * 1_000_000_000,
+            ],
+        )
+        manager.sessions.append(session)
+        manager.interval_index.add_all(session.get_active_intervals_ns(), 0)
+
+        self.assertAlmostEqual(
+            manager.get_worked_time_between(datetime(2024, 1, 1, 9, 30), datetime(2024, 1, 1, 11, 30)), 3600.0
+        )
+        intervals = manager.get_intervals_between(datetime(2024, 1, 1, 10, 30), datetime(2024, 1, 1, 13))
+        self.assertEqual(intervals, [(session, datetime(2024, 1, 1, 11), datetime(2024, 1, 1, 12))])
+
+        daily = manager.get_daily_worked_time(date(2024, 1, 1), date(2024, 1, 2))
+        self.assertEqual(daily, {date(2024, 1, 1): 7200.0, date(2024, 1, 2): 0.0})
+
+    def test_stopped_sessions_are_indexed(self):
+        from src.session_manager import SessionManager
+
+        manager = SessionManager()
+        manager.start_session("タスク1")
+        time.sleep(0.01)
+        manager.stop_all_sessions()
+
+        session = manager.sessions[0]
+        worked = manager.get_worked_time_between(
+            session.start_time - timedelta(seconds=1), datetime.now() + timedelta(seconds=1)
+        )
+        self.assertEqual(len(manager.interval_index), 1)
+        self.assertAlmostEqual(worked, session.get_duration(), delta=0.001)
+
+    def test_task_name_variants_are_grouped_under_one_id(self):
+        from src.session_manager import SessionManager
+
+        manager = SessionManager()
+        first = manager.start_session("API実装")
+        second = manager.start_session("ＡＰＩ実装 ")
+        manager.stop_current_session()
+
+        self.assertEqual(first.task_id, second.task_id)
+        self.assertIs(second.task_name, first.task_name)
+        self.assertEqual(list(manager.get_task_totals()), ["API実装"])
+        self.assertEqual(manager.get_task_total("api実装"), manager.get_total_time())
+        self.assertEqual(manager.get_task_total("未登録"), 0.0)
+
+    def test_completion_includes_names_from_the_store(self):
+        from src.session import Session
+        from src.session_manager import SessionManager
+        from src.session_store import SessionStore
+
+        store = SessionStore()
+        for _ in range(3):
+            session = Session("定例会議")
+            session.start_time = datetime(2023, 5, 1, 9)
+            session.end_time = datetime(2023, 5, 1, 10)
+            store.save_session(session)
+        manager = SessionManager(store=store)
+        manager.start_session("定例準備")
+
+        self.assertEqual(manager.complete_task_name("定例"), ["定例準備", "定例会議"])
+        store.close()
+
+    def test_search_prefers_tasks_started_recently(self):
+        from src.session import Session
+        from src.session_manager import SessionManager
+        from src.session_store import SessionStore
+
+        store = SessionStore()
+        for task_name in ["定例会議", "定例会議", "定例準備"]:
+            session = Session(task_name)
+            session.start_time = datetime(2023, 5, 1, 9)
+            session.end_time = datetime(2023, 5, 1, 10)
+            store.save_session(session)
+        manager = SessionManager(store=store)
+
+        self.assertEqual(manager.search_tasks("定例"), ["定例会議", "定例準備"])
+        self.assertEqual(manager.search_tasks("てい"), [])
+
+        manager.start_session("定例準備")
+        self.assertEqual(manager.search_tasks("定例"), ["定例準備", "定例会議"])
+        self.assertEqual(manager.search_tasks("", limit=1), ["定例準備"])
+        store.close()
+
+    def test_stored_names_do_not_count_sessions_twice(self):
+        import tempfile
+        from pathlib import Path
+        from src.journal import SessionJournal
+        from src.session_manager import SessionManager
+        from src.session_store import SessionStore
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            journal_path = Path(temp_dir) / "sessions.journal"
+            store_path = Path(temp_dir) / "sessions.db"
+            manager = SessionManager(journal=SessionJournal(journal_path), store=SessionStore(store_path))
+            manager.start_session("定例会議")
+            manager.start_session("定例会議")
+            manager.stop_current_session()
+            manager.close()
+
+            manager = SessionManager(journal=SessionJournal(journal_path), store=SessionStore(store_path))
+            manager.start_session("定例会議")
+            manager.search_tasks("定例")
+            task_id = manager.task_registry.lookup("定例会議")
+
+            self.assertEqual(manager.task_registry.use_counts[task_id], 3)
+            manager.close()
+
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,188 @@
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from tests.helpers import make_session
+
+
+class TestSessionStore(unittest.TestCase):
+    def setUp(self):
+        from src.session_store import SessionStore
+
+        self.store = SessionStore()
+        self.store.save_session(make_session("設計", datetime(2024, 3, 1, 9), datetime(2024, 3, 1, 10), 600.0))
+        self.store.save_session(make_session("実装", datetime(2024, 3, 11, 9), datetime(2024, 3, 11, 11)))
+        self.store.save_session(make_session("設計", datetime(2024, 3, 12, 9), datetime(2024, 3, 12, 9, 30)))
+        self.store.save_session(make_session("設計", datetime(2024, 4, 1, 9), datetime(2024, 4, 1, 10)))
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_session_pages_continue_from_the_cursor(self):
+        sessions, cursor = self.store.get_session_page(datetime(2024, 3, 1), datetime(2024, 4, 1), limit=2)
+        self.assertEqual([session.task_name for session in sessions], ["設計", "実装"])
+        self.assertIsNotNone(cursor)
+
+        sessions, cursor = self.store.get_session_page(datetime(2024, 3, 1), datetime(2024, 4, 1), cursor, limit=2)
+        self.assertEqual([session.start_time for session in sessions], [datetime(2024, 3, 12, 9)])
+        self.assertIsNone(cursor)
+
+    def test_session_pages_keep_sessions_with_the_same_start_time(self):
+        self.store.save_session(make_session("レビュー", datetime(2024, 3, 11, 9), datetime(2024, 3, 11, 10)))
+
+        first_page, cursor = self.store.get_session_page(limit=2)
+        second_page, cursor = self.store.get_session_page(after=cursor, limit=2)
+        third_page, cursor = self.store.get_session_page(after=cursor, limit=2)
+
+        self.assertEqual(
+            [session.task_name for session in first_page + second_page + third_page],
+            ["設計", "実装", "レビュー", "設計", "設計"],
+        )
+
+    def test_uses_wal_and_indexes(self):
+        from src.session_store import SessionStore
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SessionStore(Path(temp_dir) / "sessions.db")
+            journal_mode = store.connection.execute("PRAGMA journal_mode").fetchone()[0]
+            indexes = {row[1] for row in store.connection.execute("PRAGMA index_list(sessions)")}
+            store.close()
+
+        self.assertEqual(journal_mode, "wal")
+        self.assertIn("idx_sessions_start_time", indexes)
+        self.assertIn("idx_sessions_task_name", indexes)
+
+    def test_range_query_uses_start_time_index(self):
+        plan = self.store.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM sessions WHERE start_time >= ? AND start_time < ?", (0.0, 1.0)
+        ).fetchall()
+        self.assertTrue(any("idx_sessions_start_time" in row[-1] for row in plan))
+
+    def test_pause_marks_round_trip(self):
+        from src.session import Session
+
+        def wall_ns(hour):
+            return int(datetime(2024, 5, 1, hour).timestamp()) * 1_000_000_000
+
+        self.store.save_session(
+            Session.from_record(
+                "会議", wall_ns(9), wall_ns(12), 3600 * 1_000_000_000, pause_marks=[wall_ns(10), wall_ns(11)]
+            )
+        )
+
+        (session,) = self.store.get_sessions(start=datetime(2024, 5, 1))
+        self.assertEqual(
+            session.get_active_intervals(),
+            [(datetime(2024, 5, 1, 9), datetime(2024, 5, 1, 10)), (datetime(2024, 5, 1, 11), datetime(2024, 5, 1, 12))],
+        )
+
+    def test_existing_database_is_migrated(self):
+        import sqlite3
+        from src.session_store import SessionStore
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "sessions.db"
+            connection = sqlite3.connect(path)
+            connection.execute(
+                "CREATE TABLE sessions (id INTEGER PRIMARY KEY, task_name TEXT NOT NULL, start_time REAL NOT NULL, "
+                "end_time REAL NOT NULL, pause_duration REAL NOT NULL DEFAULT 0)"
+            )
+            connection.execute("INSERT INTO sessions (task_name, start_time, end_time) VALUES ('設計', 0, 60)")
+            connection.commit()
+            connection.close()
+
+            store = SessionStore(path)
+            sessions = store.get_sessions()
+            store.close()
+
+        self.assertEqual(len(sessions), 1)
+        self.assertAlmostEqual(sessions[0].get_duration(), 60.0)
+
+    def test_save_requires_completed_session(self):
+        from src.session import Session
+
+        with self.assertRaises(ValueError):
+            self.store.save_session(Session("未開始"))
+
+    def test_get_sessions_in_week(self):
+        from src.utils.time_ranges import week_range
+
+        sessions = self.store.get_sessions(*week_range(datetime(2024, 3, 13).date()))
+
+        self.assertEqual([session.task_name for session in sessions], ["実装", "設計"])
+        self.assertFalse(sessions[0].is_running)
+        self.assertEqual(sessions[0].start_time, datetime(2024, 3, 11, 9))
+        self.assertAlmostEqual(sessions[0].get_duration(), 7200.0)
+
+    def test_iter_sessions_is_lazy(self):
+        import types
+
+        sessions = self.store.iter_sessions(task_name="設計")
+
+        self.assertIsInstance(sessions, types.GeneratorType)
+        self.assertEqual([session.start_time for session in sessions][0], datetime(2024, 3, 1, 9))
+
+    def test_total_time_for_task_in_month(self):
+        from src.utils.time_ranges import month_range
+
+        total = self.store.get_total_time(*month_range(2024, 3), task_name="設計")
+
+        self.assertAlmostEqual(total, 3000.0 + 1800.0)
+        self.assertEqual(self.store.count_sessions(*month_range(2024, 3), task_name="設計"), 2)
+
+    def test_total_time_without_filter(self):
+        self.assertAlmostEqual(self.store.get_total_time(), 3000.0 + 7200.0 + 1800.0 + 3600.0)
+
+
+class TestSessionManagerWithStore(unittest.TestCase):
+    def test_stopped_sessions_are_persisted(self):
+        from src.session_manager import SessionManager
+        from src.session_store import SessionStore
+
+        store = SessionStore()
+        manager = SessionManager(store=store)
+        manager.start_session("タスク1")
+        manager.start_session("タスク2")
+        manager.stop_all_sessions()
+
+        self.assertEqual(store.count_sessions(), 2)
+        self.assertEqual([session.task_name for session in store.get_sessions()], ["タスク1", "タスク2"])
+        manager.close()
+
+    def test_range_queries_include_live_session(self):
+        from src.session_manager import SessionManager
+        from src.session_store import SessionStore
+        from src.utils.time_ranges import day_range
+
+        store = SessionStore()
+        store.save_session(make_session("過去", datetime(2024, 1, 1, 9), datetime(2024, 1, 1, 10)))
+        manager = SessionManager(store=store)
+        manager.start_session("タスク1")
+        manager.start_session("タスク2")
+
+        today = day_range(datetime.now().date())
+        sessions = manager.get_all_sessions(*today)
+        completed = manager.get_completed_sessions(*today)
+
+        self.assertEqual([session.task_name for session in sessions], ["タスク1", "タスク2"])
+        self.assertEqual([session.task_name for session in completed], ["タスク1"])
+        self.assertGreaterEqual(manager.get_total_time(*today), 0.0)
+        self.assertAlmostEqual(manager.get_total_time(*day_range(datetime(2024, 1, 1).date())), 3600.0)
+        self.assertEqual(len(manager.get_all_sessions()), 2)
+        manager.close()
+
+    def test_range_queries_without_store_filter_in_memory(self):
+        from src.session_manager import SessionManager
+
+        manager = SessionManager()
+        manager.start_session("タスク1")
+        manager.start_session("タスク2")
+
+        self.assertEqual(len(manager.get_all_sessions(task_name="タスク1")), 1)
+        self.assertEqual(len(manager.get_completed_sessions(task_name="タスク2")), 0)
+        self.assertEqual(manager.get_total_time(end=datetime(2000, 1, 1)), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from datetime import date, datetime
+
+from tests.helpers import make_session
+
+
+class TestSessionTable(unittest.TestCase):
+    def setUp(self):
+        from src.session_table import SessionTable
+
+        self.table = SessionTable()
+        self.table.extend(
+            [
+                make_session("設計", datetime(2024, 1, 1, 9), datetime(2024, 1, 1, 10), 600.0),
+                make_session("実装", datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 12)),
+                make_session("設計", datetime(2024, 1, 2, 9), datetime(2024, 1, 2, 9, 30)),
+            ]
+        )
+
+    def test_columns_are_typed_arrays(self):
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.start_ns.typecode, "q")
+        self.assertEqual(self.table.pause_seconds.typecode, "d")
+        self.assertEqual(list(self.table.task_ids), [0, 1, 0])
+        self.assertEqual(self.table.task_names, ["設計", "実装"])
+
+    def test_running_session_cannot_be_frozen(self):
+        from src.session import Session
+
+        session = Session("実行中")
+        session.start()
+        with self.assertRaises(ValueError):
+            self.table.append(session)
+
+    def test_total_duration(self):
+        self.assertAlmostEqual(self.table.total_duration(), 3000.0 + 7200.0 + 1800.0)
+
+    def test_totals_by_task(self):
+        totals = self.table.totals_by_task()
+        self.assertAlmostEqual(totals["設計"], 4800.0)
+        self.assertAlmostEqual(totals["実装"], 7200.0)
+
+    def test_totals_by_day(self):
+        totals = self.table.totals_by_day()
+        self.assertEqual(sorted(totals), [date(2024, 1, 1), date(2024, 1, 2)])
+        self.assertAlmostEqual(totals[date(2024, 1, 1)], 10200.0)
+        self.assertAlmostEqual(totals[date(2024, 1, 2)], 1800.0)
+
+    def test_totals_by_category(self):
+        totals = self.table.totals_by_category({"実装": "開発", "設計": "設計・デザイン"})
+        self.assertAlmostEqual(totals["開発"], 7200.0)
+        self.assertAlmostEqual(totals["設計・デザイン"], 4800.0)
+
+        self.assertEqual(set(self.table.totals_by_category({})), {"その他"})
+
+    def test_session_manager_freezes_completed_sessions(self):
+        from src.session_manager import SessionManager
+
+        manager = SessionManager()
+        manager.start_session("タスク1")
+        manager.start_session("タスク2")
+
+        table = manager.freeze_completed_sessions()
+        self.assertEqual(len(table), 1)
+
+        manager.stop_all_sessions()
+        manager.freeze_completed_sessions()
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.task_names, ["タスク1", "タスク2"])
+        self.assertAlmostEqual(table.total_duration(), manager.get_total_time(), delta=0.001)
+
+    def test_markdown_export_from_table(self):
+        from src.utils.markdown import MarkdownExporter
+
+        markdown = MarkdownExporter().export_table(self.table)
+
+        self.assertIn("| 設計 | 01:20:00 |", markdown)
+        self.assertIn("| 2024-01-01 | 02:50:00 |", markdown)
+        self.assertIn("**合計時間:** 03:20:00", markdown)
+        self.assertIn("**セッション数:** 3", markdown)
+
+    def test_category_totals_from_table(self):
+        from src.utils.categorization import CategoryCalculator
+
+        result = CategoryCalculator().calculate_category_totals_from_table(self.table, {"実装": "開発"})
+
+        categories = {category["name"]: category for category in result["categories"]}
+        self.assertAlmostEqual(categories["開発"]["total_duration"], 7200.0)
+        self.assertEqual(categories["その他"]["tasks"], [{"name": "設計", "duration": 4800.0}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -142,6 +142,86 @@ class TestSummaryCategoryView(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_show_and_hide_reuse_one_scrollbar(self) -> None:
+        view = SummaryCategoryView(self.root, {"categories": []})
+        scrollbar = view.scrollbar
+        view.show()
+        view.hide()
+        view.show()
+
+        self.assertIs(view.scrollbar, scrollbar)
+        self.assertEqual(len([child for child in self.root.winfo_children() if child.winfo_class() == "TScrollbar"]), 1)
+        self.assertEqual(view.scrollbar.winfo_manager(), "pack")
+
+        view.hide()
+        self.assertEqual(view.scrollbar.winfo_manager(), "")
+
+    def test_progress_state_is_replaced_by_results(self) -> None:
+        view = SummaryCategoryView(self.root, {"categories": []})
+        view.show()
+        view.show_progress()
+
+        self.assertTrue(view.is_loading)
+        self.assertIn("分類中", view.status_label.cget("text"))
+
+        view.set_categorized_data(
+            {"categories": [{"name": "開発", "tasks": [{"name": "API実装", "duration": 60.0}], "total_duration": 60.0}]}
+        )
+
+        self.assertFalse(view.is_loading)
+        self.assertEqual(len(view.category_tree.get_children()), 1)
+        self.assertIn("00:01:00", view.total_label.cget("text"))
+
+    def test_new_progress_clears_the_previous_results(self) -> None:
+        view = SummaryCategoryView(self.root, {"categories": []})
+        view.show()
+        view.show_progress()
+        view.add_task("API実装", "開発", 60.0)
+        view.show_error("timeout")
+
+        view.show_progress()
+
+        self.assertEqual(view.category_tree.get_children(), ())
+        self.assertIn("00:00:00", view.total_label.cget("text"))
+
+        view.add_task("API実装", "開発", 60.0)
+        rows = view.category_tree.get_children()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(view.category_tree.item(rows[0], "values")[1], "1個")
+
+    def test_error_state(self) -> None:
+        view = SummaryCategoryView(self.root, {"categories": []})
+        view.show()
+        view.show_progress()
+        view.show_error("timeout")
+
+        self.assertFalse(view.is_loading)
+        self.assertIn("timeout", view.status_label.cget("text"))
+
+    def test_streamed_tasks_are_upserted_into_category_rows(self) -> None:
+        view = SummaryCategoryView(self.root, {"categories": []})
+        view.show()
+        view.show_progress()
+
+        view.add_task("API実装", "開発", 60.0)
+        view.add_task("UI実装", "開発", 120.0)
+        view.add_task("API実装", "開発", 60.0)
+        view.add_task("定例会議", "開発", 30.0)
+        view.add_task("定例会議", "ミーティング", 30.0)
+
+        rows = view.category_tree.get_children()
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(view.category_tree.item(rows[0], "values")[1], "2個")
+        self.assertEqual(view.category_tree.item(rows[0], "values")[2], "00:03:00")
+        self.assertEqual(view.category_tree.item(rows[1], "values")[0], "ミーティング")
+        self.assertIn("00:03:30", view.total_label.cget("text"))
+        self.assertTrue(view.is_loading)
+
+        view.set_categorized_data(
+            {"categories": [{"name": "開発", "tasks": [{"name": "API実装", "duration": 60.0}], "total_duration": 60.0}]}
+        )
+        self.assertEqual(len(view.category_tree.get_children()), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+
+class TestTaskRegistry(unittest.TestCase):
+    def test_variants_intern_to_the_first_spelling(self):
+        from src.task_registry import TaskRegistry
+
+        registry = TaskRegistry()
+        task_id = registry.intern("API実装")
+
+        self.assertEqual(registry.intern("ＡＰＩ実装"), task_id)
+        self.assertEqual(registry.intern("  api実装 "), task_id)
+        self.assertNotEqual(registry.intern("API設計"), task_id)
+        self.assertEqual(registry.name(task_id), "API実装")
+        self.assertEqual(registry.lookup("ａｐｉ実装"), task_id)
+        self.assertIsNone(registry.lookup("未登録"))
+        self.assertIn("API実装", registry)
+        self.assertEqual(len(registry), 2)
+
+    def test_interned_names_share_one_string(self):
+        from src.task_registry import TaskRegistry
+
+        registry = TaskRegistry()
+        first = registry.name(registry.intern("".join(["定例", "会議"])))
+        second = registry.name(registry.intern("".join(["定例", "会議"])))
+
+        self.assertIs(first, second)
+
+    def test_prefix_matches_rank_by_use_before_substring_matches(self):
+        from src.task_registry import TaskRegistry
+
+        registry = TaskRegistry()
+        registry.register_all([("API実装", 1, 0.0), ("API設計", 5, 0.0), ("UI実装", 3, 0.0), ("定例会議", 2, 0.0)])
+
+        self.assertEqual(registry.complete("api"), ["API設計", "API実装"])
+        self.assertEqual(registry.complete("実装"), ["UI実装", "API実装"])
+        self.assertEqual(registry.complete("ｉ実"), ["UI実装", "API実装"])
+        self.assertEqual(registry.complete("会"), ["定例会議"])
+        self.assertEqual(registry.complete("定"), ["定例会議"])
+        self.assertEqual(registry.complete("A", limit=1), ["API設計"])
+        self.assertEqual(registry.complete(""), [])
+
+    def test_search_ranks_tiers_then_frecency(self):
+        from src.task_registry import RECENCY_HALF_LIFE, TaskRegistry
+
+        now = 1_700_000_000.0
+        registry = TaskRegistry()
+        registry.register_all(
+            [
+                ("API設計", 8, now - 4 * RECENCY_HALF_LIFE),
+                ("API実装", 2, now - 60),
+                ("UI実装", 1, now - 60),
+                ("アプリ初期化", 1, now - 60),
+            ]
+        )
+
+        self.assertEqual(registry.search("api"), ["API実装", "API設計"])
+        self.assertEqual(registry.search("実装"), ["API実装", "UI実装"])
+        self.assertEqual(registry.search("ai"), ["API実装", "API設計"])
+        self.assertEqual(registry.search("アプ化"), ["アプリ初期化"])
+        self.assertEqual(registry.search("ap実", limit=1), ["API実装"])
+        self.assertEqual(registry.search("存在しない"), [])
+
+    def test_search_without_text_lists_tasks_by_frecency(self):
+        from src.task_registry import RECENCY_HALF_LIFE, TaskRegistry
+
+        now = 1_700_000_000.0
+        registry = TaskRegistry()
+        registry.register_all(
+            [("古い", 9, now - 4 * RECENCY_HALF_LIFE), ("新しい", 1, now), ("常連", 9, now - RECENCY_HALF_LIFE)]
+        )
+        registry.intern("未使用")
+
+        self.assertEqual(registry.search(""), ["常連", "新しい", "古い"])
+        self.assertEqual(registry.search(" ", limit=1), ["常連"])
+        self.assertEqual(registry.search("", limit=100), ["常連", "新しい", "古い"])
+
+        registry.record_use(registry.intern("古い"), used_at=now)
+        self.assertEqual(registry.search("", limit=1), ["古い"])
+
+
+if __name__ == "__main__":
+    unittest.main()
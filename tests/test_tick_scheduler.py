@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import MagicMock
+
+
+class TestTickScheduler(unittest.TestCase):
+    def test_next_delay_aligns_to_second_boundary(self):
+        from src.gui.tick_scheduler import TickScheduler
+
+        scheduler = TickScheduler(MagicMock(), MagicMock(), phase=lambda: 12.25)
+        self.assertEqual(scheduler.next_delay_ms(), 751)
+
+        scheduler.phase = lambda: 12.999
+        self.assertEqual(scheduler.next_delay_ms(), 2)
+
+    def test_schedule_replaces_pending_timer(self):
+        from src.gui.tick_scheduler import TickScheduler
+
+        root = MagicMock()
+        root.after.side_effect = ["after#1", "after#2"]
+        scheduler = TickScheduler(root, MagicMock(), phase=lambda: 0.5)
+
+        scheduler.schedule()
+        scheduler.schedule()
+
+        root.after_cancel.assert_called_once_with("after#1")
+        self.assertEqual(scheduler.timer_id, "after#2")
+
+    def test_timer_fires_callback(self):
+        from src.gui.tick_scheduler import TickScheduler
+
+        root = MagicMock()
+        callback = MagicMock()
+        scheduler = TickScheduler(root, callback, phase=lambda: 0.0)
+        scheduler.schedule()
+
+        fire = root.after.call_args[0][1]
+        fire()
+
+        callback.assert_called_once()
+        self.assertEqual(scheduler.tick_count, 1)
+        self.assertIsNone(scheduler.timer_id)
+
+    def test_suspend_and_resume_catches_up_once(self):
+        from src.gui.tick_scheduler import TickScheduler
+
+        root = MagicMock()
+        root.after.return_value = "after#1"
+        callback = MagicMock()
+        scheduler = TickScheduler(root, callback, phase=lambda: 0.0)
+        scheduler.schedule()
+
+        scheduler.suspend()
+        root.after_cancel.assert_called_once_with("after#1")
+        self.assertIsNone(scheduler.timer_id)
+
+        scheduler.schedule()
+        self.assertEqual(root.after.call_count, 1)
+
+        scheduler.resume()
+        scheduler.resume()
+        callback.assert_called_once()
+
+    def test_resume_without_missed_tick_does_not_redraw(self):
+        from src.gui.tick_scheduler import TickScheduler
+
+        callback = MagicMock()
+        scheduler = TickScheduler(MagicMock(), callback)
+        scheduler.suspend()
+        scheduler.resume()
+
+        callback.assert_not_called()
+
+    def test_cancel_clears_missed_tick(self):
+        from src.gui.tick_scheduler import TickScheduler
+
+        callback = MagicMock()
+        scheduler = TickScheduler(MagicMock(), callback)
+        scheduler.schedule()
+        scheduler.suspend()
+        scheduler.cancel()
+        scheduler.resume()
+
+        callback.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+from datetime import date, datetime
+
+
+class TestTimeRanges(unittest.TestCase):
+    def test_day_range(self):
+        from src.utils.time_ranges import day_range
+
+        start, end = day_range(date(2024, 3, 15))
+        self.assertEqual(start, datetime(2024, 3, 15))
+        self.assertEqual(end, datetime(2024, 3, 16))
+
+    def test_week_range_starts_on_monday(self):
+        from src.utils.time_ranges import week_range
+
+        start, end = week_range(date(2024, 3, 17))
+        self.assertEqual(start, datetime(2024, 3, 11))
+        self.assertEqual(end, datetime(2024, 3, 18))
+
+    def test_month_range_crosses_year(self):
+        from src.utils.time_ranges import month_range
+
+        self.assertEqual(month_range(2024, 3), (datetime(2024, 3, 1), datetime(2024, 4, 1)))
+        self.assertEqual(month_range(2024, 12), (datetime(2024, 12, 1), datetime(2025, 1, 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import tkinter as tk
+
+
+class TestVirtualListView(unittest.TestCase):
+    def setUp(self):
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.rows = [f"行{i}" for i in range(100)]
+        self.rendered = []
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def render_row(self, index):
+        self.rendered.append(index)
+        return self.rows[index]
+
+    def test_only_visible_rows_are_materialized(self):
+        from src.gui.virtual_list import VirtualListView
+
+        view = VirtualListView(self.root, self.render_row, height=5)
+        view.set_row_count(100)
+
+        self.assertEqual(view.listbox.size(), 5)
+        self.assertEqual(view.listbox.get(0), "行95")
+        self.assertEqual(sorted(self.rendered), [95, 96, 97, 98, 99])
+
+    def test_invalidate_only_touches_changed_visible_row(self):
+        from src.gui.virtual_list import VirtualListView
+
+        view = VirtualListView(self.root, self.render_row, height=5)
+        view.set_row_count(100)
+        self.rendered.clear()
+
+        self.rows[99] = "更新"
+        view.invalidate(99)
+        view.invalidate(10)
+
+        self.assertEqual(self.rendered, [99])
+        self.assertEqual(view.listbox.get(4), "更新")
+
+    def test_scrolling_moves_window(self):
+        from src.gui.virtual_list import VirtualListView
+
+        view = VirtualListView(self.root, self.render_row, height=5)
+        view.set_row_count(100)
+
+        view._on_scrollbar(tk.MOVETO, "0.0")
+        self.assertEqual(view.window(), (0, 5))
+        self.assertEqual(view.listbox.get(0), "行0")
+        self.assertFalse(view.follow_tail)
+
+        view._on_scrollbar(tk.SCROLL, "1", tk.PAGES)
+        self.assertEqual(view.listbox.get(0), "行5")
+
+        view.set_row_count(101)
+        self.assertEqual(view.listbox.get(0), "行5")
+
+    def test_reset_clears_rows(self):
+        from src.gui.virtual_list import VirtualListView
+
+        view = VirtualListView(self.root, self.render_row, height=5)
+        view.set_row_count(3)
+        view.reset()
+
+        self.assertEqual(view.listbox.size(), 0)
+        self.assertEqual(view.row_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()